@@ -24,6 +24,13 @@ RSI_INTERVALS = {
     "4h": "4h",  # 4시간
     "1d": "1d",  # 1일
 }
+# 이전 interval 포맷 -> RSI_INTERVALS 키
+LEGACY_RSI_INTERVALS = {
+    "minute15": "15m",
+    "minute60": "1h",
+    "minute240": "4h",
+    "day": "1d",
+}
 
 # API 엔드포인트
 COINMARKETCAP_API_URL = "https://pro-api.coinmarketcap.com/v1"
@@ -40,12 +47,219 @@ TAAPI_URL = "https://api.taapi.io"
 
 # WebSocket URLs
 UPBIT_WS_URL = "wss://api.upbit.com/websocket/v1"
-BINANCE_WS_URL = "wss://stream.binance.com:9443/ws/btcusdt@trade"
+# true로 설정하면 업비트 축약(SIMPLE) 포맷으로 수신 (필드명이 짧아 메시지 크기 감소)
+UPBIT_WS_SIMPLE_FORMAT = os.getenv("UPBIT_WS_SIMPLE_FORMAT", "true").lower() == "true"
+# 바이낸스 결합 스트림 (체결, 24시간 티커, ETH 미니 티커, 간격별 캔들)
+BINANCE_WS_STREAMS = [
+    "btcusdt@trade",
+    "btcusdt@ticker",
+    "ethusdt@miniTicker",
+    "btcusdt@kline_1m",
+    "btcusdt@kline_5m",
+    "btcusdt@kline_15m",
+    "btcusdt@kline_1h",
+    "btcusdt@kline_1d",
+]
+BINANCE_WS_URL = "wss://stream.binance.com:9443/stream?streams=" + "/".join(
+    BINANCE_WS_STREAMS
+)
+# 이중화 연결용 보조 엔드포인트 (동일 스트림, 다른 포트)
+BINANCE_WS_BACKUP_URL = "wss://stream.binance.com:443/stream?streams=" + "/".join(
+    BINANCE_WS_STREAMS
+)
+# 캔들 스트림 간격 -> 스냅샷 거래량 키
+BINANCE_KLINE_VOLUME_KEYS = {
+    "1m": "1m",
+    "5m": "5m",
+    "15m": "15m",
+    "1h": "1h",
+    "1d": "24h",
+}
+# true로 설정하면 바이낸스 체결 스트림을 두 연결로 동시에 수신하고 먼저 도착한 체결을 사용
+BINANCE_WS_HEDGED = os.getenv("BINANCE_WS_HEDGED", "false").lower() == "true"
 
 # WebSocket Constants
 DEFAULT_PING_INTERVAL = 30  # 30초마다 ping
-MAX_RECONNECT_ATTEMPTS = 5
-RECONNECT_DELAY = 5  # 5초 후 재접속
+MAX_RECONNECT_ATTEMPTS = 5  # 백오프 지수 상한 (최대 RECONNECT_DELAY * 2^5초)
+RECONNECT_DELAY = 1  # 재접속 기본 대기 (지수 백오프 + 지터 적용)
+
+# 업스트림 피드 상태 판정
+FEED_STALE_AFTER = 15  # 이 시간(초) 동안 메시지가 없으면 stale로 표시
+FEED_SILENCE_TIMEOUT = 30  # 이 시간(초) 동안 메시지가 없으면 강제 재접속
+# 이중화 연결 체결 중복 제거 범위 (최근 trade id 수). 이 범위를 벗어날 때까지 받지 못한 체결만 누락으로 집계
+TRADE_DEDUP_WINDOW = 2000
+# REST 가격 조회 시 스트림 스냅샷 사용 허용 범위 (초). 초과하면 거래소 REST로 조회
+PRICE_SNAPSHOT_MAX_AGE = 5
+
+# 스냅샷 기반 GET 응답의 Cache-Control max-age (초, 스냅샷 필드별 갱신 주기 기준)
+# 한 응답이 여러 필드를 사용하면 가장 짧은 값을 적용합니다.
+SNAPSHOT_CACHE_MAX_AGE = {
+    "krw": 1,
+    "usd": 1,
+    "timestamp_ms": 1,
+    "kimchi_premium": 1,
+    "change_24h": 1,
+    "rsi": 1,
+    "eth_btc_ratio": 1,
+    "ma_cross": 1,  # 현재가 기준 잠정 이동평균 포함
+    "dominance": 300,
+    # DB 지표는 1시간(공포/탐욕은 24시간) 주기지만 관리자 수정이 5분 안에 보이도록 제한
+    "mvrv": 300,
+    "nupl": 300,
+    "spor": 300,
+    "asol": 300,
+    "stablecoin_inflow_ratio": 300,
+    "fear_greed": 300,
+}
+
+# WebSocket 압축 프레임 설정
+# 클라이언트가 이 서브프로토콜을 요청하면 브로드캐스트 프레임을 raw DEFLATE로 압축해
+# 바이너리 프레임으로 전송합니다. (permessage-deflate, no_context_takeover 형식)
+WS_DEFLATE_SUBPROTOCOL = "bitnow.deflate"
+WS_DEFLATE_LEVEL = 6
+
+# 재접속 재개용 최근 브로드캐스트 프레임 수 (1초 주기 기준 약 5분)
+# SSE Last-Event-ID 재전송과 WebSocket resume 델타 계산에 공통으로 사용
+STREAM_REPLAY_SIZE = 300
+
+# Server-Sent Events (/sse/price)
+SSE_CLIENT_QUEUE_SIZE = 16  # 클라이언트별 미전송 프레임 수 (초과 시 오래된 프레임부터 버림)
+SSE_KEEPALIVE_INTERVAL = 15  # 전송할 프레임이 없을 때 keepalive 주석 전송 간격 (초)
+SSE_RETRY_MS = 3000  # 브라우저 EventSource 재접속 대기 (ms)
+# 토픽 -> 스냅샷 필드 (topics 파라미터로 필요한 필드만 구독)
+SSE_TOPICS = {
+    "prices": (
+        "krw",
+        "usd",
+        "timestamp_ms",
+        "kimchi_premium",
+        "change_24h",
+        "ticker_24h",
+    ),
+    "volume": ("volume",),
+    "rsi": ("rsi",),
+    "extremes": ("high_3w", "extremes"),
+    "ma_cross": ("ma_cross",),
+    "indicators": (
+        "dominance",
+        "mvrv",
+        "fear_greed",
+        "eth_btc_ratio",
+        "stablecoin_inflow_ratio",
+        "nupl",
+        "spor",
+        "asol",
+    ),
+    "feeds": ("feeds",),
+}
+
+# 수신 루프 -> 처리 단계 핸드오프 큐 크기 (가득 차면 가장 오래된 틱부터 버림)
+TICK_QUEUE_SIZE = 1024
+TICK_DROP_LOG_INTERVAL = 60  # 드롭 경고 로그 최소 간격 (초)
+
+# 체결 기반 캔들 저장소 (업비트 KRW-BTC, 바이낸스 BTCUSDT)
+CANDLE_SYMBOL_KRW = "KRW-BTC"
+CANDLE_SYMBOL_USD = "BTCUSDT"
+# 간격별 보관 캔들 수 (일봉은 52주 고가/저가 및 200일 이동평균 계산용)
+CANDLE_CAPACITY = {
+    "1m": 1440,
+    "5m": 576,
+    "15m": 384,
+    "1h": 336,
+    "4h": 360,
+    "1d": 1000,
+}
+# 시작/재접속 시 REST 백필 캔들 수 (업비트는 요청당 최대 200개로 나눠 조회)
+CANDLE_BACKFILL = {
+    "1m": 200,
+    "5m": 200,
+    "15m": 200,
+    "1h": 200,
+    "4h": 200,
+    "1d": 400,
+}
+# ticker_24h 고가/저가 계산 기간 (1시간 봉 기준, 업비트 티커 고가/저가는 KST 당일 값)
+TICKER_24H_WINDOW_MS = 24 * 60 * 60 * 1000
+UPBIT_CANDLE_PAGE_SIZE = 200
+BINANCE_CANDLE_PAGE_SIZE = 1000
+# 캔들 페이지 조회 실패(429/5xx 등) 시 재시도 횟수와 기본 대기 (초, 지수 백오프 + 지터)
+CANDLE_PAGE_RETRIES = 3
+CANDLE_PAGE_RETRY_DELAY = 1
+# 기간별 최고가/최저가 조회 기간 (일, 당일 포함).
+# None은 사상 최고/최저: 시작 시 거래소의 전체 일봉 이력을 페이지 단위로 조회해 초기화하고,
+# 이후에는 확정 일봉으로 바깥쪽으로만 갱신합니다 (메모리 캔들 보관 범위와 무관)
+EXTREME_LOOKBACK_DAYS = {
+    "1w": 7,
+    "3w": 21,
+    "52w": 364,
+    "ath": None,
+}
+
+# 멀티 워커 수집 리더 선출 / 스냅샷 채널
+INGEST_LOCK_PATH = os.getenv("INGEST_LOCK_PATH", "/tmp/bitnow-ingest.lock")
+INGEST_SOCKET_PATH = os.getenv("INGEST_SOCKET_PATH", "/tmp/bitnow-ingest.sock")
+INGEST_FOLLOWER_BUFFER_LIMIT = 1024 * 1024  # 팔로워별 최대 미전송 버퍼 (bytes)
+INGEST_CHANNEL_LINE_LIMIT = 4 * 1024 * 1024  # 스냅샷 1건 최대 크기 (bytes)
+INGEST_RETRY_DELAY = 1  # 리더 재선출/재접속 대기 (초)
+
+# 수집 리더 초기화 단계 타임아웃 (초, 단계는 동시 실행)
+STARTUP_STEP_TIMEOUT = 20
+STARTUP_STEP_TIMEOUTS = {
+    "candles_krw": 60,  # 업비트 캔들은 페이지 단위로 여러 번 조회
+    "candles_usd": 60,
+    "ath_krw": 60,  # 전체 일봉 이력 조회 (업비트 약 15페이지)
+    "ath_usd": 60,
+    "ma_cross": 60,  # LLM 시장 진단 포함
+}
+
+# 주기 작업 스케줄 (리더 전용, 초 단위)
+# interval 정각 배수 + offset 시각에 실행하고 0~jitter초 무작위 지연을 더합니다.
+# 시간 단위 작업은 offset을 달리해 외부 API 호출이 같은 순간에 몰리지 않게 분산합니다.
+SCHEDULED_JOBS = {
+    "rsi_alerts": {"interval": 60, "offset": 2},  # 1분봉 확정 직후
+    "dominance": {"interval": 60 * 60, "offset": 60, "jitter": 30},
+    "mvrv": {"interval": 60 * 60, "offset": 2 * 60, "jitter": 30},
+    "stablecoin_inflow_ratio": {"interval": 60 * 60, "offset": 3 * 60, "jitter": 30},
+    "nupl": {"interval": 60 * 60, "offset": 4 * 60, "jitter": 30},
+    "spor": {"interval": 60 * 60, "offset": 5 * 60, "jitter": 30},
+    "asol": {"interval": 60 * 60, "offset": 6 * 60, "jitter": 30},
+    # 공포/탐욕 지수는 UTC 00:00에 갱신되므로 10분 뒤 조회
+    "fear_greed": {"interval": 24 * 60 * 60, "offset": 10 * 60, "jitter": 60},
+    "exchange_rate_reset": {"interval": 24 * 60 * 60, "offset": 15 * 60 * 60},  # KST 00:00
+    "warm_start_save": {"interval": 60, "offset": 30},
+}
+SCHEDULER_JOB_TIMEOUT = 5 * 60  # 작업 1회 최대 실행 시간 (초)
+SCHEDULER_DURATION_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+# 리더가 기록하는 스케줄러 상태 파일 (팔로워 워커의 관리자 조회용)
+SCHEDULER_STATUS_PATH = os.getenv("SCHEDULER_STATUS_PATH", "/tmp/bitnow-scheduler.json")
+
+# 공유 메모리 가격 스냅샷
+SHM_SNAPSHOT_NAME = os.getenv("SHM_SNAPSHOT_NAME", "bitnow_snapshot")
+SHM_SNAPSHOT_CAPACITY = 256 * 1024  # 스냅샷 JSON 최대 크기 (bytes)
+
+# 초 단위 가격 이력 (공유 메모리 numpy 링 버퍼, /prices/history)
+SHM_PRICE_HISTORY_NAME = os.getenv("SHM_PRICE_HISTORY_NAME", "bitnow_price_history")
+PRICE_HISTORY_SECONDS = 24 * 60 * 60  # 보관 기간 (1초 1행 × 6열 float64, 약 4.1MB)
+PRICE_HISTORY_MAX_POINTS = 3600  # 한 번에 반환하는 최대 구간 수 (window / step)
+
+# 체결 테이프 (업비트/바이낸스 원본 체결을 일자별 mmap 세그먼트 파일에 기록, 선택 기능)
+TRADE_TAPE_ENABLED = os.getenv("TRADE_TAPE_ENABLED", "false").lower() == "true"
+TRADE_TAPE_DIR = os.getenv("TRADE_TAPE_DIR", "data/trade_tape")
+TRADE_TAPE_SEGMENT_RECORDS = 1 << 20  # 세그먼트 초기 용량 (레코드 40바이트, 부족하면 2배 확장)
+
+# 워밍 스타트 (리더가 스냅샷/캔들 버퍼를 주기적으로 저장하고 재시작 시 복원)
+WARM_START_PATH = os.getenv("WARM_START_PATH", "data/warm_start.npz")
+WARM_START_MAX_AGE = 24 * 60 * 60  # 이보다 오래된 저장 파일은 무시 (초)
+# 복원 값이 마지막 예정 갱신 이후 것이면 시작 시 다시 조회하지 않는 지표 (SCHEDULED_JOBS 이름과 동일)
+WARM_START_REFRESH_JOBS = (
+    "dominance",
+    "mvrv",
+    "fear_greed",
+    "stablecoin_inflow_ratio",
+    "nupl",
+    "spor",
+    "asol",
+)
 
 # FCM 설정
 FCM_SERVER_KEY = os.getenv("FCM_SERVER_KEY")
@@ -7,28 +7,40 @@ from app.routers import (
     prices,
     indicator_router,
     ws_router,
+    sse_router,
     auth_router,
     alerts_router,
     credit_router,
+    stream_router,
 )
 from app.services.stream_service import stream_service
-from app.services.push_service import push_service
-import asyncio
 import logging
 from app.database import engine
 from app.models import Base
 from contextlib import asynccontextmanager
 from app.constants import API_TITLE, API_DESCRIPTION, DEFAULT_API_VERSION
+from app.utils.serializer import FastJSONResponse
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    """
+    서버 시작/종료 (시작 작업은 여기서 한 번만 수행)
+    스트리밍 서비스는 백그라운드로 시작하여 지표 초기화를 기다리지 않고 바로 요청을 받습니다.
+    """
     # Startup
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    asyncio.create_task(stream_service.start())
+
+    # 초기 크레딧 생성
+    from app.migrations.create_initial_credits import create_initial_credits
+
+    await create_initial_credits()
+
+    stream_service.spawn(stream_service.start())
+    # push_service(Firebase)는 첫 푸시 전송 시 초기화 (firebase_admin import를 시작 시점에서 제외)
     yield
     # Shutdown
     await stream_service.stop()
@@ -39,6 +51,7 @@ app = FastAPI(
     description=API_DESCRIPTION,
     version=DEFAULT_API_VERSION,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     # OpenAPI에 보안 스키마 추가
     openapi_tags=[
         {"name": "auth", "description": "인증 관련 API"},
@@ -73,40 +86,16 @@ app.include_router(
     ws_router.router,
     tags=["websocket"],
 )
+app.include_router(
+    sse_router.router,
+    tags=["sse"],
+)
 app.include_router(
     alerts_router.router,
     tags=["alerts"],
 )
 app.include_router(credit_router.router)
-
-
-@app.on_event("startup")
-async def startup_event():
-    """서버 시작 시 WebSocket 스트리밍과 푸시 서비스 시작"""
-    asyncio.create_task(stream_service.start())
-    # push_service는 __init__에서 자동으로 초기화되지만,
-    # 초기화 상태를 확인하고 로그를 남깁니다.
-    if not push_service.initialized:
-        logger.error("Push service failed to initialize")
-    else:
-        logger.info("Push service initialized successfully")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """서버 종료 시 WebSocket 스트리밍 중지"""
-    await stream_service.stop()
-
-
-@app.on_event("startup")
-async def init_db():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    # 초기 크레딧 생성
-    from app.migrations.create_initial_credits import create_initial_credits
-
-    await create_initial_credits()
+app.include_router(stream_router.router)
 
 
 @app.exception_handler(RequestValidationError)
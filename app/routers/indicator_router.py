@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Query, Depends, HTTPException
+from fastapi import APIRouter, Query, Depends, HTTPException, Request, Response
+from datetime import date, datetime
 from typing import Optional, Dict, Any
-from ..services.indicator_service import IndicatorService
+from ..services.indicator_service import IndicatorService, rsi_signal
 from ..constants import (
     DEFAULT_RSI_LENGTH,
     DEFAULT_RSI_INTERVAL,
     DEFAULT_SYMBOL,
     RSI_INTERVALS,
+    LEGACY_RSI_INTERVALS,
 )
 import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,12 +19,52 @@ from app.services.stream_service import stream_service
 from app.utils.auth import get_current_user
 from app.models import User
 from app.services.exchange_service import exchange_service
+from app.utils import serializer
+from app.utils.http_cache import check_not_modified, json_response
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/indicator", tags=["indicators"])
 indicator_service = IndicatorService()
 
+# 스냅샷에 캐시되는 DB 지표 (스냅샷 필드 -> (IndicatorService 조회 메서드, 응답 키))
+SNAPSHOT_DB_INDICATORS = {
+    "mvrv": ("get_mvrv", "mvrv"),
+    "nupl": ("get_nupl", "nupl"),
+    "spor": ("get_spor", "spor"),
+    "asol": ("get_asol", "asol"),
+    "stablecoin_inflow_ratio": ("get_stablecoin_inflow_ratio", "ratio"),
+}
+
+
+# /indicator/snapshot에 포함되는 스냅샷 필드
+SNAPSHOT_INDICATOR_FIELDS = (
+    "rsi",
+    "fear_greed",
+    "dominance",
+    "mvrv",
+    "eth_btc_ratio",
+    "nupl",
+    "spor",
+    "asol",
+    "stablecoin_inflow_ratio",
+    "ma_cross",
+)
+
+# 직렬화된 /indicator/snapshot 응답 캐시 (ETag, 본문)
+_indicator_snapshot_cache = (None, b"")
+
+
+async def sync_indicator_snapshot(db: AsyncSession, *fields: str):
+    """
+    관리자 생성/삭제 후 DB 최신 값을 스냅샷에 반영합니다.
+    GET 응답의 ETag가 스냅샷 필드 버전 기반이므로 DB 변경은 반드시 스냅샷에도 반영되어야 합니다.
+    """
+    for field in fields:
+        method, key = SNAPSHOT_DB_INDICATORS[field]
+        data = await getattr(indicator_service, method)(db)
+        stream_service.update_snapshot(**{field: data[key]})
+
 
 # 환율 수동 설정을 위한 요청 모델
 class ExchangeRateUpdate(BaseModel):
@@ -72,21 +114,63 @@ class BulkIndicatorsUpdate(BaseModel):
     asol: Optional[float] = None
 
 
+def get_live_rsi(
+    symbol: str,
+    interval: str,
+    length: int,
+    snapshot: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """스트림 서비스가 증분 계산 중인 RSI 조회 (기본 심볼/기간만 해당, 없으면 None)"""
+    if symbol != DEFAULT_SYMBOL or length != DEFAULT_RSI_LENGTH:
+        return None
+    if snapshot is None:
+        snapshot = stream_service.get_snapshot()
+    interval = LEGACY_RSI_INTERVALS.get(interval, interval)
+    value = snapshot.get("rsi", {}).get(interval)
+    if not value:
+        return None
+    return {"rsi": value, "signal": rsi_signal(value)}
+
+
+def snapshot_field_timestamp(snapshot: Dict[str, Any], field: str) -> str:
+    """스냅샷 필드의 마지막 갱신 시각 (ISO 형식)"""
+    updated_ms = (snapshot.get("field_updated_ms") or {})[field]
+    return datetime.fromtimestamp(updated_ms / 1000).isoformat()
+
+
 @router.get("/rsi")
 async def get_rsi(
+    request: Request,
+    response: Response,
     symbol: str = Query(DEFAULT_SYMBOL, description="암호화폐 심볼 (예: BTC)"),
     interval: str = Query(
         DEFAULT_RSI_INTERVAL, description="캔들 간격 (15m, 1h, 4h, 1d, all)"
     ),
     length: int = Query(DEFAULT_RSI_LENGTH, description="RSI 기간"),
 ):
-    """RSI 값을 조회하는 엔드포인트"""
+    """
+    RSI 값을 조회하는 엔드포인트
+    기본 심볼/기간은 실시간 스트림의 증분 RSI를 사용하고(rsi 필드 버전 기반 ETag),
+    그 외에는 캔들을 조회해 계산합니다.
+    """
+    snapshot = stream_service.get_snapshot()
     if interval == "all":
+        live = {
+            key: get_live_rsi(symbol, key, length, snapshot) for key in RSI_INTERVALS
+        }
+        if all(live.values()):
+            not_modified = check_not_modified(request, response, snapshot, "rsi")
+            if not_modified is not None:
+                return not_modified
+            return json_response(live, response)
+
         # 모든 interval에 대해 RSI 계산
         result = {}
         for key in RSI_INTERVALS.keys():
             try:
-                rsi_data = await indicator_service.calculate_rsi(symbol, key, length)
+                rsi_data = live[key] or await indicator_service.calculate_rsi(
+                    symbol, key, length
+                )
                 result[key] = rsi_data
             except Exception as e:
                 print(f"Error calculating RSI for {key}: {str(e)}")
@@ -94,11 +178,90 @@ async def get_rsi(
         return result
     else:
         actual_interval = RSI_INTERVALS.get(interval, interval)
+        live = get_live_rsi(symbol, actual_interval, length, snapshot)
+        if live is not None:
+            not_modified = check_not_modified(request, response, snapshot, "rsi")
+            if not_modified is not None:
+                return not_modified
+            return json_response(live, response)
         return await indicator_service.calculate_rsi(symbol, actual_interval, length)
 
 
+def build_indicator_snapshot(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """스냅샷의 지표 필드를 값/갱신 시각(epoch ms) 쌍으로 변환"""
+    updated = snapshot.get("field_updated_ms") or {}
+    stale = set(snapshot.get("stale") or ())
+    indicators = {}
+    for field in SNAPSHOT_INDICATOR_FIELDS:
+        # 한 번도 로드되지 않은 필드는 기본값 대신 null
+        value = snapshot.get(field) if field in updated else None
+        if field == "rsi" and value:
+            value = {
+                interval: {"rsi": rsi, "signal": rsi_signal(rsi)} if rsi else None
+                for interval, rsi in value.items()
+            }
+        indicators[field] = {
+            "value": value,
+            "updated_ms": updated.get(field),
+            # 재시작 후 저장 파일에서 복원되어 아직 갱신되지 않은 값
+            "stale": field in stale,
+        }
+    return {"indicators": indicators}
+
+
+@router.get("/snapshot")
+async def get_indicator_snapshot(request: Request, response: Response):
+    """
+    모든 지표를 메모리 스냅샷에서 한 번에 조회합니다. (DB/외부 API 호출 없음)
+    직렬화 결과는 지표 필드 버전(ETag) 단위로 캐시되며, 아직 로드되지 않은 지표의 값은 null입니다.
+
+    Returns:
+        dict: {
+            "indicators": {
+                "rsi": {"value": {"15m": {"rsi": float, "signal": str}, ...}, "updated_ms": int, "stale": bool},
+                "fear_greed": {"value": {...}, "updated_ms": int, "stale": bool},
+                "dominance" / "mvrv" / "eth_btc_ratio" / "nupl" / "spor" / "asol"
+                / "stablecoin_inflow_ratio": {"value": float, "updated_ms": int, "stale": bool},
+                "ma_cross": {"value": {...}, "updated_ms": int, "stale": bool}
+            }
+        }
+    """
+    global _indicator_snapshot_cache
+
+    snapshot = stream_service.get_snapshot()
+    # 아직 로드되지 않은 지표는 ETag에서 제외 (로드되면 ETag가 바뀜)
+    loaded = [
+        field
+        for field in SNAPSHOT_INDICATOR_FIELDS
+        if field in (snapshot.get("field_versions") or {})
+    ]
+    if not loaded:
+        return Response(
+            content=serializer.dumps_bytes(build_indicator_snapshot(snapshot)),
+            media_type="application/json",
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    not_modified = check_not_modified(request, response, snapshot, *loaded)
+    if not_modified is not None:
+        return not_modified
+
+    etag = response.headers["etag"]
+    cached_etag, body = _indicator_snapshot_cache
+    if etag != cached_etag:
+        body = serializer.dumps_bytes(build_indicator_snapshot(snapshot))
+        _indicator_snapshot_cache = (etag, body)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": response.headers["cache-control"]},
+    )
+
+
 @router.get("/fear-greed")
 async def get_fear_greed_index(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_session),
 ) -> Dict[str, Any]:
     """
@@ -111,17 +274,46 @@ async def get_fear_greed_index(
             "timestamp": str  # 타임스탬프 (ISO 형식)
         }
     """
-    return await indicator_service.get_fear_greed_index(db)
+    # 날짜가 바뀌면 새 지수를 조회하도록 ETag에 날짜 포함
+    not_modified = check_not_modified(
+        request,
+        response,
+        stream_service.get_snapshot(),
+        "fear_greed",
+        extra=date.today().isoformat(),
+    )
+    if not_modified is not None:
+        return not_modified
+    return json_response(await indicator_service.get_fear_greed_index(db), response)
 
 
 @router.get("/dominance")
-async def get_btc_dominance():
-    """비트코인 도미넌스를 조회하는 엔드포인트"""
-    return await indicator_service.get_btc_dominance()
+async def get_btc_dominance(request: Request, response: Response):
+    """
+    비트코인 도미넌스를 조회하는 엔드포인트
+    스트림 서비스가 주기적으로 갱신한 스냅샷 값을 사용하며, 아직 로드되지 않았으면 직접 조회합니다.
+    """
+    snapshot = stream_service.get_snapshot()
+    not_modified = check_not_modified(request, response, snapshot, "dominance")
+    if not_modified is not None:
+        return not_modified
+    if "dominance" not in (snapshot.get("field_updated_ms") or {}):
+        return await indicator_service.get_btc_dominance()
+    return json_response(
+        {
+            "dominance": snapshot["dominance"],
+            "timestamp": snapshot_field_timestamp(snapshot, "dominance"),
+        },
+        response,
+    )
 
 
 @router.get("/mvrv")
-async def get_mvrv(db: AsyncSession = Depends(get_session)) -> Dict[str, Any]:
+async def get_mvrv(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_session),
+) -> Dict[str, Any]:
     """
     현재 MVRV 값을 조회합니다.
 
@@ -131,7 +323,12 @@ async def get_mvrv(db: AsyncSession = Depends(get_session)) -> Dict[str, Any]:
             "timestamp": str  # 타임스탬프 (ISO 형식)
         }
     """
-    return await indicator_service.get_mvrv(db)
+    not_modified = check_not_modified(
+        request, response, stream_service.get_snapshot(), "mvrv"
+    )
+    if not_modified is not None:
+        return not_modified
+    return json_response(await indicator_service.get_mvrv(db), response)
 
 
 @router.post("/mvrv")
@@ -153,7 +350,9 @@ async def create_mvrv(
         }
     """
     try:
-        return await indicator_service.create_mvrv(db, data.value)
+        result = await indicator_service.create_mvrv(db, data.value)
+        await sync_indicator_snapshot(db, "mvrv")
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -177,7 +376,9 @@ async def update_mvrv(
         }
     """
     try:
-        return await indicator_service.update_mvrv(db, data.value)
+        result = await indicator_service.update_mvrv(db, data.value)
+        await sync_indicator_snapshot(db, "mvrv")
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -196,7 +397,9 @@ async def delete_mvrv(
         }
     """
     try:
-        return await indicator_service.delete_latest_mvrv(db)
+        result = await indicator_service.delete_latest_mvrv(db)
+        await sync_indicator_snapshot(db, "mvrv")
+        return result
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -204,13 +407,19 @@ async def delete_mvrv(
 
 
 @router.get("/ma-cross", response_model=Dict[str, Any])
-async def get_ma_cross():
+async def get_ma_cross(request: Request, response: Response):
     """
     BTC/USDT의 20일, 60일, 120일, 200일 이동평균선 돌파 여부를 반환
+
+    ma_results[기간]:
+        ma_value / ema_value: 현재가를 오늘 종가로 포함한 SMA / EMA
+        confirmed_up / confirmed_down: 마지막 일봉 확정 시점 기준 2일 연속 ±2% 돌파 여부
+        provisional_up / provisional_down: (전일 종가, 현재가) 기준 잠정 돌파 여부
     """
     try:
         # 캐시된 MA 크로스 데이터 가져오기
-        ma_data = stream_service.current_prices.get("ma_cross")
+        snapshot = stream_service.get_snapshot()
+        ma_data = snapshot.get("ma_cross")
         if not ma_data:
             raise HTTPException(
                 status_code=503,
@@ -219,7 +428,10 @@ async def get_ma_cross():
                     "message": "이동평균선 데이터가 아직 준비되지 않았습니다",
                 },
             )
-        return ma_data
+        not_modified = check_not_modified(request, response, snapshot, "ma_cross")
+        if not_modified is not None:
+            return not_modified
+        return json_response(ma_data, response)
     except HTTPException:
         raise
     except Exception as e:
@@ -251,7 +463,7 @@ async def update_ma_analysis(
                 },
             )
 
-        ma_data = stream_service.current_prices.get("ma_cross")
+        ma_data = stream_service.snapshot.ma_cross
         if not ma_data:
             raise HTTPException(
                 status_code=404,
@@ -262,11 +474,12 @@ async def update_ma_analysis(
             )
 
         # 분석 결과 업데이트
-        ma_data["market_diagnosis"] = {
-            "trend": data.trend,
-            "description": data.description,
-        }
-        stream_service.current_prices["ma_cross"] = ma_data
+        stream_service.update_snapshot_item(
+            "ma_cross",
+            "market_diagnosis",
+            {"trend": data.trend, "description": data.description},
+        )
+        ma_data = stream_service.snapshot.ma_cross
 
         logger.info(f"MA analysis updated by admin: {current_user.email}")
         return ma_data
@@ -361,11 +574,13 @@ async def update_fear_greed_index(
         result = await indicator_service.update_fear_greed(db, data.value)
 
         # 스트림 서비스의 캐시 업데이트
-        stream_service.current_prices["fear_greed"] = {
-            "value": result["value"],
-            "classification": result["classification"],
-            "timestamp": result["timestamp"],
-        }
+        stream_service.update_snapshot(
+            fear_greed={
+                "value": result["value"],
+                "classification": result["classification"],
+                "timestamp": result["timestamp"],
+            }
+        )
 
         logger.info(f"Fear & Greed index updated by admin: {current_user.email}")
         return result
@@ -382,9 +597,10 @@ async def update_fear_greed_index(
 
 
 @router.get("/eth-btc-ratio", response_model=Dict[str, Any])
-async def get_eth_btc_ratio():
+async def get_eth_btc_ratio(request: Request, response: Response):
     """
     현재 ETH/BTC 비율을 조회합니다.
+    바이낸스 스트림으로 갱신되는 스냅샷 값을 사용하며, 아직 로드되지 않았으면 직접 조회합니다.
 
     Returns:
         dict: {
@@ -392,11 +608,25 @@ async def get_eth_btc_ratio():
             "timestamp": str  # 타임스탬프 (ISO 형식)
         }
     """
-    return await indicator_service.get_eth_btc_ratio()
+    snapshot = stream_service.get_snapshot()
+    not_modified = check_not_modified(request, response, snapshot, "eth_btc_ratio")
+    if not_modified is not None:
+        return not_modified
+    if "eth_btc_ratio" not in (snapshot.get("field_updated_ms") or {}):
+        return await indicator_service.get_eth_btc_ratio()
+    return json_response(
+        {
+            "ratio": snapshot["eth_btc_ratio"],
+            "timestamp": snapshot_field_timestamp(snapshot, "eth_btc_ratio"),
+        },
+        response,
+    )
 
 
 @router.get("/nupl", response_model=Dict[str, Any])
 async def get_nupl(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_session),
 ):
     """
@@ -408,7 +638,12 @@ async def get_nupl(
             "timestamp": str  # 타임스탬프 (ISO 형식)
         }
     """
-    return await indicator_service.get_nupl(db)
+    not_modified = check_not_modified(
+        request, response, stream_service.get_snapshot(), "nupl"
+    )
+    if not_modified is not None:
+        return not_modified
+    return json_response(await indicator_service.get_nupl(db), response)
 
 
 @router.post("/nupl", response_model=Dict[str, Any])
@@ -430,7 +665,9 @@ async def create_nupl(
         }
     """
     try:
-        return await indicator_service.create_nupl(db, data.value)
+        result = await indicator_service.create_nupl(db, data.value)
+        await sync_indicator_snapshot(db, "nupl")
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -464,7 +701,7 @@ async def update_nupl(
         result = await indicator_service.update_nupl(db, data.value)
 
         # 스트림 서비스의 캐시 업데이트
-        stream_service.current_prices["nupl"] = result["nupl"]
+        stream_service.update_snapshot(nupl=result["nupl"])
 
         logger.info(f"NUPL updated by admin: {current_user.email}")
         return result
@@ -502,6 +739,7 @@ async def delete_nupl(
     try:
         success = await indicator_service.delete_nupl(db)
         if success:
+            await sync_indicator_snapshot(db, "nupl")
             return {"success": True}
         else:
             raise HTTPException(
@@ -516,6 +754,8 @@ async def delete_nupl(
 
 @router.get("/spor", response_model=Dict[str, Any])
 async def get_spor(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_session),
 ):
     """
@@ -527,7 +767,12 @@ async def get_spor(
             "timestamp": str  # 타임스탬프 (ISO 형식)
         }
     """
-    return await indicator_service.get_spor(db)
+    not_modified = check_not_modified(
+        request, response, stream_service.get_snapshot(), "spor"
+    )
+    if not_modified is not None:
+        return not_modified
+    return json_response(await indicator_service.get_spor(db), response)
 
 
 @router.post("/spor", response_model=Dict[str, Any])
@@ -549,7 +794,9 @@ async def create_spor(
         }
     """
     try:
-        return await indicator_service.create_spor(db, data.value)
+        result = await indicator_service.create_spor(db, data.value)
+        await sync_indicator_snapshot(db, "spor")
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -583,7 +830,7 @@ async def update_spor(
         result = await indicator_service.update_spor(db, data.value)
 
         # 스트림 서비스의 캐시 업데이트
-        stream_service.current_prices["spor"] = result["spor"]
+        stream_service.update_snapshot(spor=result["spor"])
 
         logger.info(f"SPOR updated by admin: {current_user.email}")
         return result
@@ -621,6 +868,7 @@ async def delete_spor(
     try:
         success = await indicator_service.delete_spor(db)
         if success:
+            await sync_indicator_snapshot(db, "spor")
             return {"success": True}
         else:
             raise HTTPException(
@@ -635,6 +883,8 @@ async def delete_spor(
 
 @router.get("/stablecoin-inflow-ratio", response_model=Dict[str, Any])
 async def get_stablecoin_inflow_ratio(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_session),
 ) -> Dict[str, Any]:
     """
@@ -646,7 +896,14 @@ async def get_stablecoin_inflow_ratio(
             "timestamp": str  # 타임스탬프 (ISO 형식)
         }
     """
-    return await indicator_service.get_stablecoin_inflow_ratio(db)
+    not_modified = check_not_modified(
+        request, response, stream_service.get_snapshot(), "stablecoin_inflow_ratio"
+    )
+    if not_modified is not None:
+        return not_modified
+    return json_response(
+        await indicator_service.get_stablecoin_inflow_ratio(db), response
+    )
 
 
 @router.post("/stablecoin-inflow-ratio", response_model=Dict[str, Any])
@@ -668,7 +925,9 @@ async def create_stablecoin_inflow_ratio(
         }
     """
     try:
-        return await indicator_service.create_stablecoin_inflow_ratio(db, data.value)
+        result = await indicator_service.create_stablecoin_inflow_ratio(db, data.value)
+        await sync_indicator_snapshot(db, "stablecoin_inflow_ratio")
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -704,7 +963,7 @@ async def update_stablecoin_inflow_ratio(
         )
 
         # 스트림 서비스의 캐시 업데이트
-        stream_service.current_prices["stablecoin_inflow_ratio"] = result["ratio"]
+        stream_service.update_snapshot(stablecoin_inflow_ratio=result["ratio"])
 
         logger.info(
             f"Stablecoin Inflow Ratio updated by admin: {current_user.email}"
@@ -743,7 +1002,9 @@ async def delete_stablecoin_inflow_ratio(
         )
 
     try:
-        return await indicator_service.delete_latest_stablecoin_inflow_ratio(db)
+        result = await indicator_service.delete_latest_stablecoin_inflow_ratio(db)
+        await sync_indicator_snapshot(db, "stablecoin_inflow_ratio")
+        return result
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -752,6 +1013,8 @@ async def delete_stablecoin_inflow_ratio(
 
 @router.get("/asol", response_model=Dict[str, Any])
 async def get_asol(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_session),
 ):
     """
@@ -763,7 +1026,12 @@ async def get_asol(
             "timestamp": str  # 타임스탬프 (ISO 형식)
         }
     """
-    return await indicator_service.get_asol(db)
+    not_modified = check_not_modified(
+        request, response, stream_service.get_snapshot(), "asol"
+    )
+    if not_modified is not None:
+        return not_modified
+    return json_response(await indicator_service.get_asol(db), response)
 
 
 @router.post("/asol", response_model=Dict[str, Any])
@@ -785,7 +1053,9 @@ async def create_asol(
         }
     """
     try:
-        return await indicator_service.create_asol(db, data.value)
+        result = await indicator_service.create_asol(db, data.value)
+        await sync_indicator_snapshot(db, "asol")
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -819,7 +1089,7 @@ async def update_asol(
         result = await indicator_service.update_asol(db, data.value)
 
         # 스트림 서비스의 캐시 업데이트
-        stream_service.current_prices["asol"] = result["asol"]
+        stream_service.update_snapshot(asol=result["asol"])
 
         logger.info(f"ASOL updated by admin: {current_user.email}")
         return result
@@ -857,6 +1127,7 @@ async def delete_asol(
     try:
         success = await indicator_service.delete_asol(db)
         if success:
+            await sync_indicator_snapshot(db, "asol")
             return {"success": True}
         else:
             raise HTTPException(
@@ -943,6 +1214,15 @@ async def create_bulk_indicators(
             asol=data.asol,
         )
 
+        await sync_indicator_snapshot(
+            db,
+            *(
+                field
+                for field in SNAPSHOT_DB_INDICATORS
+                if getattr(data, field) is not None
+            ),
+        )
+
         logger.info(f"Bulk indicators created: {result}")
         return result
 
@@ -1,13 +1,43 @@
-from fastapi import APIRouter, HTTPException
+import time
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from app.constants import (
+    PRICE_SNAPSHOT_MAX_AGE,
+    PRICE_HISTORY_SECONDS,
+    PRICE_HISTORY_MAX_POINTS,
+)
 from app.services.price_service import get_current_prices, get_krw_price, get_usd_price
+from app.services.stream_service import stream_service
+from app.utils.http_cache import check_not_modified, json_response
+from app.utils.price_history import parse_duration
 
 router = APIRouter()
 
 
+def get_fresh_snapshot(*feeds: str) -> Optional[Dict[str, Any]]:
+    """
+    지정한 피드가 모두 PRICE_SNAPSHOT_MAX_AGE초 이내에 수신 중이면 스트림 스냅샷을 반환합니다.
+    하나라도 끊겼거나 오래됐으면 None (REST 조회로 대체)
+    """
+    snapshot = stream_service.get_snapshot()
+    statuses = snapshot.get("feeds") or {}
+    now_ms = int(time.time() * 1000)
+    for feed in feeds:
+        status = statuses.get(feed)
+        if not status or status["stale"] or status["last_message_ms"] is None:
+            return None
+        if now_ms - status["last_message_ms"] > PRICE_SNAPSHOT_MAX_AGE * 1000:
+            return None
+    return snapshot
+
+
 @router.get("/prices")
-async def get_prices():
+async def get_prices(request: Request, response: Response):
     """
     BTC의 현재 원화(KRW)와 달러(USD) 가격, 각각의 24시간 변동률, 김치 프리미엄을 조회합니다.
+    실시간 스트림 스냅샷으로 응답하며, 거래소 피드가 끊긴 경우에만 REST API로 조회합니다.
+    스냅샷 응답에는 ETag가 포함되며, If-None-Match가 일치하면 304로 응답합니다.
 
     Returns:
         dict: {
@@ -20,16 +50,41 @@ async def get_prices():
         }
     """
     try:
-        prices = await get_current_prices()
-        return prices
+        snapshot = get_fresh_snapshot("upbit", "binance")
+        if snapshot is None:
+            return await get_current_prices()
+        not_modified = check_not_modified(
+            request,
+            response,
+            snapshot,
+            "krw",
+            "usd",
+            "change_24h",
+            "kimchi_premium",
+            "timestamp_ms",
+        )
+        if not_modified is not None:
+            return not_modified
+        return json_response(
+            {
+                "btc_krw": snapshot["krw"],
+                "btc_usd": snapshot["usd"],
+                "krw_change_24h": snapshot["change_24h"]["krw"],
+                "usd_change_24h": snapshot["change_24h"]["usd"],
+                "kimchi_premium": snapshot["kimchi_premium"],
+                "timestamp": snapshot["timestamp_ms"] // 1000,
+            },
+            response,
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/prices/krw")
-async def get_krw_prices():
+async def get_krw_prices(request: Request, response: Response):
     """
     BTC의 현재 원화(KRW) 가격, 24시간 변동률, 김치 프리미엄을 조회합니다.
+    김치 프리미엄 계산에 바이낸스 가격도 필요하므로 두 피드가 모두 살아 있을 때만 스냅샷을 사용합니다.
 
     Returns:
         dict: {
@@ -40,14 +95,35 @@ async def get_krw_prices():
         }
     """
     try:
-        price = await get_krw_price()
-        return price
+        snapshot = get_fresh_snapshot("upbit", "binance")
+        if snapshot is None:
+            return await get_krw_price()
+        not_modified = check_not_modified(
+            request,
+            response,
+            snapshot,
+            "krw",
+            "change_24h",
+            "kimchi_premium",
+            "timestamp_ms",
+        )
+        if not_modified is not None:
+            return not_modified
+        return json_response(
+            {
+                "btc_krw": snapshot["krw"],
+                "percent_change_24h": snapshot["change_24h"]["krw"],
+                "kimchi_premium": snapshot["kimchi_premium"],
+                "timestamp": snapshot["timestamp_ms"] // 1000,
+            },
+            response,
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/prices/usd")
-async def get_usd_prices():
+async def get_usd_prices(request: Request, response: Response):
     """
     BTC의 현재 달러(USD) 가격과 24시간 변동률을 조회합니다.
 
@@ -59,7 +135,97 @@ async def get_usd_prices():
         }
     """
     try:
-        price = await get_usd_price()
-        return price
+        snapshot = get_fresh_snapshot("binance")
+        if snapshot is None:
+            return await get_usd_price()
+        not_modified = check_not_modified(
+            request, response, snapshot, "usd", "change_24h", "timestamp_ms"
+        )
+        if not_modified is not None:
+            return not_modified
+        return json_response(
+            {
+                "btc_usd": snapshot["usd"],
+                "percent_change_24h": snapshot["change_24h"]["usd"],
+                "timestamp": snapshot["timestamp_ms"] // 1000,
+            },
+            response,
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/prices/history")
+async def get_price_history(
+    response: Response,
+    window: str = Query("1h", description="조회 기간 (예: 30m, 1h, 24h)"),
+    step: str = Query("10s", description="다운샘플링 간격 (예: 1s, 10s, 1m)"),
+):
+    """
+    최근 가격 이력을 메모리 링 버퍼(최대 24시간, 1초 단위)에서 조회합니다. (업스트림 호출 없음)
+    step 간격마다 가격/김치 프리미엄은 구간의 마지막 값, 거래량은 구간 합계이며,
+    틱이 없던 구간은 생략됩니다.
+
+    Returns:
+        dict: {
+            "window": int,  # 조회 기간 (초)
+            "step": int,  # 간격 (초)
+            "time": [int],  # 구간 시작 시각 (epoch 초)
+            "krw": [float],  # 원화 가격
+            "usd": [float],  # 달러 가격
+            "kimchi_premium": [float],  # 김치 프리미엄 (%)
+            "volume_krw": [float],  # 업비트 체결량 (BTC)
+            "volume_usd": [float]  # 바이낸스 체결량 (BTC)
+        }
+    """
+    try:
+        window_s = parse_duration(window)
+        step_s = parse_duration(step)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": "INVALID_DURATION",
+                "message": "window/step은 10s, 5m, 1h, 1d 형식이어야 합니다",
+            },
+        )
+    if not 0 < step_s <= window_s <= PRICE_HISTORY_SECONDS:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": "INVALID_WINDOW",
+                "message": (
+                    "step은 window 이하, "
+                    f"window는 {PRICE_HISTORY_SECONDS}초 이하여야 합니다"
+                ),
+            },
+        )
+    if window_s // step_s > PRICE_HISTORY_MAX_POINTS:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": "TOO_MANY_POINTS",
+                "message": f"window/step은 {PRICE_HISTORY_MAX_POINTS} 이하여야 합니다",
+            },
+        )
+
+    history = stream_service.get_price_history()
+    if history is None:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "code": "PRICE_HISTORY_NOT_READY",
+                "message": "가격 이력이 아직 준비되지 않았습니다",
+            },
+        )
+
+    # 같은 구간 요청은 다음 구간이 시작될 때까지 캐시 가능
+    response.headers["Cache-Control"] = f"public, max-age={min(step_s, 60)}"
+    return json_response(
+        {
+            "window": window_s,
+            "step": step_s,
+            **history.query(int(time.time()), window_s, step_s),
+        },
+        response,
+    )
@@ -0,0 +1,86 @@
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from app.services.stream_service import stream_service
+from app.constants import SSE_TOPICS, SSE_KEEPALIVE_INTERVAL, SSE_RETRY_MS
+import asyncio
+import logging
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@router.get("/sse/price")
+async def sse_endpoint(
+    request: Request,
+    topics: Optional[str] = Query(
+        None,
+        description=f"구독할 토픽 (쉼표 구분, 미지정 시 전체): {', '.join(SSE_TOPICS)}",
+    ),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    /ws/price와 같은 스냅샷을 Server-Sent Events로 스트리밍합니다.
+
+    - 이벤트 ID는 "epoch-version" 형식이며, 재접속 시 Last-Event-ID 헤더를 보내면
+      최근 프레임 버퍼에서 놓친 이벤트를 이어서 받습니다.
+    - topics를 지정하면 해당 필드(+ timestamp, epoch, version)만 포함하고,
+      구독 필드에 변경이 없는 틱은 전송하지 않습니다.
+    """
+    fields = None
+    if topics:
+        names = [name.strip() for name in topics.split(",") if name.strip()]
+        unknown = [name for name in names if name not in SSE_TOPICS]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "code": "INVALID_TOPIC",
+                    "message": f"지원하지 않는 토픽입니다: {', '.join(unknown)}",
+                },
+            )
+        fields = tuple(
+            dict.fromkeys(field for name in names for field in SSE_TOPICS[name])
+        )
+
+    queue, initial, resumed_from = stream_service.add_sse_client(fields, last_event_id)
+
+    async def event_stream():
+        # 재개 시에는 클라이언트가 마지막으로 받은 프레임 기준으로 변경 여부 판단
+        last_marker = resumed_from.sse(fields)[0] if resumed_from else None
+        try:
+            yield f"retry: {SSE_RETRY_MS}\n\n".encode()
+            for frame in initial:
+                marker, event = frame.sse(fields)
+                if marker == last_marker:
+                    continue
+                last_marker = marker
+                yield event
+
+            while True:
+                try:
+                    frame = await asyncio.wait_for(
+                        queue.get(), timeout=SSE_KEEPALIVE_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield b": keepalive\n\n"
+                    continue
+                if frame is None:  # 서비스 종료
+                    break
+                marker, event = frame.sse(fields)
+                if marker == last_marker:
+                    continue
+                last_marker = marker
+                yield event
+        except Exception as e:
+            logger.error(f"SSE stream error: {str(e)}")
+        finally:
+            stream_service.remove_sse_client(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
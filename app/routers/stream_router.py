@@ -0,0 +1,120 @@
+from fastapi import APIRouter, Depends, HTTPException
+from typing import Dict, Any
+from app.services.stream_service import stream_service
+from app.utils.auth import get_current_user
+from app.models import User
+
+router = APIRouter(prefix="/stream", tags=["stream"])
+
+
+@router.get("/metrics", response_model=Dict[str, Any])
+async def get_stream_metrics(current_user: User = Depends(get_current_user)):
+    """
+    실시간 스트림 처리 상태를 조회합니다. (관리자 전용)
+
+    Returns:
+        dict: {
+            "role": str,  # 수집 역할 (leader: 업스트림 수집, follower: 리더 스냅샷 구독)
+            "feeds": {  # 업스트림 피드별 상태 (upbit, binance)
+                "upbit": {
+                    "connected": bool,  # 연결 여부
+                    "stale": bool,  # FEED_STALE_AFTER초 이상 수신 없음
+                    "age_ms": int,  # 마지막 메시지 이후 경과 시간
+                    "last_message_ms": int,  # 마지막 메시지 수신 시각 (epoch ms)
+                    "reconnects": int  # 누적 재접속 횟수
+                },
+                ...
+            },
+            "binance_links": [...],  # 바이낸스 개별 연결 상태 (이중화 시 2개)
+            "binance_trades": {  # 체결 중복 제거/누락 감지 통계
+                "last_id": int,  # 반영한 가장 큰 trade id
+                "window": int,  # 늦게 도착한 체결을 받아들이는 최근 id 범위
+                "accepted": int,  # 반영한 체결 수
+                "duplicates": int,  # 다른 연결에서 먼저 도착해 버린 체결 수
+                "late": int,  # 범위를 벗어난 뒤 도착해 버린 체결 수
+                "pending": int,  # 범위 안에서 아직 받지 못한 체결 수
+                "gaps": int,  # trade id 공백 발생 횟수 (범위를 벗어날 때 집계)
+                "missing": int  # 범위를 벗어날 때까지 어느 연결에서도 받지 못한 체결 수
+            },
+            "tick_queue": {
+                "depth": int,  # 현재 처리 대기 중인 틱 수
+                "capacity": int,  # 큐 용량
+                "high_watermark": int,  # 최대 대기 틱 수
+                "enqueued": int,  # 누적 수신 틱 수
+                "processed": int,  # 누적 처리 틱 수
+                "dropped": int  # 처리 지연으로 버려진 틱 수
+            },
+            "candles": {  # 체결 집계 캔들 보유 수 (심볼 -> 간격 -> 개수)
+                "KRW-BTC": {"1m": int, "5m": int, "15m": int, "1h": int, "4h": int, "1d": int},
+                "BTCUSDT": {...}
+            },
+            "clients": int,  # 연결된 WebSocket 클라이언트 수
+            "sse_clients": int,  # 연결된 SSE 클라이언트 수
+            "trade_tape": {  # (리더, TRADE_TAPE_ENABLED) 체결 테이프 기록 수, 비활성 시 null
+                "recorded": int,  # 누적 기록 체결 수
+                "rejected": int,  # 체결 ID가 없어 기록하지 않은 체결 수
+                "upbit": int,  # 현재 세그먼트 레코드 수
+                "binance": int
+            },
+            "startup": {  # (리더) 초기화 단계별 결과, 팔로워는 null
+                "started_ms": int,
+                "duration_ms": float,  # 전체 소요 시간 (진행 중이면 null)
+                "steps": {"candles_usd": {"status": "ok", "duration_ms": float}, ...}
+            },
+            "followers": int  # (리더) 스냅샷을 구독 중인 팔로워 워커 수
+        }
+    """
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=403,
+            detail={"code": "NOT_ADMIN", "message": "관리자만 접근할 수 있습니다"},
+        )
+
+    return stream_service.get_metrics()
+
+
+@router.get("/scheduler", response_model=Dict[str, Any])
+async def get_scheduler_status(current_user: User = Depends(get_current_user)):
+    """
+    주기 작업 스케줄러 상태를 조회합니다. (관리자 전용)
+
+    Returns:
+        dict: {
+            "role": str,  # 응답한 워커의 역할 (작업은 리더에서만 실행)
+            "updated_ms": int,  # 상태 기록 시각 (epoch ms)
+            "jobs": {
+                "dominance": {
+                    "interval": int,  # 실행 주기 (초)
+                    "offset": int,  # 주기 정각 대비 실행 시각 (초)
+                    "jitter": int,  # 최대 무작위 지연 (초)
+                    "running": bool,  # 실행 중 여부
+                    "runs": int,  # 누적 실행 횟수
+                    "failures": int,  # 누적 실패(예외, 타임아웃) 횟수
+                    "skipped": int,  # 이전 실행이 길어져 건너뛴 슬롯 수
+                    "next_run_ms": int,  # 다음 실행 예정 시각
+                    "last_started_ms": int,
+                    "last_duration_ms": float,
+                    "last_success_ms": int,
+                    "last_error": str,
+                    "duration_histogram_ms": {"le_50": int, ..., "inf": int}
+                },
+                ...
+            }
+        }
+    """
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=403,
+            detail={"code": "NOT_ADMIN", "message": "관리자만 접근할 수 있습니다"},
+        )
+
+    status = stream_service.get_scheduler_status()
+    if status is None:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "code": "SCHEDULER_NOT_READY",
+                "message": "스케줄러 상태를 아직 사용할 수 없습니다",
+            },
+        )
+    return {"role": stream_service.role, **status}
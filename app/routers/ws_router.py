@@ -1,15 +1,42 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from app.services.stream_service import stream_service
+from app.constants import WS_DEFLATE_SUBPROTOCOL
+from app.utils.compression import ENCODING_DEFLATE, ENCODING_JSON
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def offers_permessage_deflate(websocket: WebSocket) -> bool:
+    """클라이언트가 표준 permessage-deflate 확장을 요청했는지"""
+    extensions = websocket.headers.get("sec-websocket-extensions", "")
+    return any(
+        offer.split(";")[0].strip().lower() == "permessage-deflate"
+        for offer in extensions.split(",")
+    )
+
+
 @router.websocket("/ws/price")
 async def websocket_endpoint(websocket: WebSocket):
-    await websocket.accept()
-    await stream_service.add_client(websocket)
+    """
+    실시간 스냅샷 스트림.
+    재접속 시 ?resume=<epoch>-<version>(마지막으로 받은 프레임)을 지정하면 놓친 변경분만 델타로 받습니다.
+    """
+    # 압축 서브프로토콜은 선택 사항: 요청한 클라이언트에는 공유 압축 프레임(바이너리)을 전송
+    # 그 외 클라이언트는 서버(uvicorn 기본값)가 협상한 표준 permessage-deflate로 압축된 JSON 텍스트를 받음
+    # 확장을 함께 요청한 클라이언트(브라우저)는 확장이 협상되어 압축 프레임을 다시 압축하게 되므로
+    # 서브프로토콜을 수락하지 않고 확장 압축에 맡김
+    requested = WS_DEFLATE_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+    if requested and not offers_permessage_deflate(websocket):
+        await websocket.accept(subprotocol=WS_DEFLATE_SUBPROTOCOL)
+        encoding = ENCODING_DEFLATE
+    else:
+        await websocket.accept()
+        encoding = ENCODING_JSON
+    await stream_service.add_client(
+        websocket, encoding, resume=websocket.query_params.get("resume")
+    )
 
     try:
         while True:
@@ -20,6 +47,7 @@ async def websocket_endpoint(websocket: WebSocket):
             except WebSocketDisconnect:
                 break
 
+        await stream_service.remove_client(websocket)
     except WebSocketDisconnect:
         await stream_service.remove_client(websocket)
     except Exception as e:
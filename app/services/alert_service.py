@@ -253,16 +253,24 @@ class AlertService:
             # price 알림 체크
             await self.check_price_alerts(session, market_data)
 
-            # 김치프리미엄 알림 체크
-            if "kimchi_premium" in market_data:
+            # 김치프리미엄 알림 체크 (두 피드 중 하나라도 멈췄으면 스킵)
+            if (
+                "kimchi_premium" in market_data
+                and not self._is_feed_stale(market_data, "upbit")
+                and not self._is_feed_stale(market_data, "binance")
+            ):
                 await self.check_kimchi_premium_alerts(session, market_data)
 
-            # 도미넌스 알림 체크
-            if "dominance" in market_data:
+            # 도미넌스 알림 체크 (복원 후 아직 갱신되지 않은 값이면 스킵)
+            if "dominance" in market_data and not self._is_indicator_stale(
+                market_data, "dominance"
+            ):
                 await self.check_dominance_alerts(session, market_data)
 
-            # MVRV 알림 체크
-            if "mvrv" in market_data:
+            # MVRV 알림 체크 (복원 후 아직 갱신되지 않은 값이면 스킵)
+            if "mvrv" in market_data and not self._is_indicator_stale(
+                market_data, "mvrv"
+            ):
                 await self.check_mvrv_alerts(session, market_data)
 
         except Exception as e:
@@ -360,6 +368,11 @@ class AlertService:
     ):
         """Price 알림 체크 로직 분리"""
         for currency in ["KRW", "USD"]:
+            # 멈춘 피드의 가격으로는 알림을 평가하지 않음
+            feed = "upbit" if currency == "KRW" else "binance"
+            if self._is_feed_stale(market_data, feed):
+                continue
+
             new_price = market_data["krw"] if currency == "KRW" else market_data["usd"]
             old_price = self.last_price_by_currency[currency]
 
@@ -399,6 +412,21 @@ class AlertService:
             # 마지막에 currency별 가격을 갱신
             self.last_price_by_currency[currency] = new_price
 
+    def _is_feed_stale(self, market_data: Dict[str, Any], feed: str) -> bool:
+        """스냅샷의 피드 상태에서 stale 여부 확인 (상태 정보가 없으면 정상으로 간주)"""
+        return bool(market_data.get("feeds", {}).get(feed, {}).get("stale", False))
+
+    def _is_indicator_stale(self, market_data: Dict[str, Any], field: str) -> bool:
+        """
+        스냅샷 지표 값이 아직 갱신되지 않았는지 확인.
+        워밍 스타트로 복원된 뒤 갱신 전인 값(stale 목록)이나 한 번도 로드되지 않은 기본값이면 True
+        (필드 갱신 시각 정보가 없는 메시지는 stale 목록만 확인)
+        """
+        if field in (market_data.get("stale") or ()):
+            return True
+        updated = market_data.get("field_updated_ms")
+        return updated is not None and field not in updated
+
     def _check_threshold_condition(
         self, current_value: float, threshold: float, direction: str
     ) -> bool:
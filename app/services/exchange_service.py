@@ -9,7 +9,6 @@ from app.constants import (
     EXCHANGE_RATE_API_URL,
     ALPHA_VANTAGE_URL,
 )
-import pandas as pd
 from typing import List, Dict, Any
 import logging
 
@@ -191,12 +190,22 @@ class ExchangeRateService:
             raise e
 
     async def get_binance_candles(
-        self, symbol: str = "BTCUSDT", interval: str = "1d", limit: int = 100
+        self,
+        symbol: str = "BTCUSDT",
+        interval: str = "1d",
+        limit: int = 100,
+        end_time: Optional[int] = None,
+        strict: bool = False,
     ) -> List[Dict[str, Any]]:
-        """바이낸스 캔들 데이터 조회"""
+        """
+        바이낸스 캔들 데이터 조회 (end_time: 이 시각(ms) 이전에 시작한 캔들만 조회, 페이지 조회용)
+        strict=True이면 오류를 빈 목록 대신 예외로 전달합니다. (페이지 조회 중 이력이 잘리지 않도록)
+        """
         try:
             url = "https://api.binance.com/api/v3/klines"
             params = {"symbol": symbol, "interval": interval, "limit": limit}
+            if end_time is not None:
+                params["endTime"] = end_time
 
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, params=params) as response:
@@ -219,16 +228,28 @@ class ExchangeRateService:
                         return candles
                     else:
                         logger.error(f"바이낸스 API 호출 실패: {response.status}")
+                        if strict:
+                            response.raise_for_status()
                         return []
 
         except Exception as e:
             logger.error(f"바이낸스 캔들 데이터 조회 중 오류: {str(e)}")
+            if strict:
+                raise
             return []
 
     async def get_upbit_candles(
-        self, market: str = "KRW-BTC", interval: str = "1d", limit: int = 100
+        self,
+        market: str = "KRW-BTC",
+        interval: str = "1d",
+        limit: int = 100,
+        to: Optional[str] = None,
+        strict: bool = False,
     ) -> List[Dict[str, Any]]:
-        """업비트 캔들 데이터 조회"""
+        """
+        업비트 캔들 데이터 조회 (to: 이 시각(UTC) 이전 캔들만 조회, 페이지 조회용)
+        strict=True이면 오류를 빈 목록 대신 예외로 전달합니다. (페이지 조회 중 이력이 잘리지 않도록)
+        """
         try:
             url = "https://api.upbit.com/v1/candles"
 
@@ -238,6 +259,8 @@ class ExchangeRateService:
                 "1h": "minutes/60",
                 "4h": "minutes/240",
                 "15m": "minutes/15",
+                "5m": "minutes/5",
+                "1m": "minutes/1",
             }
             upbit_interval = interval_map.get(interval, "days")
 
@@ -248,6 +271,8 @@ class ExchangeRateService:
                 url += f"/{upbit_interval}"
 
             params = {"market": market, "count": limit}
+            if to is not None:
+                params["to"] = to
 
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, params=params) as response:
@@ -267,10 +292,14 @@ class ExchangeRateService:
                         ]
                     else:
                         logger.error(f"업비트 API 호출 실패: {response.status}")
+                        if strict:
+                            response.raise_for_status()
                         return []
 
         except Exception as e:
             logger.error(f"업비트 캔들 데이터 조회 중 오류: {str(e)}")
+            if strict:
+                raise
             return []
 
 
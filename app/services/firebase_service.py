@@ -1,20 +1,32 @@
-import firebase_admin
-from firebase_admin import credentials, messaging
 import os
 import json
 import logging
+from typing import Optional
 from dotenv import load_dotenv
+from app.utils.lazy_import import lazy_module
 
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# firebase_admin은 import 비용이 커서 첫 초기화 시점에 import
+firebase_admin = lazy_module("firebase_admin")
+credentials = lazy_module("firebase_admin.credentials")
+messaging = lazy_module("firebase_admin.messaging")
+
 
 class FirebaseService:
     def __init__(self):
-        self.initialized = False
-        self.initialize()
+        self._initialized: Optional[bool] = None  # None: 아직 초기화 시도 전
+
+    @property
+    def initialized(self) -> bool:
+        """초기화 여부 (최초 조회 시 초기화 시도)"""
+        if self._initialized is None:
+            self._initialized = False
+            self.initialize()
+        return self._initialized
 
     def initialize(self):
         try:
@@ -39,11 +51,11 @@ class FirebaseService:
                 return
 
             firebase_admin.initialize_app(cred)
-            self.initialized = True
+            self._initialized = True
             logger.info("Firebase service initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Firebase: {str(e)}")
-            self.initialized = False
+            self._initialized = False
 
     def send_push_notification(self, token, title, body, data=None):
         """
@@ -1,6 +1,3 @@
-import pandas as pd
-from ta.momentum import RSIIndicator
-import requests
 import os
 from typing import Dict, Optional, Any, List
 from dotenv import load_dotenv
@@ -16,7 +13,6 @@ from ..constants import (
     RSI_INTERVALS,
     FEAR_GREED_API_URL,
 )
-import numpy as np
 import aiohttp
 import time
 import asyncio
@@ -25,13 +21,27 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.sql import desc
+from app.utils.lazy_import import lazy_module
 from app.models import MVRVIndicator, FearGreedIndicator, StablecoinInflowRatioIndicator, NUPLIndicator, SPORIndicator, ASOLIndicator
 
 logger = logging.getLogger(__name__)
 
+# REST RSI 폴백 계산에서만 사용 (스트림 서비스는 증분 RSI 사용)
+pd = lazy_module("pandas")
+ta_momentum = lazy_module("ta.momentum")
+
 load_dotenv()
 
 
+def rsi_signal(rsi: float) -> str:
+    """RSI 값에 따른 신호 (70 이상 과매수, 30 이하 과매도)"""
+    if rsi >= 70:
+        return "overbought"
+    if rsi <= 30:
+        return "oversold"
+    return "neutral"
+
+
 class IndicatorService:
     def __init__(self):
         self.coinmarketcap_api_key = os.getenv("COINMARKETCAP_API_KEY")
@@ -63,7 +73,7 @@ class IndicatorService:
             df = pd.DataFrame(closes, columns=["close"])
 
             # RSI 계산
-            rsi_indicator = RSIIndicator(close=df["close"], window=length)
+            rsi_indicator = ta_momentum.RSIIndicator(close=df["close"], window=length)
             current_rsi = rsi_indicator.rsi().iloc[-1]
 
             # RSI 값이 NaN인 경우 처리
@@ -72,11 +82,7 @@ class IndicatorService:
                 return {"rsi": 50.0, "signal": "neutral"}
 
             # RSI 값에 따른 신호 결정
-            signal = "neutral"
-            if current_rsi >= 70:
-                signal = "overbought"
-            elif current_rsi <= 30:
-                signal = "oversold"
+            signal = rsi_signal(current_rsi)
 
             logger.debug(f"RSI 계산 완료: {interval} = {round(float(current_rsi), 2)}")
             return {"rsi": round(float(current_rsi), 2), "signal": signal}
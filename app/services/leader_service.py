@@ -0,0 +1,151 @@
+"""
+멀티 워커 환경의 업스트림 수집(ingest) 리더 선출 및 스냅샷 채널
+
+uvicorn을 여러 워커로 실행하면 워커마다 stream_service가 시작됩니다.
+잠금 파일을 먼저 획득한 워커 하나만 리더가 되어 거래소 연결, 주기적 폴링, 알림 평가를 담당하고,
+나머지 워커(팔로워)는 로컬 유닉스 소켓을 통해 리더가 발행하는 스냅샷을 수신합니다.
+팔로워에서 발생한 스냅샷 변경(관리자 수정 등)은 같은 소켓으로 리더에게 전달됩니다.
+"""
+
+import asyncio
+import fcntl
+import logging
+import os
+from typing import Awaitable, Callable, Optional, Set
+
+from app.constants import INGEST_CHANNEL_LINE_LIMIT, INGEST_FOLLOWER_BUFFER_LIMIT
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElection:
+    """잠금 파일(flock) 기반 리더 선출. 프로세스가 종료되면 잠금은 자동으로 해제됩니다."""
+
+    def __init__(self, lock_path: str):
+        self.lock_path = lock_path
+        self._fd: Optional[int] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        """잠금을 비차단으로 시도합니다. 이미 보유 중이면 True를 반환합니다."""
+        if self._fd is not None:
+            return True
+
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        # 디버깅용으로 리더 PID 기록
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        logger.info(f"Acquired ingest leadership (pid={os.getpid()})")
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+class SnapshotPublisher:
+    """리더 측: 팔로워에게 개행 구분 JSON 스냅샷을 전송하는 유닉스 소켓 서버"""
+
+    def __init__(
+        self, socket_path: str, on_update: Optional[Callable[[bytes], None]] = None
+    ):
+        self.socket_path = socket_path
+        self.on_update = on_update  # 팔로워가 보낸 변경 메시지 처리
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.followers: Set[asyncio.StreamWriter] = set()
+
+    async def start(self):
+        # 리더 잠금을 보유한 상태이므로 남아 있는 소켓 파일은 이전 리더의 것
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self.server = await asyncio.start_unix_server(
+            self._handle_follower, path=self.socket_path
+        )
+        logger.info(f"Snapshot publisher listening on {self.socket_path}")
+
+    async def _handle_follower(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        self.followers.add(writer)
+        logger.info(f"Follower connected. Total followers: {len(self.followers)}")
+        try:
+            # 팔로워는 스냅샷 변경 메시지만 개행 구분 JSON으로 보냄
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if self.on_update is None:
+                    continue
+                try:
+                    self.on_update(line.rstrip(b"\n"))
+                except Exception as e:
+                    logger.error(f"Failed to apply follower update: {str(e)}")
+        finally:
+            self.followers.discard(writer)
+            writer.close()
+            logger.info(
+                f"Follower disconnected. Total followers: {len(self.followers)}"
+            )
+
+    def publish(self, payload: bytes):
+        """스냅샷을 모든 팔로워에게 전송합니다. (대기하지 않음)"""
+        line = payload + b"\n"
+        for writer in list(self.followers):
+            # 읽기가 밀린 팔로워는 리더를 지연시키지 않도록 연결을 끊음
+            if writer.transport.get_write_buffer_size() > INGEST_FOLLOWER_BUFFER_LIMIT:
+                logger.warning("Dropping slow follower from snapshot channel")
+                self.followers.discard(writer)
+                writer.close()
+                continue
+            writer.write(line)
+
+    async def stop(self):
+        for writer in list(self.followers):
+            writer.close()
+        self.followers.clear()
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+async def subscribe_snapshots(
+    socket_path: str,
+    on_snapshot: Callable[[bytes], Awaitable[None]],
+    on_connect: Optional[Callable[[asyncio.StreamWriter], None]] = None,
+):
+    """
+    팔로워 측: 리더의 스냅샷 채널에 접속해 연결이 끊길 때까지 수신합니다.
+    on_connect에는 리더에게 변경 메시지를 보낼 수 있는 writer가 전달됩니다.
+    """
+    reader, writer = await asyncio.open_unix_connection(
+        socket_path, limit=INGEST_CHANNEL_LINE_LIMIT
+    )
+    logger.info("Connected to ingest leader snapshot channel")
+    if on_connect is not None:
+        on_connect(writer)
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            await on_snapshot(line.rstrip(b"\n"))
+    finally:
+        writer.close()
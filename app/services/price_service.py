@@ -4,11 +4,14 @@ import aiohttp
 from typing import Dict, Any, Tuple
 from app.services.exchange_service import exchange_service
 import logging
-from langchain_openai import ChatOpenAI
+from app.utils.lazy_import import lazy_module
 import os
 
 logger = logging.getLogger(__name__)
 
+# 일봉 확정 시 시장 진단에서만 사용
+langchain_openai = lazy_module("langchain_openai")
+
 
 async def get_upbit_price() -> Tuple[float, float]:
     """업비트 API에서 BTC-KRW 가격과 변동률을 조회합니다."""
@@ -46,8 +49,9 @@ async def calculate_kimchi_premium(krw_price: float, usd_price: float) -> float:
 
 async def get_krw_price() -> Dict[str, Any]:
     """BTC의 원화 가격과 변동률, 김치 프리미엄을 조회합니다."""
-    krw_price, krw_change = await get_upbit_price()
-    usd_price, _ = await get_binance_price()
+    (krw_price, krw_change), (usd_price, _) = await asyncio.gather(
+        get_upbit_price(), get_binance_price()
+    )
 
     kimchi_premium = await calculate_kimchi_premium(krw_price, usd_price)
 
@@ -96,6 +100,24 @@ from typing import Any, Dict, List
 MA_PERIODS = [20, 60, 120, 200]
 
 
+def ma_cross_status(ma_value: float, recent_closes: List[float]) -> Dict[str, Any]:
+    """
+    이동평균 대비 ±2% 돌파 여부.
+    recent_closes(최근 2일 종가)가 모두 기준선을 넘으면 확정으로 판단합니다.
+    """
+    threshold_up = ma_value * 1.02
+    threshold_down = ma_value * 0.98
+    return {
+        "ma_value": ma_value,
+        "threshold_up": threshold_up,
+        "threshold_down": threshold_down,
+        # 2일 연속 +2% 이상 상회
+        "confirmed_up": all(price > threshold_up for price in recent_closes),
+        # 2일 연속 -2% 이하 하회
+        "confirmed_down": all(price < threshold_down for price in recent_closes),
+    }
+
+
 async def check_ma_cross_all() -> Dict[str, Any]:
     """BTC/USDT의 이동평균선 돌파 여부 확인 및 시장 상태 진단"""
     try:
@@ -141,30 +163,7 @@ async def check_ma_cross_all() -> Dict[str, Any]:
         for period in MA_PERIODS:
             # period일 SMA 계산
             ma_value = sum(closes[-period:]) / period
-
-            # ±2% 기준
-            threshold_up = ma_value * 1.02
-            threshold_down = ma_value * 0.98
-
-            # 2일 연속 ±2% 돌파 여부
-            def is_confirmed_up(price_list: List[float]) -> bool:
-                return all(price > threshold_up for price in price_list)
-
-            def is_confirmed_down(price_list: List[float]) -> bool:
-                return all(price < threshold_down for price in price_list)
-
-            last_two_days = [day2_close, day1_close]
-
-            confirmed_up = is_confirmed_up(last_two_days)
-            confirmed_down = is_confirmed_down(last_two_days)
-
-            ma_results[period] = {
-                "ma_value": ma_value,
-                "threshold_up": threshold_up,
-                "threshold_down": threshold_down,
-                "confirmed_up": confirmed_up,  # 2일 연속 +2% 이상 상회
-                "confirmed_down": confirmed_down,  # 2일 연속 -2% 이하 하회
-            }
+            ma_results[period] = ma_cross_status(ma_value, [day2_close, day1_close])
 
         logger.info(f"MA 결과: {ma_results}")
 
@@ -228,11 +227,12 @@ async def analyze_market_state(
 """
 
         # GPT-4 호출
-        chat = ChatOpenAI(
+        chat = langchain_openai.ChatOpenAI(
             model="gpt-4o-mini", temperature=0, api_key=os.getenv("OPENAI_API_KEY")
         )
 
-        response = chat.invoke(prompt)
+        # 이벤트 루프를 막지 않도록 비동기 호출
+        response = await chat.ainvoke(prompt)
 
         # 응답 파싱 (GPT가 JSON 형식으로 응답했다고 가정)
         import json
@@ -1,17 +1,16 @@
-import firebase_admin
-from firebase_admin import credentials, messaging
 import os
 import logging
 from dotenv import load_dotenv
 import asyncio
-from app.services.firebase_service import firebase_service
+from app.services.firebase_service import firebase_service, messaging
 load_dotenv()
 logger = logging.getLogger(__name__)
 
 
 class PushService:
-    def __init__(self):
-        self.initialized = firebase_service.initialized
+    @property
+    def initialized(self) -> bool:
+        return firebase_service.initialized
 
     async def send_push_notification(self, token: str, title: str, body: str):
         """단일 기기에 푸시 알림을 전송합니다."""
@@ -1,22 +1,99 @@
-import json
 import asyncio
+import time
 import websockets
-from typing import Set, Dict, Any
+from collections import deque
+from typing import Set, Dict, Any, Optional, Deque, List, Tuple
 from datetime import datetime
 import logging
 from app.constants import (
     UPBIT_WS_URL,
+    UPBIT_WS_SIMPLE_FORMAT,
     BINANCE_WS_URL,
+    BINANCE_WS_BACKUP_URL,
+    BINANCE_WS_HEDGED,
+    BINANCE_KLINE_VOLUME_KEYS,
     DEFAULT_PING_INTERVAL,
     MAX_RECONNECT_ATTEMPTS,
     RECONNECT_DELAY,
+    FEED_STALE_AFTER,
+    FEED_SILENCE_TIMEOUT,
+    TICK_QUEUE_SIZE,
+    TICK_DROP_LOG_INTERVAL,
+    INGEST_LOCK_PATH,
+    INGEST_SOCKET_PATH,
+    INGEST_RETRY_DELAY,
+    SHM_SNAPSHOT_NAME,
+    SHM_SNAPSHOT_CAPACITY,
+    CANDLE_SYMBOL_KRW,
+    CANDLE_SYMBOL_USD,
+    CANDLE_CAPACITY,
+    CANDLE_BACKFILL,
+    UPBIT_CANDLE_PAGE_SIZE,
+    TICKER_24H_WINDOW_MS,
+    TRADE_DEDUP_WINDOW,
+    BINANCE_CANDLE_PAGE_SIZE,
+    CANDLE_PAGE_RETRIES,
+    CANDLE_PAGE_RETRY_DELAY,
+    DEFAULT_RSI_LENGTH,
+    RSI_INTERVALS,
+    EXTREME_LOOKBACK_DAYS,
+    STREAM_REPLAY_SIZE,
+    SSE_CLIENT_QUEUE_SIZE,
+    SHM_PRICE_HISTORY_NAME,
+    PRICE_HISTORY_SECONDS,
+    STARTUP_STEP_TIMEOUT,
+    STARTUP_STEP_TIMEOUTS,
+    SCHEDULED_JOBS,
+    SCHEDULER_JOB_TIMEOUT,
+    SCHEDULER_DURATION_BUCKETS_MS,
+    SCHEDULER_STATUS_PATH,
+    WARM_START_PATH,
+    WARM_START_MAX_AGE,
+    WARM_START_REFRESH_JOBS,
+    TRADE_TAPE_ENABLED,
+    TRADE_TAPE_DIR,
+    TRADE_TAPE_SEGMENT_RECORDS,
 )
-import aiohttp
 from app.services.exchange_service import exchange_service  # 환율 서비스 import
 from app.services.indicator_service import indicator_service  # RSI 서비스 import
 from app.services.alert_service import alert_service
 from app.database import async_session  # 추가
-from app.services.price_service import check_ma_cross_all  # 상단에 추가
+from app.services.price_service import (
+    MA_PERIODS,
+    analyze_market_state,
+    ma_cross_status,
+)
+from app.utils import serializer
+from app.utils.compression import EncodedFrame, ENCODING_JSON
+from app.utils.ring_queue import RingQueue
+from app.utils.feed_health import FeedHealth, TradeDeduplicator, backoff_delay
+from app.utils.shared_snapshot import SharedSnapshot
+from app.utils.price_history import PriceHistory
+from app.utils import warm_start
+from app.utils.scheduler import JobScheduler, previous_slot
+from app.utils.startup import StartupOrchestrator
+from app.utils.trade_tape import TradeTape, SIDE_BUY, SIDE_SELL, SIDE_UNKNOWN
+from app.utils.market_snapshot import FIELDS as SNAPSHOT_FIELDS, MarketSnapshot
+from app.utils.candle_store import (
+    CandleStore,
+    parse_candle_time,
+    INTERVAL_MS,
+    OPEN_TIME,
+    HIGH,
+    LOW,
+    CLOSE,
+)
+from app.utils.rolling_indicators import (
+    WilderRSI,
+    RollingSMA,
+    RollingEMA,
+    RollingExtremes,
+)
+from app.services.leader_service import (
+    LeaderElection,
+    SnapshotPublisher,
+    subscribe_snapshots,
+)
 
 # SQLAlchemy 로거 비활성화 추가
 logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
@@ -24,62 +101,125 @@ logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 업비트 메시지 필드명 (기본 포맷 / SIMPLE 포맷)
+UPBIT_DEFAULT_FIELDS = {
+    "type": "type",
+    "trade_price": "trade_price",
+    "trade_volume": "trade_volume",
+    "trade_timestamp": "trade_timestamp",
+    "ask_bid": "ask_bid",
+    "sequential_id": "sequential_id",
+    "signed_change_rate": "signed_change_rate",
+    "acc_trade_volume_24h": "acc_trade_volume_24h",
+}
+UPBIT_SIMPLE_FIELDS = {
+    "type": "ty",
+    "trade_price": "tp",
+    "trade_volume": "tv",
+    "trade_timestamp": "ttms",
+    "ask_bid": "ab",
+    "sequential_id": "sid",
+    "signed_change_rate": "scr",
+    "acc_trade_volume_24h": "atv24h",
+}
+
 
 class PriceStreamService:
     def __init__(self):
-        self.clients: Set[websockets.WebSocketServerProtocol] = set()
-        self.current_prices: Dict[str, Any] = {
-            "krw": 0.0,
-            "usd": 0.0,
-            "timestamp": "",
-            "kimchi_premium": 0.0,
-            "change_24h": {"krw": 0.0, "usd": 0.0},
-            "volume": {  # 시간 간격별 누적 거래량 정보 (BTC 개수)
-                "1m": 0.0,
-                "5m": 0.0,
-                "15m": 0.0,
-                "1h": 0.0,
-                "24h": 0.0,
-            },
-            "rsi": {
-                "15m": 0.0,
-                "1h": 0.0,
-                "4h": 0.0,
-                "1d": 0.0,
-            },
-            "dominance": 0.0,
-            "high_3w": {
-                "krw": 0.0,
-                "usd": 0.0,
-                "timestamp": "",
-            },
-            "ma_cross": None,  # MA 크로스 데이터 캐시 추가
-            "fear_greed": {  # 공포/탐욕 지수 추가
-                "value": 0,
-                "classification": "neutral",
-                "timestamp": "",
-            },
-            "eth_btc_ratio": 0.0,  # ETH/BTC 비율 추가
-            "stablecoin_inflow_ratio": 0.0,  # 스테이블코인 유입 비율 추가
-            "nupl": 0.0,  # NUPL(Net Unrealized Profit/Loss) 추가
-            "spor": 0.0,  # SPOR(Spent Output Profit Ratio) 추가
-            "asol": 0.0,  # ASOL(Average Spent Output Lifespan) 추가
+        # 연결된 클라이언트 -> 프레임 인코딩 (json / deflate)
+        self.clients: Dict[websockets.WebSocketServerProtocol, str] = {}
+        # SSE 클라이언트 큐 -> 구독 필드 (None이면 전체 스냅샷)
+        self.sse_clients: Dict[asyncio.Queue, Optional[Tuple[str, ...]]] = {}
+        # 최근 전송 프레임 (SSE Last-Event-ID / WebSocket resume 재개용)
+        self.recent_frames: Deque[EncodedFrame] = deque(maxlen=STREAM_REPLAY_SIZE)
+        # 가격/지표 스냅샷 (변경은 update/update_in으로만 수행, 버전 관리)
+        self.snapshot = MarketSnapshot()
+        self.last_broadcast_version = -1
+        # 체결로 직접 집계하는 다중 간격 OHLCV 캔들 (REST 백필 후 증분 갱신)
+        self.candles = CandleStore(
+            [CANDLE_SYMBOL_KRW, CANDLE_SYMBOL_USD], CANDLE_CAPACITY
+        )
+        # BTCUSDT 캔들 기반 간격별 증분 RSI
+        self.rsi_engines = {
+            interval: WilderRSI(DEFAULT_RSI_LENGTH) for interval in RSI_INTERVALS
         }
-        self.prev_prices: Dict[str, Any] = {"krw": 0.0, "usd": 0.0, "timestamp": ""}
-        # 시간 간격별 마지막 갱신 시간
-        self.last_volume_update = {
-            "1m": datetime.now(),
-            "5m": datetime.now(),
-            "15m": datetime.now(),
-            "1h": datetime.now(),
-            "24h": datetime.now(),
+        # BTCUSDT 일봉 기반 이동평균 (일봉 확정 시 갱신, 현재가로 잠정 값 계산)
+        self.ma_sma = {period: RollingSMA(period) for period in MA_PERIODS}
+        self.ma_ema = {period: RollingEMA(period) for period in MA_PERIODS}
+        # 마지막 일봉 확정 시점의 MA 돌파 상태 (MA 알림 기준)
+        self.ma_confirmed: Dict[int, Dict[str, Any]] = {}
+        # 일봉 기반 기간별 최고가/최저가 (당일은 진행 중 캔들로 실시간 반영)
+        self.extremes = {
+            symbol: {
+                name: RollingExtremes(
+                    (days - 1) * INTERVAL_MS["1d"] if days is not None else None
+                )
+                for name, days in EXTREME_LOOKBACK_DAYS.items()
+            }
+            for symbol in (CANDLE_SYMBOL_KRW, CANDLE_SYMBOL_USD)
         }
-        # 캔들 데이터 캐시
-        self.candle_cache = {"krw": {}, "usd": {}}
         self.running = False
         self.last_broadcast_time = datetime.now()
         self.broadcast_interval = 1.0  # 1초로 변경
-        self.db_session = None  # 추가
+        # 수신 루프가 파싱한 틱을 처리 단계로 넘기는 큐 (source, data)
+        self.tick_queue = RingQueue(TICK_QUEUE_SIZE)
+        self.upbit_fields = (
+            UPBIT_SIMPLE_FIELDS if UPBIT_WS_SIMPLE_FORMAT else UPBIT_DEFAULT_FIELDS
+        )
+        # 피드별 상태 (김치 프리미엄/알림은 두 피드가 모두 살아 있을 때만 갱신)
+        self.feed_health: Dict[str, FeedHealth] = {
+            "upbit": FeedHealth("upbit", FEED_STALE_AFTER),
+            "binance": FeedHealth("binance", FEED_STALE_AFTER),
+        }
+        # 바이낸스 체결 스트림 연결 목록 (이중화 시 2개, 먼저 도착한 체결만 사용)
+        self.binance_urls = [BINANCE_WS_URL]
+        if BINANCE_WS_HEDGED:
+            self.binance_urls.append(BINANCE_WS_BACKUP_URL)
+        self.binance_links = [
+            FeedHealth(f"binance#{i}", FEED_STALE_AFTER)
+            for i in range(len(self.binance_urls))
+        ]
+        self.binance_trades = TradeDeduplicator(TRADE_DEDUP_WINDOW)
+        # 결합 스트림별 마지막 이벤트 시각 (이중화 연결에서 늦게 도착한 이벤트 무시)
+        self.binance_event_times: Dict[str, int] = {}
+        # 현재가로 반영한 마지막 바이낸스 체결 시각 (이중화 연결의 지연 체결이 가격을 되돌리지 않도록)
+        self.binance_last_trade_ms = 0
+        self.eth_usd = 0.0
+        self.last_drop_log_time = datetime.now()
+        self.last_logged_drops = 0
+        # 멀티 워커 환경: 리더만 업스트림 수집/알림 평가를 수행하고 팔로워에 스냅샷 발행
+        self.role = None  # "leader" | "follower"
+        self.leader_election = LeaderElection(INGEST_LOCK_PATH)
+        self.publisher = SnapshotPublisher(
+            INGEST_SOCKET_PATH, on_update=self.apply_follower_update
+        )
+        # 팔로워: 리더에게 스냅샷 변경을 전달할 채널
+        self.leader_channel: Optional[asyncio.StreamWriter] = None
+        # 리더: 공유 메모리에 스냅샷 기록 / 팔로워: 공유 메모리에서 스냅샷 읽기
+        self.shared_snapshot = None
+        # 초 단위 가격 이력 (리더: 공유 메모리에 기록 / 팔로워: 읽기 전용 연결)
+        self.price_history: Optional[PriceHistory] = None
+        # 다음 이력 기록까지 누적된 체결량 (BTC)
+        self.history_volume = {"krw": 0.0, "usd": 0.0}
+        # 원본 체결 기록기 (리더 전용, TRADE_TAPE_ENABLED일 때만 생성)
+        self.trade_tape: Optional[TradeTape] = None
+        # 리더 초기화 단계별 결과 (소요 시간, 타임아웃/실패 여부)
+        self.startup: Optional[StartupOrchestrator] = None
+        # 주기적 지표 갱신/알림 체크 작업 (리더 전용)
+        self.scheduler = JobScheduler(
+            SCHEDULER_DURATION_BUCKETS_MS,
+            default_timeout=SCHEDULER_JOB_TIMEOUT,
+            status_path=SCHEDULER_STATUS_PATH,
+        )
+        # GC로 인한 태스크 소멸 방지를 위해 참조 보관
+        self.tasks: Set[asyncio.Task] = set()
+
+    def spawn(self, coro) -> asyncio.Task:
+        """백그라운드 태스크 생성 (완료 시 참조 자동 제거)"""
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
 
     async def calculate_kimchi_premium(
         self, krw_price: float, usd_price: float
@@ -93,112 +233,507 @@ class PriceStreamService:
             logger.error(f"Failed to calculate kimchi premium: {str(e)}")
             return 0.0
 
-    async def should_broadcast(self) -> bool:
-        """브로드캐스트 주기 제한 확인"""
-        now = datetime.now()
-        if (now - self.last_broadcast_time).total_seconds() >= self.broadcast_interval:
-            self.last_broadcast_time = now
-            return True
-        return False
-
     async def connect_upbit(self):
         """업비트 WebSocket 연결 및 데이터 처리"""
         logger.info("Connecting to Upbit WebSocket...")
+        health = self.feed_health["upbit"]
         while self.running:
             try:
-                async with websockets.connect(UPBIT_WS_URL) as websocket:
+                async with websockets.connect(
+                    UPBIT_WS_URL,
+                    ping_interval=DEFAULT_PING_INTERVAL,
+                    ping_timeout=DEFAULT_PING_INTERVAL,
+                ) as websocket:
                     logger.info("Successfully connected to Upbit WebSocket")
-                    await self.fetch_upbit_24h_change()
+                    health.on_connect()
+                    if health.reconnects:
+                        # 끊겨 있던 동안의 캔들을 REST로 다시 채움
+                        self.spawn(self.backfill_candles(CANDLE_SYMBOL_KRW))
 
+                    # 체결 + 티커(24시간 변동률/거래량/고저가)를 한 연결로 구독
+                    # 티커는 접속 직후 스냅샷을 먼저 받아 변동률을 바로 채움
                     subscribe_fmt = [
                         {"ticket": "UNIQUE_TICKET"},
                         {"type": "trade", "codes": ["KRW-BTC"], "isOnlyRealtime": True},
+                        {"type": "ticker", "codes": ["KRW-BTC"]},
                     ]
-                    await websocket.send(json.dumps(subscribe_fmt))
+                    if UPBIT_WS_SIMPLE_FORMAT:
+                        subscribe_fmt.append({"format": "SIMPLE"})
+                    await websocket.send(serializer.dumps(subscribe_fmt))
                     logger.info("Sent subscription message to Upbit")
 
-                    while self.running:
-                        data = await websocket.recv()
-                        data = json.loads(data)
-                        self.current_prices["krw"] = float(data["trade_price"])
-                        self.current_prices["timestamp"] = datetime.now().isoformat()
-
-                        # 브로드캐스트 주기와 관계없이 항상 알림 체크
-                        if self.current_prices["usd"] > 0:
-                            self.current_prices["kimchi_premium"] = (
-                                await self.calculate_kimchi_premium(
-                                    self.current_prices["krw"],
-                                    self.current_prices["usd"],
-                                )
-                            )
-
-                        # 알림 체크는 항상 실행
-                        await self.broadcast(self.current_prices)
+                    await self.receive_ticks(websocket, health, health)
 
             except Exception as e:
                 logger.error(f"Upbit WebSocket error: {str(e)}")
-                await asyncio.sleep(RECONNECT_DELAY)
-
-    async def fetch_upbit_24h_change(self):
-        """업비트 24시간 변동률 조회"""
+            await self.wait_before_reconnect(health)
+
+    async def receive_ticks(
+        self,
+        websocket,
+        link: FeedHealth,
+        feed: FeedHealth,
+        dedup: TradeDeduplicator = None,
+    ):
+        """
+        메시지를 파싱해 핸드오프 큐에 넣습니다.
+        link는 개별 연결, feed는 논리 피드 상태입니다.
+        dedup이 주어지면(바이낸스 결합 스트림) 체결은 trade id로, 티커/캔들은 이벤트 시각으로
+        먼저 도착한 것만 통과시킵니다.
+        FEED_SILENCE_TIMEOUT 동안 메시지가 없으면 반환하여 재접속을 유도합니다.
+        """
+        while self.running:
+            try:
+                data = await asyncio.wait_for(websocket.recv(), FEED_SILENCE_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"{link.name} feed silent for {FEED_SILENCE_TIMEOUT}s, "
+                    "forcing reconnect"
+                )
+                return
+            link.on_message()
+            tick = serializer.loads(data)
+
+            if dedup is not None:
+                # 결합 스트림 메시지: {"stream": "...", "data": {...}}
+                stream = tick.get("stream")
+                tick = tick.get("data", tick)
+                if tick.get("e") != "trade":
+                    # 티커/캔들은 이벤트 시각 기준으로 최신 것만 반영
+                    if tick["E"] <= self.binance_event_times.get(stream, 0):
+                        continue
+                    self.binance_event_times[stream] = tick["E"]
+                    feed.on_message()
+                    self.tick_queue.put_nowait((feed.name, tick))
+                    continue
+
+                gaps = dedup.gaps
+                if not dedup.accept(tick["t"]):
+                    continue
+                if dedup.gaps != gaps:
+                    logger.warning(
+                        f"{feed.name} trade ids missing beyond dedup window "
+                        f"(total missing: {dedup.missing})"
+                    )
+            if feed is not link:
+                feed.on_message()
+            if self.trade_tape is not None:
+                # 핸드오프 큐는 가득 차면 오래된 틱을 버리므로 테이프는 큐에 넣기 전에 기록
+                self.record_trade(feed.name, tick)
+            self.tick_queue.put_nowait((feed.name, tick))
+
+    def record_trade(self, source: str, data: Dict[str, Any]):
+        """수신한 원본 체결을 체결 테이프에 기록 (체결 외 이벤트는 무시)"""
         try:
-            url = "https://api.upbit.com/v1/ticker"
-            params = {"markets": "KRW-BTC"}
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        change_rate = float(data[0]["change_rate"]) * 100
-                        self.current_prices["change_24h"]["krw"] = round(change_rate, 2)
+            if source == "upbit":
+                fields = self.upbit_fields
+                if data[fields["type"]] != "trade":
+                    return
+                ask_bid = data.get(fields["ask_bid"])
+                self.trade_tape.record(
+                    "upbit",
+                    data[fields["trade_timestamp"]],
+                    float(data[fields["trade_price"]]),
+                    float(data[fields["trade_volume"]]),
+                    # 체결 ID가 없는 행은 테이프가 거부하고 rejected로 집계
+                    data.get(fields["sequential_id"]),
+                    SIDE_BUY
+                    if ask_bid == "BID"
+                    else SIDE_SELL if ask_bid == "ASK" else SIDE_UNKNOWN,
+                )
+            elif data.get("e") == "trade":
+                # m: 매수자가 메이커 = 매도 테이커 체결
+                self.trade_tape.record(
+                    "binance",
+                    data["T"],
+                    float(data["p"]),
+                    float(data["q"]),
+                    data["t"],
+                    SIDE_SELL if data.get("m") else SIDE_BUY,
+                )
         except Exception as e:
-            logger.error(f"Failed to fetch Upbit 24h change: {str(e)}")
+            logger.error(f"Failed to record {source} trade to tape: {str(e)}")
+
+    async def wait_before_reconnect(self, health: FeedHealth):
+        """연결 종료 처리 후 지터가 적용된 지수 백오프로 대기"""
+        health.on_disconnect()
+        if not self.running:
+            return
+        delay = backoff_delay(
+            health.consecutive_failures - 1, RECONNECT_DELAY, MAX_RECONNECT_ATTEMPTS
+        )
+        logger.info(f"Reconnecting to {health.name} in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+    async def connect_binance(self, index: int = 0):
+        """바이낸스 WebSocket 연결 및 데이터 처리 (index: 이중화 연결 번호)"""
+        url = self.binance_urls[index]
+        link = self.binance_links[index]
+        feed = self.feed_health["binance"]
+        logger.info(f"Connecting to Binance WebSocket ({url})...")
+        while self.running:
+            try:
+                async with websockets.connect(
+                    url,
+                    ping_interval=DEFAULT_PING_INTERVAL,
+                    ping_timeout=DEFAULT_PING_INTERVAL,
+                ) as websocket:
+                    logger.info(f"Successfully connected to Binance WebSocket ({url})")
+                    link.on_connect()
+                    if not feed.connected and feed.reconnects:
+                        self.spawn(self.backfill_candles(CANDLE_SYMBOL_USD))
+                    feed.connected = True
+
+                    await self.receive_ticks(
+                        websocket, link, feed, self.binance_trades
+                    )
 
-    async def fetch_binance_24h_change(self):
-        """바이낸스 24시간 변동률 조회"""
-        try:
-            url = "https://api.binance.com/api/v3/ticker/24hr"
-            params = {"symbol": "BTCUSDT"}
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        change_rate = float(data["priceChangePercent"])
-                        self.current_prices["change_24h"]["usd"] = round(change_rate, 2)
-        except Exception as e:
-            logger.error(f"Failed to fetch Binance 24h change: {str(e)}")
+            except Exception as e:
+                logger.error(f"Binance WebSocket error ({link.name}): {str(e)}")
+            # 다른 연결이 살아 있으면 논리 피드는 연결 상태 유지
+            feed.connected = any(
+                other.connected for other in self.binance_links if other is not link
+            )
+            if not feed.connected:
+                feed.reconnects += 1
+            await self.wait_before_reconnect(link)
+
+    def apply_tick(self, source: str, data: Dict[str, Any]):
+        """수신한 거래소 이벤트를 현재 가격에 반영"""
+        if source == "upbit":
+            self.apply_upbit_event(data)
+        elif source == "binance":
+            self.apply_binance_event(data)
+
+    def apply_upbit_event(self, data: Dict[str, Any]):
+        """업비트 체결/티커 이벤트 반영"""
+        fields = self.upbit_fields
+        event = data[fields["type"]]
+        if event == "trade":
+            price = float(data[fields["trade_price"]])
+            qty = float(data[fields["trade_volume"]])
+            trade_time = data[fields["trade_timestamp"]]
+            self.snapshot.update(krw=price, timestamp_ms=trade_time)
+            self.history_volume["krw"] += qty
+            closed = self.candles.on_trade(CANDLE_SYMBOL_KRW, trade_time, price, qty)
+            for interval, candle in closed:
+                self.on_candle_closed(CANDLE_SYMBOL_KRW, interval, candle)
+        elif event == "ticker":
+            # 부호 있는 변동률 사용 (change_rate는 하락 시에도 양수)
+            change_rate = float(data[fields["signed_change_rate"]]) * 100
+            self.snapshot.update_in("change_24h", "krw", round(change_rate, 2))
+            # 티커의 high_price/low_price는 KST 당일(00시 기준) 값이므로 24시간 고가/저가는 1시간 봉에서 계산
+            ticker = dict(self.snapshot.ticker_24h["krw"])
+            ticker["volume"] = float(data[fields["acc_trade_volume_24h"]])
+            high_low = self.candles.get(CANDLE_SYMBOL_KRW, "1h").high_low(
+                TICKER_24H_WINDOW_MS
+            )
+            if high_low is not None:
+                ticker["high"], ticker["low"] = high_low
+            self.snapshot.update_in("ticker_24h", "krw", ticker)
+
+    def apply_binance_event(self, data: Dict[str, Any]):
+        """바이낸스 결합 스트림 이벤트 반영 (체결, 24시간 티커, ETH 티커, 캔들 거래량)"""
+        event = data["e"]
+        if event == "trade":
+            price = float(data["p"])
+            qty = float(data["q"])
+            trade_time = data["T"]
+            # 중복 제거 범위 안에서 늦게 도착한 체결은 거래량/고저가에만 반영
+            latest = trade_time >= self.binance_last_trade_ms
+            if latest:
+                self.binance_last_trade_ms = trade_time
+                self.snapshot.update(usd=price, timestamp_ms=trade_time)
+            self.history_volume["usd"] += qty
+            closed = self.candles.on_trade(
+                CANDLE_SYMBOL_USD, trade_time, price, qty, update_close=latest
+            )
+            for interval, candle in closed:
+                self.on_candle_closed(CANDLE_SYMBOL_USD, interval, candle)
+        elif event == "24hrTicker":
+            self.snapshot.update_in("change_24h", "usd", round(float(data["P"]), 2))
+        elif event == "24hrMiniTicker":
+            self.eth_usd = float(data["c"])
+            if self.snapshot.usd > 0:
+                self.snapshot.update(
+                    eth_btc_ratio=round(self.eth_usd / self.snapshot.usd, 6)
+                )
+        elif event == "kline":
+            kline = data["k"]
+            key = BINANCE_KLINE_VOLUME_KEYS.get(kline["i"])
+            if key is not None:
+                # 현재 진행 중인 캔들의 누적 거래량 (BTC 개수)
+                self.snapshot.update_in("volume", key, float(kline["v"]))
+
+    def on_candle_closed(self, symbol: str, interval: str, candle):
+        """캔들 확정 시 증분 지표 갱신"""
+        if symbol == CANDLE_SYMBOL_USD and interval in self.rsi_engines:
+            series = self.candles.get(symbol, interval)
+            last = series.last_closed()
+            if last is not None and last[OPEN_TIME] != candle[OPEN_TIME]:
+                # 체결 공백으로 평평한 캔들이 채워졌으면 시계열로 다시 계산
+                self.rsi_engines[interval].seed(series.closes())
+            else:
+                self.rsi_engines[interval].update(candle[CLOSE])
+
+        if interval == "1d":
+            series = self.candles.get(symbol, interval)
+            gap = series.last_closed()[OPEN_TIME] != candle[OPEN_TIME]
+            if gap:
+                self.seed_extremes(symbol)
+            else:
+                for tracker in self.extremes[symbol].values():
+                    tracker.update(candle[OPEN_TIME], candle[HIGH], candle[LOW])
+
+        if symbol == CANDLE_SYMBOL_USD and interval == "1d":
+            if gap:
+                self.seed_moving_averages()
+            else:
+                self.update_moving_averages(candle[CLOSE])
+            # 일봉 확정 시에만 MA 알림 체크 및 시장 진단 수행
+            self.spawn(self.refresh_ma_cross())
+
+    def seed_indicators(self, symbol: str):
+        """백필된 캔들로 증분 지표 상태 초기화"""
+        self.seed_extremes(symbol)
+        if symbol == CANDLE_SYMBOL_USD:
+            for interval, engine in self.rsi_engines.items():
+                engine.seed(self.candles.get(symbol, interval).closes())
+            self.update_live_rsi()
+            self.seed_moving_averages()
+
+    def seed_moving_averages(self):
+        """확정 일봉 시계열로 이동평균 상태 초기화 (백필 후, 체결 공백 발생 시)"""
+        closes = self.candles.get(CANDLE_SYMBOL_USD, "1d").closes()
+        for period in MA_PERIODS:
+            self.ma_sma[period].seed(closes[-period:])
+            self.ma_ema[period].seed(closes)
+        self.update_ma_confirmed()
+
+    def update_moving_averages(self, close: float):
+        """일봉 확정 시 이동평균 누적 합계/EMA를 O(1)로 갱신"""
+        for period in MA_PERIODS:
+            self.ma_sma[period].update(close)
+            self.ma_ema[period].update(close)
+        self.update_ma_confirmed()
+
+    def update_ma_confirmed(self):
+        """마지막 확정 일봉 기준 MA 돌파 상태 재계산"""
+        closes = self.candles.get(CANDLE_SYMBOL_USD, "1d").closes(2)
+        if len(closes) < 2:
+            return
+        self.ma_confirmed = {
+            period: ma_cross_status(self.ma_sma[period].value, list(closes))
+            for period in MA_PERIODS
+            if self.ma_sma[period].value is not None
+        }
+        self.update_live_ma_cross()
+
+    def update_live_ma_cross(self):
+        """
+        현재가 기준 잠정 MA 돌파 상태 갱신.
+        confirmed_*는 마지막 일봉 확정 시점 상태, provisional_*는 (전일 종가, 현재가) 기준입니다.
+        """
+        series = self.candles.get(CANDLE_SYMBOL_USD, "1d")
+        price = self.snapshot.usd
+        if price <= 0 and series.current is not None:
+            # 피드 연결 전에는 백필된 진행 중 일봉 종가 사용
+            price = series.current[CLOSE]
+        last = series.last_closed()
+        if price <= 0 or last is None or len(self.ma_confirmed) < len(MA_PERIODS):
+            return
+
+        ma_results = {}
+        for period in MA_PERIODS:
+            live = ma_cross_status(
+                self.ma_sma[period].provisional(price), [last[CLOSE], price]
+            )
+            confirmed = self.ma_confirmed[period]
+            ma_results[period] = {
+                "ma_value": live["ma_value"],
+                "ema_value": self.ma_ema[period].provisional(price),
+                "threshold_up": live["threshold_up"],
+                "threshold_down": live["threshold_down"],
+                "confirmed_up": confirmed["confirmed_up"],
+                "confirmed_down": confirmed["confirmed_down"],
+                "provisional_up": live["confirmed_up"],
+                "provisional_down": live["confirmed_down"],
+            }
 
-    async def connect_binance(self):
-        """바이낸스 WebSocket 연결 및 데이터 처리"""
-        logger.info("Connecting to Binance WebSocket...")
+        previous = self.snapshot.ma_cross or {}
+        self.snapshot.update(
+            ma_cross={
+                "price": price,
+                "timestamp": int(time.time()),
+                "ma_results": ma_results,
+                # 진단은 일봉 확정 시에만 갱신 (관리자 수정 값 유지)
+                "market_diagnosis": previous.get("market_diagnosis"),
+            }
+        )
+
+    def seed_extremes(self, symbol: str):
+        """확정 일봉으로 기간별 최고가/최저가 추적 상태 초기화"""
+        candles = self.candles.get(symbol, "1d").closed()[:, [OPEN_TIME, HIGH, LOW]]
+        for tracker in self.extremes[symbol].values():
+            if tracker.window_ms is None:
+                # 사상 최고/최저는 메모리 캔들 범위 밖의 이력(backfill_all_time_extremes)을 유지
+                tracker.extend(candles.tolist())
+            else:
+                tracker.seed(candles.tolist())
+        self.update_live_extremes()
+
+    def update_live_extremes(self):
+        """진행 중인 일봉의 고가/저가를 포함한 기간별 최고가/최저가 갱신"""
+        extremes: Dict[str, Dict[str, Any]] = {}
+        for currency, symbol in (("krw", CANDLE_SYMBOL_KRW), ("usd", CANDLE_SYMBOL_USD)):
+            series = self.candles.get(symbol, "1d")
+            if series.last_closed() is None:
+                continue  # 백필 전에는 진행 중 일봉만으로 기간 최고/최저를 만들지 않음
+            current = series.current
+            live_high = live_low = None
+            if current is not None:
+                live_high = (current[OPEN_TIME], current[HIGH])
+                live_low = (current[OPEN_TIME], current[LOW])
+            for name, tracker in self.extremes[symbol].items():
+                high = tracker.high(live_high)
+                low = tracker.low(live_low)
+                if high is None or low is None:
+                    continue
+                extremes.setdefault(name, {})[currency] = {
+                    "high": high[1],
+                    "high_time": int(high[0]),
+                    "low": low[1],
+                    "low_time": int(low[0]),
+                }
+        self.snapshot.update(extremes=extremes)
+
+        # 기존 3주 최고가 필드 유지
+        high_3w = extremes.get("3w", {})
+        if "krw" in high_3w and "usd" in high_3w:
+            self.snapshot.update(
+                high_3w={
+                    "krw": high_3w["krw"]["high"],
+                    "usd": high_3w["usd"]["high"],
+                    "krw_timestamp": datetime.fromtimestamp(
+                        high_3w["krw"]["high_time"] / 1000
+                    ).isoformat(),
+                    "usd_timestamp": datetime.fromtimestamp(
+                        high_3w["usd"]["high_time"] / 1000
+                    ).isoformat(),
+                }
+            )
+
+    def update_live_rsi(self):
+        """진행 중인 캔들의 현재가로 잠정 RSI 갱신 (O(1), 상태 변경 없음)"""
+        for interval, engine in self.rsi_engines.items():
+            current = self.candles.get(CANDLE_SYMBOL_USD, interval).current
+            value = (
+                engine.provisional(current[CLOSE])
+                if current is not None
+                else engine.value
+            )
+            if value is not None:
+                self.snapshot.update_in("rsi", interval, round(value, 2))
+
+    async def process_ticks(self):
+        """핸드오프 큐의 틱을 소비하여 가격 반영, 김치 프리미엄 계산, 브로드캐스트 수행"""
         while self.running:
             try:
-                async with websockets.connect(BINANCE_WS_URL) as websocket:
-                    logger.info("Successfully connected to Binance WebSocket")
-                    await self.fetch_binance_24h_change()
-
-                    while self.running:
-                        data = await websocket.recv()
-                        data = json.loads(data)
-                        self.current_prices["usd"] = float(data["p"])
-                        self.current_prices["timestamp"] = datetime.now().isoformat()
-
-                        # 브로드캐스트 주기와 관계없이 항상 알림 체크
-                        if self.current_prices["krw"] > 0:
-                            self.current_prices["kimchi_premium"] = (
-                                await self.calculate_kimchi_premium(
-                                    self.current_prices["krw"],
-                                    self.current_prices["usd"],
-                                )
-                            )
-
-                        # 알림 체크는 항상 실행
-                        await self.broadcast(self.current_prices)
-
+                batch = await self.tick_queue.get_batch()
+                for source, data in batch:
+                    self.apply_tick(source, data)
+                self.update_live_rsi()
+                self.update_live_ma_cross()
+                self.update_live_extremes()
+
+                feeds = self.update_feed_status()
+                # 멈춘 피드의 가격으로 김치 프리미엄을 계산하지 않음
+                snapshot = self.snapshot
+                if (
+                    snapshot.krw > 0
+                    and snapshot.usd > 0
+                    and not feeds["upbit"]["stale"]
+                    and not feeds["binance"]["stale"]
+                ):
+                    snapshot.update(
+                        kimchi_premium=await self.calculate_kimchi_premium(
+                            snapshot.krw, snapshot.usd
+                        )
+                    )
+
+                self.record_price_history()
+
+                # 알림 체크는 항상 실행
+                await self.broadcast(snapshot.to_dict())
+                self.log_tick_drops()
             except Exception as e:
-                logger.error(f"Binance WebSocket error: {str(e)}")
-                await asyncio.sleep(RECONNECT_DELAY)
+                logger.error(f"Tick processing error: {str(e)}")
+
+    def record_price_history(self):
+        """현재 가격과 누적 체결량을 초 단위 이력에 기록 (리더 전용)"""
+        snapshot = self.snapshot
+        if self.price_history is None or snapshot.krw <= 0 or snapshot.usd <= 0:
+            return
+        self.price_history.record(
+            int(time.time()),
+            snapshot.krw,
+            snapshot.usd,
+            snapshot.kimchi_premium,
+            self.history_volume["krw"],
+            self.history_volume["usd"],
+        )
+        self.history_volume["krw"] = 0.0
+        self.history_volume["usd"] = 0.0
+
+    def get_price_history(self) -> Optional[PriceHistory]:
+        """초 단위 가격 이력 (팔로워는 리더의 공유 메모리 세그먼트에 연결)"""
+        if self.price_history is None and self.role == "follower":
+            self.price_history = PriceHistory.attach(SHM_PRICE_HISTORY_NAME)
+        return self.price_history
+
+    def update_feed_status(self) -> Dict[str, Dict[str, Any]]:
+        """스냅샷의 피드 상태 갱신"""
+        feeds = {name: health.status() for name, health in self.feed_health.items()}
+        self.snapshot.update(feeds=feeds)
+        return feeds
+
+    def log_tick_drops(self):
+        """처리가 수신 속도를 따라가지 못해 버려진 틱이 있으면 주기적으로 경고"""
+        dropped = self.tick_queue.dropped
+        if dropped == self.last_logged_drops:
+            return
+        now = datetime.now()
+        if (now - self.last_drop_log_time).total_seconds() >= TICK_DROP_LOG_INTERVAL:
+            logger.warning(
+                f"Tick queue overflow: {dropped - self.last_logged_drops} ticks dropped "
+                f"(stats: {self.tick_queue.stats()})"
+            )
+            self.last_logged_drops = dropped
+            self.last_drop_log_time = now
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """스트림 처리 상태 (큐 깊이, 드롭 카운터, 클라이언트 수)"""
+        return {
+            "role": self.role,
+            "feeds": {
+                name: health.status() for name, health in self.feed_health.items()
+            },
+            "binance_links": [link.status() for link in self.binance_links],
+            "binance_trades": self.binance_trades.stats(),
+            "tick_queue": self.tick_queue.stats(),
+            "candles": self.candles.stats(),
+            "clients": len(self.clients),
+            "sse_clients": len(self.sse_clients),
+            "trade_tape": self.trade_tape.stats() if self.trade_tape else None,
+            "startup": self.startup.status() if self.startup else None,
+            "followers": len(self.publisher.followers),
+        }
+
+    def get_scheduler_status(self) -> Optional[Dict[str, Any]]:
+        """주기 작업 상태 (팔로워는 리더가 기록한 상태 파일을 읽음)"""
+        if self.role == "leader":
+            return self.scheduler.status()
+        return JobScheduler.read_status(SCHEDULER_STATUS_PATH)
 
     async def broadcast(self, message: Dict[str, Any]):
         """연결된 모든 클라이언트에게 메시지 전송 및 알림 체크"""
@@ -210,90 +745,330 @@ class PriceStreamService:
             logger.error(f"Error checking alerts: {str(e)}")
             logger.exception(e)
 
-        # 클라이언트가 있을 때만 메시지 전송 (1초 주기 제한)
-        if self.clients:
-            now = datetime.now()
-            if (
-                now - self.last_broadcast_time
-            ).total_seconds() >= self.broadcast_interval:
-                disconnected_clients = set()
-                message_str = json.dumps(message)
-                for client in self.clients:
-                    try:
-                        await client.send_text(message_str)
-                    except Exception as e:
-                        logger.error(f"Failed to send message to client: {str(e)}")
-                        disconnected_clients.add(client)
-                self.clients -= disconnected_clients
-                self.last_broadcast_time = now
-
-    async def add_client(self, websocket: websockets.WebSocketServerProtocol):
-        """새로운 클라이언트 연결 추가"""
-        self.clients.add(websocket)
-        logger.info(f"New client connected. Total clients: {len(self.clients)}")
-
-        # 현재 가격 즉시 전송
+        # 클라이언트/팔로워 전송 (1초 주기 제한)
+        now = datetime.now()
+        if (now - self.last_broadcast_time).total_seconds() >= self.broadcast_interval:
+            # 마지막 전송 이후 변경이 없으면 생략
+            if self.snapshot.version == self.last_broadcast_version:
+                return
+            # 직렬화는 스냅샷 버전당 한 번, 압축은 인코딩별로 한 번만 수행
+            frame = EncodedFrame.from_payload(
+                self.snapshot.payload(), self.snapshot.to_dict()
+            )
+            self.write_shared_snapshot(frame.payload)
+            self.publisher.publish(frame.payload)
+            await self.fan_out(frame)
+            self.last_broadcast_time = now
+            self.last_broadcast_version = self.snapshot.version
+
+    def write_shared_snapshot(self, payload: bytes):
+        """공유 메모리 스냅샷 갱신 (리더 전용)"""
+        if self.shared_snapshot is None or not self.shared_snapshot.owner:
+            return
+        try:
+            snapshot = self.snapshot
+            self.shared_snapshot.write(
+                (
+                    float(snapshot.krw),
+                    float(snapshot.usd),
+                    float(snapshot.kimchi_premium),
+                    float(snapshot.change_24h["krw"]),
+                    float(snapshot.change_24h["usd"]),
+                    snapshot.updated_ms,
+                ),
+                payload,
+            )
+        except Exception as e:
+            logger.error(f"Failed to write shared snapshot: {str(e)}")
+
+    def get_shared_snapshot(self):
+        """팔로워: 공유 메모리 세그먼트 연결 (리더가 아직 생성하지 않았으면 None)"""
+        if self.shared_snapshot is None and self.role == "follower":
+            self.shared_snapshot = SharedSnapshot.attach(SHM_SNAPSHOT_NAME)
+        return self.shared_snapshot
+
+    def update_snapshot(self, **fields: Any) -> bool:
+        """
+        스냅샷 필드 변경 (라우터 등 외부에서의 변경은 반드시 이 메서드를 사용).
+        팔로워에서는 리더에게도 전달하여 다음 스냅샷 발행 시 덮어써지지 않게 합니다.
+        """
+        self.forward_to_leader({"fields": fields})
+        return self.snapshot.update(**fields)
+
+    def update_snapshot_item(self, field: str, key: str, value: Any) -> bool:
+        """스냅샷 중첩 필드의 항목 변경"""
+        self.forward_to_leader({"item": [field, key, value]})
+        return self.snapshot.update_in(field, key, value)
+
+    def forward_to_leader(self, message: Dict[str, Any]):
+        """팔로워: 스냅샷 변경을 리더에게 전달"""
+        if self.role != "follower" or self.leader_channel is None:
+            return
+        try:
+            self.leader_channel.write(serializer.dumps_bytes(message) + b"\n")
+        except Exception as e:
+            logger.error(f"Failed to forward snapshot update to leader: {str(e)}")
+
+    def apply_follower_update(self, line: bytes):
+        """리더: 팔로워가 전달한 스냅샷 변경 반영"""
+        message = serializer.loads(line)
+        fields = {
+            name: value
+            for name, value in (message.get("fields") or {}).items()
+            if name in SNAPSHOT_FIELDS
+        }
+        if fields:
+            self.snapshot.update(**fields)
+        if message.get("item"):
+            field, key, value = message["item"]
+            if field in SNAPSHOT_FIELDS:
+                self.snapshot.update_in(field, key, value)
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """
+        현재 스냅샷 조회.
+        팔로워는 공유 메모리에서 리더의 최신 스냅샷을 읽고, 그 외에는 로컬 스냅샷을 반환합니다.
+        """
+        if self.role == "follower":
+            shared = self.get_shared_snapshot()
+            if shared is not None:
+                snapshot = shared.read()
+                if snapshot is not None:
+                    return snapshot
+        return self.snapshot.to_dict()
+
+    async def fan_out(self, frame: EncodedFrame):
+        """연결된 모든 클라이언트에게 프레임 전송"""
+        self.recent_frames.append(frame)
+        for queue in list(self.sse_clients):
+            self.offer_sse_frame(queue, frame)
+        if not self.clients:
+            return
+        disconnected_clients = set()
+        for client, encoding in list(self.clients.items()):
+            try:
+                await frame.send(client, encoding)
+            except Exception as e:
+                logger.error(f"Failed to send message to client: {str(e)}")
+                disconnected_clients.add(client)
+        for client in disconnected_clients:
+            self.clients.pop(client, None)
+
+    async def add_client(
+        self,
+        websocket: websockets.WebSocketServerProtocol,
+        encoding: str = ENCODING_JSON,
+        resume: Optional[str] = None,
+    ):
+        """
+        새로운 클라이언트 연결 추가.
+        resume("epoch-version")으로 마지막 수신 프레임을 알려주면 그 이후 변경분(델타)만 보내고,
+        최근 프레임 버퍼에 없으면 전체 스냅샷(키프레임)을 보냅니다.
+        """
+        self.clients[websocket] = encoding
+        logger.info(
+            f"New client connected ({encoding}). Total clients: {len(self.clients)}"
+        )
+
         try:
-            await websocket.send_text(json.dumps(self.current_prices))
+            frame = self.resume_frame(resume) if resume else None
+            if frame is None:
+                frame = self.current_frame()
+            await frame.send(websocket, encoding)
         except Exception as e:
             logger.error(f"Failed to send initial prices to client: {str(e)}")
 
+    def resume_frame(self, resume: str) -> Optional[EncodedFrame]:
+        """resume 기준 프레임 이후의 델타 프레임 (기준 프레임이 버퍼에 없으면 None)"""
+        frames = list(self.recent_frames)
+        for frame in reversed(frames):
+            if frame.event_id() == resume:
+                return frames[-1].delta(frame.data().get("version", 0))
+        return None
+
+    def current_frame(self) -> EncodedFrame:
+        """현재 스냅샷 프레임 (팔로워는 공유 메모리의 직렬화된 스냅샷을 그대로 사용)"""
+        if self.role == "follower" and self.get_shared_snapshot() is not None:
+            shared = self.shared_snapshot.read_payload()
+            if shared is not None:
+                return EncodedFrame.from_payload(shared[1])
+        return EncodedFrame.from_payload(
+            self.snapshot.payload(), self.snapshot.to_dict()
+        )
+
+    def add_sse_client(
+        self, fields: Optional[Tuple[str, ...]], last_event_id: Optional[str] = None
+    ) -> Tuple[asyncio.Queue, List[EncodedFrame], Optional[EncodedFrame]]:
+        """
+        SSE 클라이언트 등록. (수신 큐, 처음 보낼 프레임 목록, 클라이언트가 마지막으로 받은 프레임)을
+        반환합니다. Last-Event-ID가 최근 프레임 버퍼에 있으면 그 이후 프레임을 재전송하고,
+        없으면(다른 리더의 ID, 버퍼 밖) 현재 스냅샷 한 건으로 다시 시작합니다.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_CLIENT_QUEUE_SIZE)
+        self.sse_clients[queue] = fields
+        logger.info(
+            f"New SSE client connected. Total SSE clients: {len(self.sse_clients)}"
+        )
+
+        if last_event_id:
+            frames = list(self.recent_frames)
+            for index, frame in enumerate(frames):
+                if frame.event_id() == last_event_id:
+                    return queue, frames[index + 1 :], frame
+        return queue, [self.current_frame()], None
+
+    def offer_sse_frame(self, queue: asyncio.Queue, frame: Optional[EncodedFrame]):
+        """SSE 큐에 프레임 추가 (가득 차면 가장 오래된 프레임을 버림)"""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(frame)
+
+    def remove_sse_client(self, queue: asyncio.Queue):
+        self.sse_clients.pop(queue, None)
+        logger.info(
+            f"SSE client disconnected. Total SSE clients: {len(self.sse_clients)}"
+        )
+
     async def remove_client(self, websocket: websockets.WebSocketServerProtocol):
         """클라이언트 연결 제거"""
-        self.clients.remove(websocket)
+        self.clients.pop(websocket, None)
         logger.info(f"Client disconnected. Total clients: {len(self.clients)}")
 
-    async def update_rsi(self, interval: str):
-        """특정 간격의 RSI 업데이트"""
-        try:
-            rsi_data = await indicator_service.calculate_rsi("BTC", interval, 14)
-            self.current_prices["rsi"][interval] = round(float(rsi_data["rsi"]), 2)
-            logger.debug(
-                f"Updated RSI for interval {interval}: {self.current_prices['rsi'][interval]}"
+    async def backfill_candles(self, symbol: str = None):
+        """REST로 캔들 저장소 백필 (symbol 미지정 시 전체 심볼)"""
+        symbols = [symbol] if symbol else [CANDLE_SYMBOL_KRW, CANDLE_SYMBOL_USD]
+        for target in symbols:
+            for interval, limit in CANDLE_BACKFILL.items():
+                try:
+                    if target == CANDLE_SYMBOL_KRW:
+                        rows = await self.fetch_upbit_candle_rows(interval, limit)
+                    else:
+                        candles = await exchange_service.get_binance_candles(
+                            target, interval, limit
+                        )
+                        rows = [self.candle_row(c, utc=False) for c in candles]
+                    if rows:
+                        self.candles.get(target, interval).load(rows)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to backfill {target} {interval} candles: {str(e)}"
+                    )
+            self.seed_indicators(target)
+        logger.info(f"Candle backfill completed: {self.candles.stats()}")
+
+    async def backfill_all_time_extremes(self, symbol: str):
+        """
+        거래소의 전체 일봉 이력으로 사상 최고가/최저가 추적 상태 확장.
+        페이지 조회가 재시도 후에도 실패하면 일부 이력으로 초기화하지 않고 예외를 전달합니다. (시작 단계 실패 처리)
+        """
+        if symbol == CANDLE_SYMBOL_KRW:
+            rows = await self.fetch_upbit_candle_rows("1d", None)
+        else:
+            rows = await self.fetch_binance_candle_rows(symbol, "1d", None)
+        candles = [(row[0], row[2], row[3]) for row in reversed(rows)]
+        for tracker in self.extremes[symbol].values():
+            if tracker.window_ms is None:
+                tracker.extend(candles)
+        self.update_live_extremes()
+        logger.info(f"All-time extremes seeded from {len(candles)} {symbol} daily candles")
+
+    async def fetch_binance_candle_rows(
+        self, symbol: str, interval: str, limit: Optional[int]
+    ):
+        """바이낸스 캔들을 요청당 최대 개수씩 나눠 과거 방향으로 조회 (limit=None이면 전체 이력)"""
+        rows = []
+        end_time = None
+        while limit is None or len(rows) < limit:
+            page_size = BINANCE_CANDLE_PAGE_SIZE
+            if limit is not None:
+                page_size = min(page_size, limit - len(rows))
+            candles = await self.fetch_candle_page(
+                exchange_service.get_binance_candles,
+                symbol,
+                interval,
+                page_size,
+                end_time,
+            )
+            if not candles:
+                break
+            page = [self.candle_row(c, utc=False) for c in candles]
+            # 바이낸스는 오래된 캔들부터 반환하므로 최신 순으로 뒤집어 이어 붙임 (업비트와 같은 순서)
+            rows.extend(reversed(page))
+            end_time = page[0][0] - 1
+            if len(candles) < page_size:
+                break
+        return rows
+
+    async def fetch_upbit_candle_rows(self, interval: str, limit: Optional[int]):
+        """업비트 캔들을 요청당 최대 개수씩 나눠 과거 방향으로 조회 (limit=None이면 전체 이력)"""
+        rows = []
+        to = None
+        while limit is None or len(rows) < limit:
+            page_size = UPBIT_CANDLE_PAGE_SIZE
+            if limit is not None:
+                page_size = min(page_size, limit - len(rows))
+            candles = await self.fetch_candle_page(
+                exchange_service.get_upbit_candles,
+                CANDLE_SYMBOL_KRW,
+                interval,
+                page_size,
+                to,
             )
+            if not candles:
+                break
+            rows.extend(self.candle_row(c, utc=True) for c in candles)
+            # 업비트는 최신 캔들부터 반환하므로 마지막 캔들 시각 이전을 이어서 조회
+            to = candles[-1]["timestamp"] + "Z"
+            if len(candles) < UPBIT_CANDLE_PAGE_SIZE:
+                break
+        return rows
+
+    @staticmethod
+    async def fetch_candle_page(fetch, *args) -> List[Dict[str, Any]]:
+        """
+        캔들 한 페이지 조회. 실패(429/5xx, 네트워크 오류)를 빈 페이지(이력 끝)로 취급하면 이력이 조용히 잘리므로
+        지수 백오프로 재시도하고, 마지막 시도도 실패하면 예외를 전달합니다.
+        """
+        for attempt in range(CANDLE_PAGE_RETRIES + 1):
+            try:
+                return await fetch(*args, strict=True)
+            except Exception:
+                if attempt == CANDLE_PAGE_RETRIES:
+                    raise
+                await asyncio.sleep(
+                    backoff_delay(attempt, CANDLE_PAGE_RETRY_DELAY, CANDLE_PAGE_RETRIES)
+                )
 
-            # RSI 업데이트 시마다 알림 체크
+    @staticmethod
+    def candle_row(candle: Dict[str, Any], utc: bool):
+        """exchange_service 캔들 -> (open_time_ms, open, high, low, close, volume)"""
+        return (
+            parse_candle_time(candle["timestamp"], utc),
+            candle["open"],
+            candle["high"],
+            candle["low"],
+            candle["close"],
+            candle["volume"],
+        )
+
+    async def check_rsi_alerts(self):
+        """현재 RSI로 RSI 알림 체크"""
+        try:
             async with async_session() as session:
-                await alert_service.check_rsi_alerts(session, self.current_prices)
-
+                await alert_service.check_rsi_alerts(session, self.snapshot.to_dict())
         except Exception as e:
-            logger.error(f"Failed to update RSI for interval {interval}: {str(e)}")
-
-    async def update_all_rsi(self):
-        """모든 간격의 RSI 초기 업데이트"""
-        for interval in ["15m", "1h", "4h", "1d"]:
-            await self.update_rsi(interval)
-
-    async def start_rsi_updates(self):
-        """RSI 주기적 업데이트"""
-        while self.running:
-            try:
-                # 모든 간격의 RSI를 1분마다 업데이트
-                for interval in ["15m", "1h", "4h", "1d"]:
-                    await self.update_rsi(interval)
-                await asyncio.sleep(60)  # 1분 대기
-            except Exception as e:
-                logger.error(f"RSI 업데이트 중 오류 발생: {str(e)}")
-                await asyncio.sleep(10)  # 오류 발생시 10초 대기
+            logger.error(f"Failed to check RSI alerts: {str(e)}")
+            raise
 
     async def update_dominance(self):
         """도미넌스 업데이트"""
         try:
             dominance_data = await indicator_service.get_btc_dominance()
-            self.current_prices["dominance"] = dominance_data["dominance"]
-            logger.info(f"Updated Dominance: {self.current_prices['dominance']}")
+            self.snapshot.update(dominance=dominance_data["dominance"])
+            logger.info(f"Updated Dominance: {self.snapshot.dominance}")
         except Exception as e:
             logger.error(f"Failed to update Dominance: {str(e)}")
-
-    async def start_dominance_updates(self):
-        """도미넌스 주기적 업데이트 (60분마다)"""
-        while self.running:
-            try:
-                await self.update_dominance()
-                await asyncio.sleep(60 * 60)  # 60분 대기
-            except Exception as e:
-                logger.error(f"Error in Dominance update: {str(e)}")
-                await asyncio.sleep(60)
+            raise
 
     async def update_mvrv(self):
         """MVRV 업데이트"""
@@ -301,100 +1076,37 @@ class PriceStreamService:
             # db 세션 생성
             async with async_session() as session:
                 mvrv_data = await indicator_service.get_mvrv(session)
-                self.current_prices["mvrv"] = mvrv_data["mvrv"]
-                logger.info(f"Updated MVRV: {self.current_prices['mvrv']}")
+                self.snapshot.update(mvrv=mvrv_data["mvrv"])
+                logger.info(f"Updated MVRV: {self.snapshot.mvrv}")
         except Exception as e:
             logger.error(f"Failed to update MVRV: {str(e)}")
+            raise
 
-    async def start_mvrv_updates(self):
-        """MVRV 주기적 업데이트 (60분마다)"""
-        while self.running:
-            try:
-                await self.update_mvrv()
-                await asyncio.sleep(60 * 60)  # 60분 대기
-            except Exception as e:
-                logger.error(f"Error in MVRV update: {str(e)}")
-                await asyncio.sleep(60)
-
-    async def update_3w_high(self):
-        """3주 최고가 업데이트"""
+    async def refresh_ma_cross(self):
+        """이동평균선 시장 진단 갱신 및 MA 알림 체크 (시작 시, 일봉 확정 시)"""
         try:
-            # 바이낸스와 업비트에서 3주치 일봉 데이터 조회
-            candles_upbit = await exchange_service.get_upbit_candles(
-                "KRW-BTC", "1d", 21
-            )  # 3주 = 21일
-            candles_binance = await exchange_service.get_binance_candles(
-                "BTCUSDT", "1d", 21
+            self.update_live_ma_cross()
+            ma_data = self.snapshot.ma_cross
+            if not ma_data:
+                logger.warning("Not enough daily candles for MA cross")
+                return
+
+            diagnosis = await analyze_market_state(
+                ma_data["ma_results"], ma_data["price"]
             )
+            self.snapshot.update_in("ma_cross", "market_diagnosis", diagnosis)
+            logger.info("MA cross diagnosis updated")
 
-            if candles_upbit and candles_binance:
-                # KRW 최고가 계산
-                krw_high = max(float(candle["high"]) for candle in candles_upbit)
-                krw_high_candle = max(candles_upbit, key=lambda x: float(x["high"]))
-
-                # USD 최고가 계산
-                usd_high = max(float(candle["high"]) for candle in candles_binance)
-                usd_high_candle = max(candles_binance, key=lambda x: float(x["high"]))
-
-                self.current_prices["high_3w"] = {
-                    "krw": krw_high,
-                    "usd": usd_high,
-                    "krw_timestamp": krw_high_candle["timestamp"],
-                    "usd_timestamp": usd_high_candle["timestamp"],
-                }
-
-                logger.info(
-                    f"3주 최고가 업데이트 - KRW: {krw_high:,.0f}, USD: {usd_high:,.2f}"
-                )
-
-        except Exception as e:
-            logger.error(f"3주 최고가 업데이트 중 오류 발생: {str(e)}")
-
-    async def start_3w_high_updates(self):
-        """3주 최고가 주기적 업데이트 (24시간마다)"""
-        while self.running:
-            try:
-                await self.update_3w_high()
-                await asyncio.sleep(24 * 60 * 60)  # 24시간 대기
-            except Exception as e:
-                logger.error(f"3주 최고가 업데이트 태스크 오류: {str(e)}")
-                await asyncio.sleep(60)  # 오류 발생시 1분 후 재시도
-
-    async def update_ma_cross(self):
-        """이동평균선 돌파 여부 업데이트"""
-        try:
-            ma_data = await check_ma_cross_all()
-            if "error" not in ma_data:
-                # 캐시에 MA 크로스 데이터 저장
-                self.current_prices["ma_cross"] = ma_data
-                logger.info("MA cross data cached successfully")
-
-                # DB 세션 생성 및 알림 체크만 수행
-                async with async_session() as session:
-                    await alert_service.check_ma_alerts(session, ma_data)
+            # 알림은 일봉 확정 기준 돌파 상태로 체크
+            async with async_session() as session:
+                await alert_service.check_ma_alerts(session, self.snapshot.ma_cross)
         except Exception as e:
             logger.error(f"Failed to update MA cross data: {str(e)}")
 
-    async def start_ma_cross_updates(self):
-        """이동평균선 돌파 체크 주기적 업데이트 (24시간마다)"""
-        while self.running:
-            try:
-                await self.update_ma_cross()
-                await asyncio.sleep(24 * 60 * 60)  # 24시간 대기
-            except Exception as e:
-                logger.error(f"Error in MA cross update: {str(e)}")
-                await asyncio.sleep(60)  # 오류 발생시 1분 후 재시도
-
     async def reset_manual_exchange_rate(self):
-        """수동 설정된 환율 초기화 (24시간마다)"""
-        while self.running:
-            try:
-                await exchange_service.reset_manual_rate()
-                logger.info("Manual exchange rate has been reset")
-                await asyncio.sleep(24 * 60 * 60)  # 24시간 대기
-            except Exception as e:
-                logger.error(f"Error in exchange rate reset: {str(e)}")
-                await asyncio.sleep(60)  # 오류 발생시 1분 후 재시도
+        """수동 설정된 환율 초기화 (매일)"""
+        await exchange_service.reset_manual_rate()
+        logger.info("Manual exchange rate has been reset")
 
     async def update_fear_greed(self):
         """공포/탐욕 지수 업데이트"""
@@ -402,50 +1114,24 @@ class PriceStreamService:
             # db 세션 생성
             async with async_session() as session:
                 fear_greed_data = await indicator_service.get_fear_greed_index(session)
-                self.current_prices["fear_greed"] = {
-                    "value": fear_greed_data["value"],
-                    "classification": fear_greed_data["classification"],
-                    "timestamp": fear_greed_data["timestamp"],
-                }
+                self.snapshot.update(
+                    fear_greed={
+                        "value": fear_greed_data["value"],
+                        "classification": fear_greed_data["classification"],
+                        "timestamp": fear_greed_data["timestamp"],
+                    }
+                )
                 logger.info(
-                    f"공포/탐욕 지수 업데이트: {self.current_prices['fear_greed']['value']} ({self.current_prices['fear_greed']['classification']})"
+                    f"공포/탐욕 지수 업데이트: {self.snapshot.fear_greed['value']} ({self.snapshot.fear_greed['classification']})"
                 )
 
                 # 알림 체크 부분 제거 (필요 없음)
                 # await alert_service.check_fear_greed_alerts(
-                #     session, self.current_prices
+                #     session, self.snapshot.to_dict()
                 # )
         except Exception as e:
             logger.error(f"공포/탐욕 지수 업데이트 중 오류 발생: {str(e)}")
-
-    async def update_eth_btc_ratio(self):
-        """ETH/BTC 비율 업데이트"""
-        try:
-            ratio_data = await indicator_service.get_eth_btc_ratio()
-            self.current_prices["eth_btc_ratio"] = ratio_data["ratio"]
-            logger.info(f"ETH/BTC 비율 업데이트: {self.current_prices['eth_btc_ratio']}")
-        except Exception as e:
-            logger.error(f"ETH/BTC 비율 업데이트 중 오류 발생: {str(e)}")
-
-    async def start_fear_greed_updates(self):
-        """공포/탐욕 지수 주기적 업데이트 (24시간마다)"""
-        while self.running:
-            try:
-                await self.update_fear_greed()
-                await asyncio.sleep(24 * 60 * 60)  # 24시간 대기
-            except Exception as e:
-                logger.error(f"공포/탐욕 지수 업데이트 태스크 오류: {str(e)}")
-                await asyncio.sleep(60)  # 오류 발생시 1분 후 재시도
-
-    async def start_eth_btc_ratio_updates(self):
-        """ETH/BTC 비율 주기적 업데이트 (1분마다)"""
-        while self.running:
-            try:
-                await self.update_eth_btc_ratio()
-                await asyncio.sleep(60)  # 1분 대기
-            except Exception as e:
-                logger.error(f"ETH/BTC 비율 업데이트 태스크 오류: {str(e)}")
-                await asyncio.sleep(60)  # 오류 발생시 1분 후 재시도
+            raise
 
     async def update_stablecoin_inflow_ratio(self):
         """Stablecoin Inflow Ratio 업데이트"""
@@ -453,273 +1139,274 @@ class PriceStreamService:
             # db 세션 생성
             async with async_session() as session:
                 ratio_data = await indicator_service.get_stablecoin_inflow_ratio(session)
-                self.current_prices["stablecoin_inflow_ratio"] = ratio_data["ratio"]
+                self.snapshot.update(stablecoin_inflow_ratio=ratio_data["ratio"])
                 logger.info(
-                    f"Stablecoin Inflow Ratio 업데이트: {self.current_prices['stablecoin_inflow_ratio']}"
+                    f"Stablecoin Inflow Ratio 업데이트: {self.snapshot.stablecoin_inflow_ratio}"
                 )
         except Exception as e:
             logger.error(f"Stablecoin Inflow Ratio 업데이트 중 오류 발생: {str(e)}")
-
-    async def start_stablecoin_inflow_ratio_updates(self):
-        """Stablecoin Inflow Ratio 주기적 업데이트 (1시간마다)"""
-        while self.running:
-            try:
-                await self.update_stablecoin_inflow_ratio()
-                await asyncio.sleep(60 * 60)  # 1시간 대기
-            except Exception as e:
-                logger.error(f"Stablecoin Inflow Ratio 업데이트 태스크 오류: {str(e)}")
-                await asyncio.sleep(60)  # 오류 발생시 1분 후 재시도
+            raise
 
     async def update_nupl(self):
         """NUPL 업데이트"""
         try:
             async with async_session() as db:
                 nupl_data = await indicator_service.get_nupl(db)
-                self.current_prices["nupl"] = nupl_data["nupl"]
-                logger.info(f"NUPL 업데이트: {self.current_prices['nupl']}")
+                self.snapshot.update(nupl=nupl_data["nupl"])
+                logger.info(f"NUPL 업데이트: {self.snapshot.nupl}")
         except Exception as e:
             logger.error(f"NUPL 업데이트 중 오류 발생: {str(e)}")
-
-    async def start_nupl_updates(self):
-        """NUPL 주기적 업데이트 (1시간마다)"""
-        while self.running:
-            try:
-                await self.update_nupl()
-                await asyncio.sleep(60 * 60)  # 1시간 대기
-            except Exception as e:
-                logger.error(f"NUPL 업데이트 태스크 오류: {str(e)}")
-                await asyncio.sleep(60)  # 오류 발생시 1분 후 재시도
+            raise
 
     async def update_spor(self):
         """SPOR 업데이트"""
         try:
             async with async_session() as db:
                 spor_data = await indicator_service.get_spor(db)
-                self.current_prices["spor"] = spor_data["spor"]
-                logger.info(f"SPOR 업데이트: {self.current_prices['spor']}")
+                self.snapshot.update(spor=spor_data["spor"])
+                logger.info(f"SPOR 업데이트: {self.snapshot.spor}")
         except Exception as e:
             logger.error(f"SPOR 업데이트 중 오류 발생: {str(e)}")
-
-    async def start_spor_updates(self):
-        """SPOR 주기적 업데이트 (1시간마다)"""
-        while self.running:
-            try:
-                await self.update_spor()
-                await asyncio.sleep(60 * 60)  # 1시간 대기
-            except Exception as e:
-                logger.error(f"SPOR 업데이트 태스크 오류: {str(e)}")
-                await asyncio.sleep(60)  # 오류 발생시 1분 후 재시도
+            raise
 
     async def update_asol(self):
         """ASOL 업데이트"""
         try:
             async with async_session() as db:
                 asol_data = await indicator_service.get_asol(db)
-                self.current_prices["asol"] = asol_data["asol"]
-                logger.info(f"ASOL 업데이트: {self.current_prices['asol']}")
+                self.snapshot.update(asol=asol_data["asol"])
+                logger.info(f"ASOL 업데이트: {self.snapshot.asol}")
         except Exception as e:
             logger.error(f"ASOL 업데이트 중 오류 발생: {str(e)}")
+            raise
 
-    async def start_asol_updates(self):
-        """ASOL 주기적 업데이트 (1시간마다)"""
+    async def start(self):
+        """
+        스트리밍 서비스 시작 (리더 선출 후 리더는 수집, 팔로워는 스냅샷 구독)
+        프로세스당 한 번만 시작되며, 중복 호출은 무시됩니다. (stop 이후에는 다시 시작 가능)
+        """
+        if self.running or self.role is not None:
+            logger.info("스트리밍 서비스가 이미 시작되었습니다")
+            return
+
+        self.running = True
+        if self.leader_election.try_acquire():
+            await self.start_ingest()
+        else:
+            self.role = "follower"
+            logger.info("수집 리더가 이미 존재하여 팔로워로 시작합니다")
+            self.spawn(self.follow_leader())
+
+    def restore_warm_start(self) -> Set[str]:
+        """
+        저장된 스냅샷/캔들 버퍼 복원 (리더 시작 시).
+        복원한 필드는 다시 갱신될 때까지 stale로 표시하되, 마지막 예정 갱신 이후에 저장된 지표와
+        당일 MA 시장 진단은 최신으로 보고 그 이름을 반환합니다. (시작 시 재조회 생략)
+        """
+        warm = warm_start.load(WARM_START_PATH, WARM_START_MAX_AGE)
+        if warm is None:
+            return set()
+
+        now = time.time()
+        updated = warm.snapshot.get("field_updated_ms") or {}
+        fresh = set()
+        for name in WARM_START_REFRESH_JOBS:
+            job = SCHEDULED_JOBS[name]
+            slot = previous_slot(now, job["interval"], job.get("offset", 0))
+            if name in updated and updated[name] / 1000 >= slot:
+                fresh.add(name)
+        today_ms = int(now * 1000) - int(now * 1000) % INTERVAL_MS["1d"]
+        ma_cross = warm.snapshot.get("ma_cross") or {}
+        if ma_cross.get("market_diagnosis") and warm.saved_ms >= today_ms:
+            fresh.add("ma_cross")
+
+        self.snapshot.restore(warm.snapshot, stale=set(SNAPSHOT_FIELDS) - fresh)
+        # 캔들 기반 지표(RSI, 기간 최고/최저, MA)는 복원한 확정 캔들로 다시 계산
+        self.candles.restore(warm.candles, warm.saved_ms)
+        for symbol in (CANDLE_SYMBOL_KRW, CANDLE_SYMBOL_USD):
+            self.seed_indicators(symbol)
+        logger.info(
+            f"Warm start restored (saved {now - warm.saved_ms / 1000:.0f}s ago, "
+            f"fresh: {', '.join(sorted(fresh)) or 'none'})"
+        )
+        return fresh
+
+    async def save_warm_start(self):
+        """현재 스냅샷/캔들 버퍼를 워밍 스타트 파일로 저장 (리더 전용)"""
+        await asyncio.to_thread(
+            warm_start.save,
+            WARM_START_PATH,
+            self.snapshot.payload(),
+            self.candles.dump(),
+        )
+
+    async def follow_leader(self):
+        """리더의 스냅샷을 구독하고, 리더가 사라지면 리더 선출을 다시 시도"""
         while self.running:
             try:
-                await self.update_asol()
-                await asyncio.sleep(60 * 60)  # 1시간 대기
+                await subscribe_snapshots(
+                    INGEST_SOCKET_PATH,
+                    self.apply_snapshot,
+                    on_connect=self.set_leader_channel,
+                )
             except Exception as e:
-                logger.error(f"ASOL 업데이트 태스크 오류: {str(e)}")
-                await asyncio.sleep(60)  # 오류 발생시 1분 후 재시도
-
-    async def start(self):
-        """스트리밍 서비스 시작"""
+                logger.warning(f"Snapshot channel unavailable: {str(e)}")
+            self.leader_channel = None
+
+            # 리더가 바뀌면 공유 메모리 세그먼트도 다시 연결
+            if self.shared_snapshot is not None:
+                self.shared_snapshot.close()
+                self.shared_snapshot = None
+            if self.price_history is not None:
+                self.price_history.close()
+                self.price_history = None
+
+            if not self.running:
+                break
+            if self.leader_election.try_acquire():
+                logger.info("리더 부재로 이 워커가 수집 리더를 승계합니다")
+                await self.start_ingest()
+                return
+            await asyncio.sleep(INGEST_RETRY_DELAY)
+
+    def set_leader_channel(self, writer: asyncio.StreamWriter):
+        self.leader_channel = writer
+
+    async def apply_snapshot(self, payload: bytes):
+        """리더가 발행한 스냅샷을 반영하고 이 워커의 클라이언트에게 전달"""
+        self.snapshot = MarketSnapshot.from_payload(payload)
+        await self.fan_out(
+            EncodedFrame.from_payload(payload, self.snapshot.to_dict())
+        )
+
+    async def start_ingest(self):
+        """업스트림 수집 시작 (리더 전용)"""
         try:
-            self.running = True
+            self.role = "leader"
             logger.info("WebSocket 스트리밍 서비스 시작 중...")
-
-            # 초기값 설정
-            await self.update_all_rsi()
-            await self.update_dominance()
-            await self.update_mvrv()
-            await self.update_3w_high()
-            await self.update_ma_cross()  # MA 크로스 초기값 설정
-            await self.update_fear_greed()  # 공포/탐욕 지수 초기값 설정
-            await self.update_eth_btc_ratio()  # ETH/BTC 비율 초기값 설정
-            await self.update_stablecoin_inflow_ratio()  # Stablecoin Inflow Ratio 초기값 설정
-            await self.update_nupl()  # NUPL 초기값 설정
-            await self.update_spor()  # SPOR 초기값 설정
-            await self.update_asol()  # ASOL 초기값 설정
-
-            # 기존 태스크들 시작
-            asyncio.create_task(self.start_rsi_updates())
-            asyncio.create_task(self.start_dominance_updates())
-            asyncio.create_task(self.start_mvrv_updates())
-            asyncio.create_task(self.update_24h_changes())
-            asyncio.create_task(self.start_3w_high_updates())
-            asyncio.create_task(
-                self.start_ma_cross_updates()
-            )  # MA 크로스 업데이트 태스크 추가
-            asyncio.create_task(
-                self.reset_manual_exchange_rate()
-            )  # 환율 초기화 태스크 추가
-            asyncio.create_task(
-                self.start_fear_greed_updates()
-            )  # 공포/탐욕 지수 업데이트 태스크 추가
-            asyncio.create_task(
-                self.start_eth_btc_ratio_updates()
-            )  # ETH/BTC 비율 업데이트 태스크 추가
-            asyncio.create_task(
-                self.start_stablecoin_inflow_ratio_updates()
-            )  # Stablecoin Inflow Ratio 업데이트 태스크 추가
-            asyncio.create_task(self.start_nupl_updates())  # NUPL 업데이트 태스크 추가
-            asyncio.create_task(self.start_spor_updates())  # SPOR 업데이트 태스크 추가
-            asyncio.create_task(self.start_asol_updates())  # ASOL 업데이트 태스크 추가
-            asyncio.create_task(self.connect_upbit())
-            asyncio.create_task(self.connect_binance())
+            await self.publisher.start()
+            try:
+                self.shared_snapshot = SharedSnapshot.create(
+                    SHM_SNAPSHOT_NAME, SHM_SNAPSHOT_CAPACITY
+                )
+            except Exception as e:
+                logger.error(f"Failed to create shared snapshot: {str(e)}")
+            try:
+                self.price_history = PriceHistory.create(
+                    SHM_PRICE_HISTORY_NAME, PRICE_HISTORY_SECONDS
+                )
+            except Exception as e:
+                # 공유 메모리를 쓸 수 없으면 이 워커에서만 이력 제공
+                logger.error(f"Failed to create shared price history: {str(e)}")
+                self.price_history = PriceHistory(PRICE_HISTORY_SECONDS)
+            if TRADE_TAPE_ENABLED:
+                try:
+                    self.trade_tape = TradeTape(
+                        TRADE_TAPE_DIR, TRADE_TAPE_SEGMENT_RECORDS
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to open trade tape: {str(e)}")
+
+            # 저장된 스냅샷으로 즉시 서비스 (팔로워에서 승계한 경우 리더 스냅샷을 이미 보유)
+            fresh = self.restore_warm_start() if self.snapshot.version == 0 else set()
+            # 승계한 버전 번호를 이전 리더의 ETag/재개 지점과 구분 (버전이 같아도 새 epoch로 다시 발행)
+            self.snapshot.start_epoch()
+            self.last_broadcast_version = -1
+
+            # 가격 피드를 먼저 연결 (백필 중 체결로 만들어진 진행 캔들은 백필 결과와 병합됨)
+            self.spawn(self.process_ticks())
+            self.spawn(self.connect_upbit())
+            for index in range(len(self.binance_urls)):
+                self.spawn(self.connect_binance(index))
+
+            # 초기값 설정 (동시 실행, 단계별 타임아웃)
+            startup = StartupOrchestrator(STARTUP_STEP_TIMEOUT)
+            for name, func, after in (
+                ("candles_krw", lambda: self.backfill_candles(CANDLE_SYMBOL_KRW), ()),
+                ("candles_usd", lambda: self.backfill_candles(CANDLE_SYMBOL_USD), ()),
+                (
+                    "ath_krw",
+                    lambda: self.backfill_all_time_extremes(CANDLE_SYMBOL_KRW),
+                    ("candles_krw",),
+                ),
+                (
+                    "ath_usd",
+                    lambda: self.backfill_all_time_extremes(CANDLE_SYMBOL_USD),
+                    ("candles_usd",),
+                ),
+                ("ma_cross", self.refresh_ma_cross, ("candles_usd",)),
+                ("dominance", self.update_dominance, ()),
+                ("mvrv", self.update_mvrv, ()),
+                ("fear_greed", self.update_fear_greed, ()),
+                ("stablecoin_inflow_ratio", self.update_stablecoin_inflow_ratio, ()),
+                ("nupl", self.update_nupl, ()),
+                ("spor", self.update_spor, ()),
+                ("asol", self.update_asol, ()),
+            ):
+                if name in fresh:
+                    startup.skip(name, "restored from warm start")
+                    continue
+                startup.add(name, func, STARTUP_STEP_TIMEOUTS.get(name), after)
+            self.startup = startup
+            await startup.run()
+
+            # 주기적 갱신 작업 시작 (초기값은 위에서 설정했으므로 다음 슬롯부터 실행)
+            jobs = {
+                "rsi_alerts": self.check_rsi_alerts,
+                "dominance": self.update_dominance,
+                "mvrv": self.update_mvrv,
+                "fear_greed": self.update_fear_greed,
+                "stablecoin_inflow_ratio": self.update_stablecoin_inflow_ratio,
+                "nupl": self.update_nupl,
+                "spor": self.update_spor,
+                "asol": self.update_asol,
+                "exchange_rate_reset": self.reset_manual_exchange_rate,
+                "warm_start_save": self.save_warm_start,
+            }
+            for name, func in jobs.items():
+                self.scheduler.add(name, func, **SCHEDULED_JOBS[name])
+            self.scheduler.start()
 
             logger.info("WebSocket 스트리밍 서비스가 성공적으로 시작되었습니다")
         except Exception as e:
             logger.error(f"스트리밍 서비스 시작 실패: {str(e)}")
             self.running = False
 
-    async def update_24h_changes(self):
-        """24시간 변동률 주기적 업데이트 (1분마다)"""
-        while self.running:
-            await self.fetch_upbit_24h_change()
-            await self.fetch_binance_24h_change()
-            await self.update_volume_data()
-            await asyncio.sleep(60)  # 1분 대기
-
-    async def fetch_upbit_candles(self, interval: str) -> Dict[str, float]:
-        """업비트 API에서 특정 간격의 캔들 데이터 가져오기"""
-        try:
-            # 업비트 간격 형식 변환 (1m, 5m, 15m, 60m, 24h)
-            upbit_interval = {
-                "1m": "minutes/1",
-                "5m": "minutes/5",
-                "15m": "minutes/15",
-                "1h": "minutes/60",
-                "24h": "days",
-            }.get(interval, "minutes/1")
-
-            url = f"https://api.upbit.com/v1/candles/{upbit_interval}"
-            params = {"market": "KRW-BTC", "count": 1}  # 가장 최근 캔들 1개만 가져오기
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data and len(data) > 0:
-                            candle = data[0]
-                            # 거래량 및 시간 추출
-                            volume = float(candle.get("candle_acc_trade_volume", 0))
-                            timestamp = candle.get("candle_date_time_utc", "")
-
-                            # 캐시 저장
-                            self.candle_cache["krw"][interval] = {
-                                "volume": volume,
-                                "timestamp": timestamp,
-                            }
-
-                            return {"volume": volume, "timestamp": timestamp}
-
-            # 요청 실패 시 캐시된 데이터 사용
-            if interval in self.candle_cache["krw"]:
-                return self.candle_cache["krw"][interval]
-
-            return {"volume": 0.0, "timestamp": ""}
-        except Exception as e:
-            logger.error(f"업비트 캔들 데이터 가져오기 오류: {str(e)}")
-            # 오류 발생 시 캐시된 데이터 사용
-            if interval in self.candle_cache["krw"]:
-                return self.candle_cache["krw"][interval]
-            return {"volume": 0.0, "timestamp": ""}
-
-    async def fetch_binance_candles(self, interval: str) -> Dict[str, float]:
-        """바이낸스 API에서 특정 간격의 캔들 데이터 가져오기"""
-        try:
-            # 바이낸스 간격 형식 변환 (1m, 5m, 15m, 1h, 1d)
-            binance_interval = {
-                "1m": "1m",
-                "5m": "5m",
-                "15m": "15m",
-                "1h": "1h",
-                "24h": "1d",
-            }.get(interval, "1m")
-
-            url = "https://api.binance.com/api/v3/klines"
-            params = {
-                "symbol": "BTCUSDT",
-                "interval": binance_interval,
-                "limit": 1,  # 가장 최근 캔들 1개만 가져오기
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data and len(data) > 0:
-                            # 바이낸스 응답 형식: [
-                            # [개장시간, 개장가, 최고가, 최저가, 종가, 거래량, ...]]
-                            candle = data[0]
-                            volume = float(candle[5])  # 5번째 인덱스가 거래량
-                            timestamp = datetime.fromtimestamp(
-                                candle[0] / 1000
-                            ).isoformat()
-
-                            # 캐시 저장
-                            self.candle_cache["usd"][interval] = {
-                                "volume": volume,
-                                "timestamp": timestamp,
-                            }
-
-                            return {"volume": volume, "timestamp": timestamp}
-
-            # 요청 실패 시 캐시된 데이터 사용
-            if interval in self.candle_cache["usd"]:
-                return self.candle_cache["usd"][interval]
-
-            return {"volume": 0.0, "timestamp": ""}
-        except Exception as e:
-            logger.error(f"바이낸스 캔들 데이터 가져오기 오류: {str(e)}")
-            # 오류 발생 시 캐시된 데이터 사용
-            if interval in self.candle_cache["usd"]:
-                return self.candle_cache["usd"][interval]
-            return {"volume": 0.0, "timestamp": ""}
-
-    async def update_volume_data(self):
-        """REST API를 사용하여 모든 시간 간격의 거래량 업데이트"""
-        # 시간 간격 정의
-        intervals = ["1m", "5m", "15m", "1h", "24h"]
-
-        for interval in intervals:
-            # 업데이트 주기 체크
-            minutes_map = {"1m": 1, "5m": 5, "15m": 15, "1h": 60, "24h": 24 * 60}
-            minutes = minutes_map[interval]
-            update_interval = max(
-                1, minutes // 5
-            )  # 최소 1분마다, 간격의 1/5 주기로 업데이트
-
-            current_time = datetime.now()
-            time_diff = (
-                current_time - self.last_volume_update[interval]
-            ).total_seconds() / 60
-
-            if time_diff >= update_interval:
-                # 바이낸스 거래량(BTC 개수) 가져오기
-                binance_data = await self.fetch_binance_candles(interval)
-                self.current_prices["volume"][interval] = binance_data["volume"]
-
-                # 마지막 업데이트 시간 기록
-                self.last_volume_update[interval] = current_time
-
-        logger.info(f"거래량 데이터 업데이트 완료: {current_time.isoformat()}")
-
     async def stop(self):
         """스트리밍 서비스 중지"""
         self.running = False
-        for client in self.clients:
+        if self.role == "leader":
+            try:
+                await self.save_warm_start()
+            except Exception as e:
+                logger.error(f"Failed to save warm start: {str(e)}")
+        # 백그라운드 태스크(피드 연결, 틱 처리, 백필 등)를 먼저 끝내야
+        # 아래에서 닫는 공유 메모리/체결 테이프에 종료 중인 태스크가 쓰지 않음
+        await self.scheduler.stop()
+        current = asyncio.current_task()
+        tasks = [task for task in self.tasks if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for client in list(self.clients):
             await client.close()
         self.clients.clear()
+        # SSE 스트림 종료 신호
+        for queue in list(self.sse_clients):
+            self.offer_sse_frame(queue, None)
+        if self.shared_snapshot is not None:
+            self.shared_snapshot.close()
+            self.shared_snapshot = None
+        if self.price_history is not None:
+            self.price_history.close()
+            self.price_history = None
+        if self.trade_tape is not None:
+            self.trade_tape.close()
+            self.trade_tape = None
+        if self.role == "leader":
+            await self.publisher.stop()
+            self.leader_election.release()
+        self.role = None
 
 
 # 싱글톤 인스턴스 생성
@@ -0,0 +1,263 @@
+"""
+체결 스트림 기반 다중 간격 OHLCV 캔들 저장소
+
+심볼/간격별로 고정 용량 numpy 링 버퍼에 확정 캔들을 보관하고,
+진행 중인 캔들은 파이썬 값으로 유지하여 체결마다 배열을 건드리지 않습니다.
+시작 시 REST로 한 번 백필한 뒤에는 체결 이벤트만으로 증분 갱신합니다.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# 간격별 캔들 길이 (ms). 모든 버킷은 UTC epoch 기준으로 정렬
+INTERVAL_MS = {
+    "1m": 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "1h": 60 * 60_000,
+    "4h": 4 * 60 * 60_000,
+    "1d": 24 * 60 * 60_000,
+}
+
+# 배열 열 순서
+COLUMNS = ("open_time", "open", "high", "low", "close", "volume")
+OPEN_TIME, OPEN, HIGH, LOW, CLOSE, VOLUME = range(len(COLUMNS))
+
+
+def parse_candle_time(timestamp: str, utc: bool) -> int:
+    """
+    exchange_service 캔들의 timestamp 문자열을 epoch ms로 변환합니다.
+    업비트는 UTC 기준 문자열, 바이낸스는 로컬 시간 기준 문자열입니다.
+    """
+    dt = datetime.fromisoformat(timestamp)
+    if utc and dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+
+class CandleSeries:
+    """단일 심볼/간격 캔들 시계열"""
+
+    def __init__(self, interval: str, capacity: int):
+        self.interval = interval
+        self.interval_ms = INTERVAL_MS[interval]
+        self.capacity = capacity
+        self._data = np.zeros((capacity, len(COLUMNS)), dtype=np.float64)
+        self._head = 0  # 다음 확정 캔들을 기록할 위치
+        self._count = 0
+        # 진행 중인 캔들 [open_time, open, high, low, close, volume]
+        self.current: Optional[List[float]] = None
+
+    def __len__(self) -> int:
+        return self._count + (1 if self.current is not None else 0)
+
+    def _append_closed(self, row: List[float]):
+        self._data[self._head] = row
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def update(
+        self, ts_ms: int, price: float, qty: float, update_close: bool = True
+    ) -> Optional[List[float]]:
+        """
+        체결 반영. 새 버킷으로 넘어가면서 확정된 직전 캔들을 반환합니다.
+        현재 캔들보다 이전 버킷의 지연 체결은 무시합니다.
+        update_close=False(이미 반영한 체결보다 이른 지연 체결)이면 종가는 바꾸지 않고
+        고가/저가/거래량만 반영합니다.
+        """
+        open_time = ts_ms - ts_ms % self.interval_ms
+        current = self.current
+        if current is not None:
+            if open_time == current[OPEN_TIME]:
+                if price > current[HIGH]:
+                    current[HIGH] = price
+                if price < current[LOW]:
+                    current[LOW] = price
+                if update_close:
+                    current[CLOSE] = price
+                current[VOLUME] += qty
+                return None
+            if open_time < current[OPEN_TIME]:
+                return None
+
+        closed = current
+        if closed is not None:
+            self._append_closed(closed)
+            # 체결이 없던 구간은 직전 종가로 평평한 캔들을 채움 (거래소와 동일)
+            gap_time = closed[OPEN_TIME] + self.interval_ms
+            # 버퍼 용량보다 긴 공백은 남는 부분만 채움
+            gap_time = max(gap_time, open_time - self.capacity * self.interval_ms)
+            while gap_time < open_time:
+                last = closed[CLOSE]
+                self._append_closed([gap_time, last, last, last, last, 0.0])
+                gap_time += self.interval_ms
+        self.current = [float(open_time), price, price, price, price, qty]
+        return closed
+
+    def load(self, rows: Iterable[Tuple[int, float, float, float, float, float]]):
+        """
+        REST 백필 (open_time 오름차순). 기존 데이터를 대체하며,
+        백필 중 이미 체결로 만들어진 진행 캔들은 마지막 REST 캔들과 병합합니다.
+        """
+        rows = sorted(rows, key=lambda row: row[OPEN_TIME])
+        live = self.current
+        self._data[:] = 0.0
+        self._head = 0
+        self._count = 0
+        self.current = None
+        if not rows:
+            self.current = live
+            return
+
+        for row in rows[:-1]:
+            self._append_closed([float(value) for value in row])
+        last = [float(value) for value in rows[-1]]
+
+        if live is None or live[OPEN_TIME] < last[OPEN_TIME]:
+            self.current = last
+        elif live[OPEN_TIME] == last[OPEN_TIME]:
+            # REST 캔들은 버킷 시작부터 누적된 값이므로 거래량은 큰 쪽을 사용
+            last[HIGH] = max(last[HIGH], live[HIGH])
+            last[LOW] = min(last[LOW], live[LOW])
+            last[CLOSE] = live[CLOSE]
+            last[VOLUME] = max(last[VOLUME], live[VOLUME])
+            self.current = last
+        else:
+            self._append_closed(last)
+            self.current = live
+
+    def restore_closed(
+        self,
+        rows: Iterable[Tuple[int, float, float, float, float, float]],
+        until_ms: int,
+    ):
+        """
+        워밍 스타트 복원. until_ms 이전에 끝난 확정 캔들만 복원하고 진행 중 캔들은 비워 둡니다.
+        저장 시점의 진행 캔들을 현재 캔들로 되살리면 첫 체결이 오래된 종가로 캔들을 확정하고
+        공백을 평평한 캔들로 채우므로, 진행 캔들은 체결과 REST 백필로 다시 만듭니다.
+        """
+        self._data[:] = 0.0
+        self._head = 0
+        self._count = 0
+        self.current = None
+        for row in sorted(rows, key=lambda row: row[OPEN_TIME]):
+            if row[OPEN_TIME] + self.interval_ms <= until_ms:
+                self._append_closed([float(value) for value in row])
+
+    def closed(self, limit: Optional[int] = None) -> np.ndarray:
+        """확정 캔들 배열 (오래된 순, 복사본)"""
+        count = self._count if limit is None else min(limit, self._count)
+        if count == 0:
+            return np.empty((0, len(COLUMNS)), dtype=np.float64)
+        start = (self._head - count) % self.capacity
+        if start + count <= self.capacity:
+            return self._data[start : start + count].copy()
+        return np.concatenate((self._data[start:], self._data[: self._head]), axis=0)
+
+    def closes(self, limit: Optional[int] = None) -> np.ndarray:
+        """확정 캔들 종가 배열 (오래된 순)"""
+        return self.closed(limit)[:, CLOSE]
+
+    def last_closed(self) -> Optional[np.ndarray]:
+        if self._count == 0:
+            return None
+        return self._data[(self._head - 1) % self.capacity].copy()
+
+    def high_low(self, window_ms: int) -> Optional[Tuple[float, float]]:
+        """
+        최근 window_ms 동안의 (최고가, 최저가). 진행 중인 캔들과 그 시작 시각으로부터 window_ms 이내에
+        시작한 확정 캔들이 대상이므로, 캔들 간격 단위로 window_ms 이상(최대 한 간격 더)을 포함합니다.
+        캔들이 없으면 None을 반환합니다.
+        """
+        rows = self.closed(window_ms // self.interval_ms)
+        if self.current is not None:
+            rows = np.vstack((rows, np.asarray(self.current, dtype=np.float64)))
+        if len(rows) == 0:
+            return None
+        rows = rows[rows[:, OPEN_TIME] >= rows[-1, OPEN_TIME] - window_ms]
+        return float(rows[:, HIGH].max()), float(rows[:, LOW].min())
+
+    def rows(self) -> np.ndarray:
+        """진행 중인 캔들을 포함한 전체 캔들 배열 (오래된 순, load로 복원 가능)"""
+        rows = self.closed()
+        if self.current is not None:
+            rows = np.vstack((rows, np.asarray(self.current, dtype=np.float64)))
+        return rows
+
+    def to_list(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """진행 중인 캔들을 포함한 최근 캔들 목록 (오래된 순)"""
+        rows = self.closed(limit).tolist()
+        if self.current is not None:
+            rows.append(list(self.current))
+            if limit is not None:
+                rows = rows[-limit:]
+        return [
+            {
+                "open_time": int(row[OPEN_TIME]),
+                "open": row[OPEN],
+                "high": row[HIGH],
+                "low": row[LOW],
+                "close": row[CLOSE],
+                "volume": row[VOLUME],
+            }
+            for row in rows
+        ]
+
+
+class CandleStore:
+    """심볼별 다중 간격 캔들 시계열 모음"""
+
+    def __init__(self, symbols: Iterable[str], capacity: Dict[str, int]):
+        self.series: Dict[str, Dict[str, CandleSeries]] = {
+            symbol: {
+                interval: CandleSeries(interval, size)
+                for interval, size in capacity.items()
+            }
+            for symbol in symbols
+        }
+
+    def get(self, symbol: str, interval: str) -> CandleSeries:
+        return self.series[symbol][interval]
+
+    def on_trade(
+        self,
+        symbol: str,
+        ts_ms: int,
+        price: float,
+        qty: float,
+        update_close: bool = True,
+    ) -> List[Tuple[str, List[float]]]:
+        """체결을 모든 간격에 반영하고 확정된 (interval, candle) 목록을 반환합니다."""
+        closed = []
+        for interval, series in self.series[symbol].items():
+            candle = series.update(ts_ms, price, qty, update_close)
+            if candle is not None:
+                closed.append((interval, candle))
+        return closed
+
+    def dump(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """심볼/간격별 캔들 배열 (워밍 스타트 저장용)"""
+        return {
+            symbol: {
+                interval: series.rows() for interval, series in by_interval.items()
+            }
+            for symbol, by_interval in self.series.items()
+        }
+
+    def restore(self, data: Dict[str, Dict[str, np.ndarray]], saved_ms: int):
+        """dump 결과로 캔들 복원 (저장 시점 saved_ms에 확정되어 있던 캔들만)"""
+        for symbol, by_interval in data.items():
+            for interval, rows in by_interval.items():
+                if symbol in self.series and interval in self.series[symbol]:
+                    self.series[symbol][interval].restore_closed(
+                        rows.tolist(), saved_ms
+                    )
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            symbol: {interval: len(series) for interval, series in by_interval.items()}
+            for symbol, by_interval in self.series.items()
+        }
@@ -0,0 +1,164 @@
+"""
+브로드캐스트 프레임 인코딩
+
+한 번의 브로드캐스트에서 생성된 메시지를 인코딩별로 한 번만 직렬화/압축하고,
+같은 인코딩을 사용하는 모든 클라이언트가 동일한 바이트를 재사용하도록 합니다.
+SSE 이벤트도 구독 필드 조합별로 한 번만 만들어 같은 조합의 클라이언트가 공유합니다.
+"""
+
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+from app.constants import WS_DEFLATE_LEVEL
+from app.utils import serializer
+
+# 클라이언트별 프레임 인코딩
+ENCODING_JSON = "json"
+ENCODING_DEFLATE = "deflate"
+
+# permessage-deflate 규격(RFC 7692)에 따라 sync flush 후 제거하는 꼬리 바이트
+_DEFLATE_TAIL = b"\x00\x00\xff\xff"
+
+
+def deflate_frame(payload: bytes, level: int = WS_DEFLATE_LEVEL) -> bytes:
+    """
+    페이로드를 컨텍스트 공유 없이 raw DEFLATE로 압축합니다.
+
+    각 프레임이 독립적으로 압축되므로(no_context_takeover) 같은 바이트를
+    여러 클라이언트에 그대로 전송할 수 있습니다.
+    클라이언트는 수신한 바이트 뒤에 0x00 0x00 0xff 0xff를 붙여 raw inflate 하면 됩니다.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    data = compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    if data.endswith(_DEFLATE_TAIL):
+        data = data[: -len(_DEFLATE_TAIL)]
+    return data
+
+
+def inflate_frame(data: bytes) -> bytes:
+    """deflate_frame으로 압축된 프레임을 복원합니다."""
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    return decompressor.decompress(data + _DEFLATE_TAIL)
+
+
+# SSE 토픽 필터 메시지에 항상 포함하는 메타 필드
+_SSE_META_FIELDS = ("timestamp", "epoch", "version")
+# 델타 프레임에 항상 포함하는 메타 필드
+_DELTA_META_FIELDS = (
+    "timestamp",
+    "epoch",
+    "version",
+    "updated_ms",
+    "field_versions",
+    "field_updated_ms",
+)
+
+
+class EncodedFrame:
+    """브로드캐스트 1회분의 메시지와 인코딩별 캐시"""
+
+    __slots__ = ("payload", "text", "message", "_encoded")
+
+    def __init__(self, message: Any):
+        self.payload: bytes = serializer.dumps_bytes(message)
+        self.text: str = self.payload.decode("utf-8")
+        self.message = message
+        self._encoded: Dict[Any, Any] = {}
+
+    @classmethod
+    def from_payload(
+        cls, payload: bytes, message: Optional[Dict[str, Any]] = None
+    ) -> "EncodedFrame":
+        """
+        이미 직렬화된 JSON 바이트로 프레임을 생성합니다. (재직렬화 없음)
+        파싱된 메시지가 있으면 함께 넘겨 SSE 필터링 시 다시 파싱하지 않도록 합니다.
+        """
+        frame = cls.__new__(cls)
+        frame.payload = payload
+        frame.text = payload.decode("utf-8")
+        frame.message = message
+        frame._encoded = {}
+        return frame
+
+    def data(self) -> Dict[str, Any]:
+        """메시지 딕셔너리 (payload만 있으면 최초 요청 시 한 번 파싱)"""
+        if self.message is None:
+            self.message = serializer.loads(self.payload)
+        return self.message
+
+    def event_id(self) -> str:
+        """SSE 이벤트 ID ("epoch-version", 리더가 바뀌어도 겹치지 않음)"""
+        message = self.data()
+        return f"{message.get('epoch', 0)}-{message.get('version', 0)}"
+
+    def delta(self, base_version: int) -> "EncodedFrame":
+        """
+        base_version 이후 변경된 필드만 담은 델타 프레임 ({"type": "delta", "base_version": ...}).
+        같은 기준 버전으로 재접속하는 클라이언트들이 공유하도록 기준 버전별로 캐시합니다.
+        """
+        key = ("delta", base_version)
+        frame = self._encoded.get(key)
+        if frame is None:
+            message = self.data()
+            versions = message.get("field_versions") or {}
+            delta = {"type": "delta", "base_version": base_version}
+            for name, version in versions.items():
+                if version > base_version and name in message:
+                    delta[name] = message[name]
+            for name in _DELTA_META_FIELDS:
+                if name in message:
+                    delta[name] = message[name]
+            frame = EncodedFrame(delta)
+            self._encoded[key] = frame
+        return frame
+
+    def sse(
+        self, fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[Tuple[int, int], bytes]:
+        """
+        SSE 이벤트 바이트와 변경 표식 (epoch, 포함 필드의 최종 변경 버전).
+        fields가 없으면 전체 스냅샷, 있으면 해당 필드만 포함합니다. (필드 조합별로 한 번만 인코딩)
+        표식이 직전에 보낸 이벤트와 같으면 구독 필드에 변경이 없다는 뜻입니다.
+        """
+        key = ("sse", fields)
+        cached = self._encoded.get(key)
+        if cached is None:
+            message = self.data()
+            if fields is None:
+                payload = self.payload
+                changed = message.get("version", 0)
+            else:
+                versions = message.get("field_versions") or {}
+                changed = max((versions.get(name, 0) for name in fields), default=0)
+                payload = serializer.dumps_bytes(
+                    {
+                        name: message[name]
+                        for name in fields + _SSE_META_FIELDS
+                        if name in message
+                    }
+                )
+            event = (
+                b"id: "
+                + self.event_id().encode()
+                + b"\nevent: price\ndata: "
+                + payload
+                + b"\n\n"
+            )
+            cached = ((message.get("epoch", 0), changed), event)
+            self._encoded[key] = cached
+        return cached
+
+    def deflated(self) -> bytes:
+        """압축된 프레임 (최초 요청 시 한 번만 압축)"""
+        data = self._encoded.get(ENCODING_DEFLATE)
+        if data is None:
+            data = deflate_frame(self.payload)
+            self._encoded[ENCODING_DEFLATE] = data
+        return data
+
+    async def send(self, websocket, encoding: str = ENCODING_JSON):
+        """클라이언트 인코딩에 맞춰 프레임을 전송합니다."""
+        if encoding == ENCODING_DEFLATE:
+            await websocket.send_bytes(self.deflated())
+        else:
+            await websocket.send_text(self.text)
@@ -0,0 +1,147 @@
+"""
+업스트림 피드 상태 추적
+
+거래소 WebSocket 피드별 마지막 수신 시각, 재접속 횟수를 기록하고
+일정 시간 메시지가 없으면 stale로 판정합니다.
+"""
+
+import heapq
+import random
+import time
+from typing import Any, Dict, List, Optional, Set
+
+
+class FeedHealth:
+    def __init__(self, name: str, stale_after: float):
+        self.name = name
+        self.stale_after = stale_after
+        self.connected = False
+        self.last_message_at: Optional[float] = None  # time.monotonic()
+        self.last_message_ms: Optional[int] = None  # epoch ms (클라이언트 표시용)
+        self.messages = 0
+        self.reconnects = 0
+        self.consecutive_failures = 0
+
+    def on_connect(self):
+        self.connected = True
+
+    def on_message(self):
+        self.last_message_at = time.monotonic()
+        self.last_message_ms = int(time.time() * 1000)
+        self.messages += 1
+        self.consecutive_failures = 0
+
+    def on_disconnect(self):
+        self.connected = False
+        self.reconnects += 1
+        self.consecutive_failures += 1
+
+    def age(self) -> Optional[float]:
+        """마지막 메시지 이후 경과 시간(초). 수신 이력이 없으면 None"""
+        if self.last_message_at is None:
+            return None
+        return time.monotonic() - self.last_message_at
+
+    def is_stale(self) -> bool:
+        age = self.age()
+        return age is None or age > self.stale_after
+
+    def status(self) -> Dict[str, Any]:
+        age = self.age()
+        return {
+            "connected": self.connected,
+            "stale": self.is_stale(),
+            "age_ms": int(age * 1000) if age is not None else None,
+            "last_message_ms": self.last_message_ms,
+            "reconnects": self.reconnects,
+        }
+
+
+def backoff_delay(attempt: int, base: float, max_exponent: int) -> float:
+    """
+    지터가 적용된 지수 백오프 대기 시간(초).
+    base * 2^attempt (최대 2^max_exponent 배)의 50~100% 범위에서 무작위로 선택합니다.
+    """
+    ceiling = base * (2 ** min(attempt, max_exponent))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+class TradeDeduplicator:
+    """
+    여러 연결에서 중복 수신되는 체결을 trade id 기준으로 한 번만 통과시키고,
+    어느 연결에서도 받지 못한 체결(id 공백)을 집계합니다.
+
+    연결마다 전달 순서가 달라 느린 연결의 체결이 다른 연결의 더 큰 id보다 늦게 도착할 수 있으므로,
+    최근 window개 id 범위(last_id - window, last_id]에서 통과시킨 id를 기억해 두고
+    이 범위의 처음 보는 id는 늦게 도착했더라도 통과시킵니다.
+    범위를 벗어날 때까지 받지 못한 id만 누락으로 집계합니다.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.last_id: Optional[int] = None
+        self.floor: Optional[int] = None  # 이 id 이하는 판정이 끝난 범위
+        # floor id가 누락이었는지 (공백이 다음 범위로 이어지는지)
+        self._floor_missing = False
+        self._seen: Set[int] = set()  # 범위 안에서 통과시킨 id
+        # 범위를 벗어난 id를 오래된 순으로 꺼내기 위한 최소 힙
+        self._seen_heap: List[int] = []
+        self.accepted = 0
+        self.duplicates = 0
+        self.late = 0  # 범위를 벗어난 뒤 도착해 버린 체결 수 (이미 누락으로 집계됨)
+        self.gaps = 0  # 공백 발생 횟수
+        self.missing = 0  # 누락된 체결 수
+
+    def accept(self, trade_id: int) -> bool:
+        """처음 도착한 체결이면 True, 이미 통과시켰거나 범위를 벗어난 체결이면 False"""
+        if self.last_id is None:
+            self.last_id = self.floor = trade_id - 1
+        elif trade_id <= self.floor:
+            self.late += 1
+            return False
+        elif trade_id in self._seen:
+            self.duplicates += 1
+            return False
+
+        self._seen.add(trade_id)
+        heapq.heappush(self._seen_heap, trade_id)
+        self.accepted += 1
+        if trade_id > self.last_id:
+            self.last_id = trade_id
+            if trade_id - self.window > self.floor:
+                self._evict(trade_id - self.window)
+        return True
+
+    def _evict(self, floor: int):
+        """floor 이하 id를 범위에서 내보내며 받지 못한 id를 누락으로 집계"""
+        prev, prev_missing = self.floor, self._floor_missing
+        heap = self._seen_heap
+        while heap and heap[0] <= floor:
+            trade_id = heapq.heappop(heap)
+            self._seen.discard(trade_id)
+            if trade_id > prev + 1:
+                self.missing += trade_id - prev - 1
+                if not prev_missing:
+                    self.gaps += 1
+            prev, prev_missing = trade_id, False
+        if floor > prev:
+            self.missing += floor - prev
+            if not prev_missing:
+                self.gaps += 1
+            prev, prev_missing = floor, True
+        self.floor, self._floor_missing = floor, prev_missing
+
+    def stats(self) -> Dict[str, Any]:
+        pending = 0
+        if self.last_id is not None:
+            pending = self.last_id - self.floor - len(self._seen)
+        return {
+            "last_id": self.last_id,
+            "window": self.window,
+            "accepted": self.accepted,
+            "duplicates": self.duplicates,
+            "late": self.late,
+            "pending": pending,  # 범위 안에서 아직 받지 못한 id 수 (누락 판정 전)
+            "gaps": self.gaps,
+            "missing": self.missing,
+        }
@@ -0,0 +1,85 @@
+"""
+스냅샷 기반 GET 응답의 HTTP 캐시 (ETag / Cache-Control)
+
+ETag는 응답에 사용한 스냅샷 필드들의 변경 버전으로 만들므로, 클라이언트의 If-None-Match가
+일치하면 DB 조회나 직렬화 없이 304로 응답할 수 있습니다.
+"""
+
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+from app.constants import SNAPSHOT_CACHE_MAX_AGE
+from app.utils.serializer import FastJSONResponse
+
+
+def snapshot_etag(
+    snapshot: Dict[str, Any], *fields: str, extra: str = ""
+) -> Optional[str]:
+    """
+    스냅샷 필드 버전 기반 약한(weak) ETag.
+    필드가 아직 한 번도 로드되지 않았으면 None (캐시하지 않음)
+    """
+    versions = snapshot.get("field_versions") or {}
+    if any(field not in versions for field in fields):
+        return None
+    tag = ".".join(str(versions[field]) for field in fields)
+    if extra:
+        tag = f"{tag}-{extra}"
+    return f'W/"{snapshot.get("epoch", 0)}-{tag}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    """약한 비교용 태그 (W/ 접두사 제거)"""
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def matches_if_none_match(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    target = _opaque_tag(etag)
+    return any(_opaque_tag(candidate) == target for candidate in header.split(","))
+
+
+def check_not_modified(
+    request: Request,
+    response: Response,
+    snapshot: Dict[str, Any],
+    *fields: str,
+    extra: str = "",
+) -> Optional[Response]:
+    """
+    응답에 ETag/Cache-Control 헤더를 설정하고, 클라이언트 캐시가 최신이면 304 응답을 반환합니다.
+    None이 반환되면 평소처럼 본문을 만들어 응답하면 됩니다.
+    """
+    etag = snapshot_etag(snapshot, *fields, extra=extra)
+    if etag is None:
+        response.headers["Cache-Control"] = "no-cache"
+        return None
+    max_age = min(SNAPSHOT_CACHE_MAX_AGE.get(field, 0) for field in fields)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if matches_if_none_match(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def json_response(content: Any, response: Optional[Response] = None) -> Response:
+    """
+    본문을 serializer로 바로 직렬화한 응답.
+    라우트가 dict를 반환하면 FastAPI가 응답 전에 jsonable_encoder로 본문 전체를 한 번 더 순회하므로,
+    자주 호출되는 GET은 이 응답을 반환해 그 과정을 건너뜁니다.
+    response(엔드포인트 인자)에 설정한 ETag/Cache-Control 헤더를 옮겨 담습니다.
+    """
+    headers = None
+    if response is not None:
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name != "content-length"
+        }
+    return FastJSONResponse(content, headers=headers)
@@ -0,0 +1,44 @@
+"""
+무거운 모듈 지연 import
+
+pandas, ta, langchain_openai, firebase_admin처럼 import에 수백 ms가 걸리지만 일부 경로에서만 쓰는 모듈을
+첫 속성 접근 시점에 import합니다. app.main을 import하는 모든 프로세스(alembic, 스크립트, API 워커)의
+시작 시간과 메모리 사용량을 줄이기 위한 것이며, 사용하는 쪽 코드는 일반 모듈처럼 그대로 씁니다.
+
+    pd = lazy_module("pandas")
+    pd.DataFrame(...)  # 여기서 처음 import
+"""
+
+import importlib
+from types import ModuleType
+from typing import Any, Optional
+
+
+class LazyModule:
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def load(self) -> ModuleType:
+        """모듈을 import하여 반환 (이미 import되었으면 그대로 반환)"""
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_module(name: str) -> Any:
+    """첫 속성 접근 시 import되는 모듈 대리자"""
+    return LazyModule(name)
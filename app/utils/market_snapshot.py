@@ -0,0 +1,212 @@
+"""
+시장 스냅샷 모델
+
+스트림 서비스가 유지하는 가격/지표 스냅샷입니다. 모든 변경은 update/update_in을 거치며,
+실제로 값이 바뀐 경우에만 버전이 1 증가하고 필드별 갱신 시각(epoch ms)이 기록됩니다.
+소비자(브로드캐스트, REST, 알림)는 버전만 비교해 변경 여부를 판단하고,
+딕셔너리/직렬화 결과는 버전 단위로 캐시되어 재사용됩니다.
+
+필드별 변경 버전/시각도 메시지에 포함되어 팔로워 워커가 리더와 같은 ETag를 만들 수 있습니다.
+리더가 바뀌면 새 epoch(버전 계열 시작 시각)로 바뀌므로 버전은 항상 epoch와 함께 사용해야 합니다.
+
+재시작 시 디스크에 저장된 스냅샷으로 복원한 필드는 다시 갱신될 때까지 stale 목록에 표시됩니다.
+
+중첩 딕셔너리 필드는 제자리에서 수정하지 않고 복사 후 교체하므로(copy-on-write),
+이전 버전의 딕셔너리를 들고 있는 소비자에게 변경이 새어 나가지 않습니다.
+"""
+
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Set
+
+from app.utils import serializer
+
+# 스냅샷 필드 (직렬화 순서)
+FIELDS = (
+    "krw",
+    "usd",
+    "timestamp_ms",  # 마지막 체결 시각 (epoch ms)
+    "kimchi_premium",
+    "change_24h",
+    "ticker_24h",
+    "volume",
+    "rsi",
+    "dominance",
+    "mvrv",
+    "high_3w",
+    "extremes",
+    "ma_cross",
+    "fear_greed",
+    "eth_btc_ratio",
+    "stablecoin_inflow_ratio",
+    "nupl",
+    "spor",
+    "asol",
+    "feeds",
+)
+
+
+def _defaults() -> Dict[str, Any]:
+    return {
+        "krw": 0.0,
+        "usd": 0.0,
+        "timestamp_ms": 0,
+        "kimchi_premium": 0.0,
+        "change_24h": {"krw": 0.0, "usd": 0.0},
+        # 최근 24시간 고가/저가 (원화 1시간 봉 기준), 24시간 누적 거래량 (업비트 티커 스트림)
+        "ticker_24h": {"krw": {"high": 0.0, "low": 0.0, "volume": 0.0}},
+        # 시간 간격별 누적 거래량 정보 (BTC 개수)
+        "volume": {"1m": 0.0, "5m": 0.0, "15m": 0.0, "1h": 0.0, "24h": 0.0},
+        "rsi": {"15m": 0.0, "1h": 0.0, "4h": 0.0, "1d": 0.0},
+        "dominance": 0.0,
+        "mvrv": None,  # 최초 조회 전에는 메시지에서 제외 (MVRV 알림 오작동 방지)
+        "high_3w": {"krw": 0.0, "usd": 0.0, "timestamp": ""},
+        "extremes": {},  # 기간별 최고가/최저가 (1w, 3w, 52w, ath)
+        "ma_cross": None,  # MA 크로스 데이터
+        "fear_greed": {"value": 0, "classification": "neutral", "timestamp": ""},
+        "eth_btc_ratio": 0.0,
+        "stablecoin_inflow_ratio": 0.0,
+        "nupl": 0.0,  # NUPL(Net Unrealized Profit/Loss)
+        "spor": 0.0,  # SPOR(Spent Output Profit Ratio)
+        "asol": 0.0,  # ASOL(Average Spent Output Lifespan)
+        "feeds": {},  # 업스트림 피드 상태 (마지막 수신 시각, stale 여부)
+    }
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class MarketSnapshot:
+    __slots__ = FIELDS + (
+        "epoch",
+        "version",
+        "updated_ms",
+        "field_updated_ms",
+        "field_version",
+        "stale",
+        "_dict",
+        "_dict_version",
+        "_payload",
+        "_payload_version",
+    )
+
+    def __init__(self):
+        for name, value in _defaults().items():
+            setattr(self, name, value)
+        self.epoch = _now_ms()  # 스냅샷 생성 시각 (버전 계열 식별)
+        self.version = 0
+        self.updated_ms = 0
+        self.field_updated_ms: Dict[str, int] = {}
+        self.field_version: Dict[str, int] = {}  # 필드별 마지막 변경 버전 (ETag 용)
+        self.stale: Set[str] = set()  # 워밍 스타트로 복원된 뒤 아직 갱신되지 않은 필드
+        self._dict: Optional[Dict[str, Any]] = None
+        self._dict_version = -1
+        self._payload: Optional[bytes] = None
+        self._payload_version = -1
+
+    def update(self, **changes: Any) -> bool:
+        """
+        필드 변경. 값이 하나라도 바뀌면 버전을 올리고 True를 반환합니다.
+        stale 필드는 값이 같아도 갱신된 것으로 보고 표시를 해제합니다.
+        """
+        changed = False
+        now = None
+        for name, value in changes.items():
+            if getattr(self, name) == value and name not in self.stale:
+                continue
+            self.stale.discard(name)
+            setattr(self, name, value)
+            if now is None:
+                now = _now_ms()
+            self.field_updated_ms[name] = now
+            self.field_version[name] = self.version + 1
+            changed = True
+        if changed:
+            self.version += 1
+            self.updated_ms = now
+        return changed
+
+    def update_in(self, name: str, key: str, value: Any) -> bool:
+        """중첩 딕셔너리 필드의 항목 변경 (복사 후 교체)"""
+        current = getattr(self, name) or {}
+        if key in current and current[key] == value and name not in self.stale:
+            return False
+        return self.update(**{name: {**current, key: value}})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        메시지 형식 딕셔너리 (버전 단위 캐시, 읽기 전용으로 사용).
+        기존 클라이언트 호환을 위해 ISO 형식 timestamp도 함께 제공합니다.
+        """
+        if self._dict_version != self.version:
+            data = {name: getattr(self, name) for name in FIELDS}
+            if data["mvrv"] is None:
+                del data["mvrv"]
+            data["timestamp"] = (
+                datetime.fromtimestamp(self.timestamp_ms / 1000).isoformat()
+                if self.timestamp_ms
+                else ""
+            )
+            data["epoch"] = self.epoch
+            data["version"] = self.version
+            data["updated_ms"] = self.updated_ms
+            data["field_versions"] = dict(self.field_version)
+            data["field_updated_ms"] = dict(self.field_updated_ms)
+            data["stale"] = sorted(self.stale)
+            self._dict = data
+            self._dict_version = self.version
+        return self._dict
+
+    def start_epoch(self):
+        """
+        새 버전 계열 시작 (리더가 된 프로세스에서 호출).
+        팔로워에서 승계한 스냅샷의 버전 번호를 이어 쓰면, 이전 리더가 브로드캐스트 없이 REST ETag로 내보낸
+        epoch-version 조합이 다른 내용으로 다시 쓰일 수 있으므로 epoch를 바꿔 기존 ETag/재개 지점을 무효화합니다.
+        """
+        self.epoch = max(_now_ms(), self.epoch + 1)
+        self._dict_version = -1
+        self._payload_version = -1
+
+    def payload(self) -> bytes:
+        """직렬화된 JSON (버전 단위 캐시)"""
+        if self._payload_version != self.version:
+            self._payload = serializer.dumps_bytes(self.to_dict())
+            self._payload_version = self.version
+        return self._payload
+
+    def restore(self, data: Dict[str, Any], stale: Iterable[str] = ()):
+        """
+        저장해 둔 스냅샷 딕셔너리(to_dict 결과)로 필드 복원 (워밍 스타트, 새 스냅샷에서 한 번 호출).
+        저장 당시 로드된 적 있는 필드만 복원하며(피드 상태 제외), 필드별 갱신 시각은 저장 당시 값을 유지합니다.
+        """
+        saved = data.get("field_updated_ms") or {}
+        fields = {
+            name: data[name]
+            for name in FIELDS
+            if name in saved and name in data and name != "feeds"
+        }
+        self.update(**fields)
+        for name in fields:
+            self.field_updated_ms[name] = saved[name]
+        self.stale = set(stale) & set(fields)
+
+    @classmethod
+    def from_payload(cls, payload: bytes) -> "MarketSnapshot":
+        """리더가 발행한 직렬화 스냅샷으로 생성 (팔로워용, 재직렬화 없이 payload 재사용)"""
+        data = serializer.loads(payload)
+        snapshot = cls()
+        for name in FIELDS:
+            if name in data:
+                setattr(snapshot, name, data[name])
+        snapshot.epoch = data.get("epoch", 0)
+        snapshot.version = data.get("version", 0)
+        snapshot.updated_ms = data.get("updated_ms", 0)
+        snapshot.field_version = dict(data.get("field_versions") or {})
+        snapshot.field_updated_ms = dict(data.get("field_updated_ms") or {})
+        snapshot.stale = set(data.get("stale") or ())
+        snapshot._dict = data
+        snapshot._dict_version = snapshot.version
+        snapshot._payload = payload
+        snapshot._payload_version = snapshot.version
+        return snapshot
@@ -0,0 +1,196 @@
+"""
+초 단위 가격 이력 링 버퍼
+
+최근 capacity초의 원화/달러 가격, 김치 프리미엄, 거래량을 numpy 배열에 1초 1행으로 보관합니다.
+행 위치는 (epoch 초 % capacity)로 정해지므로 별도의 head 포인터가 없고,
+각 행의 time 열이 해당 초와 일치할 때만 유효한 데이터로 취급합니다. (틱이 없던 초는 비어 있음)
+
+수집 리더가 multiprocessing.shared_memory 세그먼트에 기록하면 팔로워 워커는 같은 배열을
+복사 없이 읽으므로, 워커 수와 관계없이 메모리 사용량은 한 벌로 고정됩니다.
+행을 쓸 때는 time 열을 먼저 0으로 무효화하고 값을 쓴 뒤 time 열을 마지막에 쓰며,
+행별 시퀀스(seqlock)를 기록 전후로 하나씩 올립니다. 읽는 쪽은 복사 전후 시퀀스가 같고 짝수인 행만 사용하므로
+(같은 초를 다시 쓰는 중이라도) 기록 중이거나 복사 도중 바뀐 행을 무시하게 됩니다.
+"""
+
+import logging
+import re
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("time", "krw", "usd", "kimchi_premium", "volume_krw", "volume_usd")
+TIME, KRW, USD, KIMCHI_PREMIUM, VOLUME_KRW, VOLUME_USD = range(len(COLUMNS))
+
+# 헤더 (int64): magic, layout_version, capacity. 헤더 뒤에 데이터 행, 행별 시퀀스(int64) 순으로 배치
+_MAGIC = 0x42_4E_50_48  # "BNPH"
+_LAYOUT_VERSION = 2
+_HEADER_LEN = 3
+_HEADER_BYTES = _HEADER_LEN * 8
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+_DURATION_RE = re.compile(r"^(\d+)([smhd])$")
+
+
+def parse_duration(value: str) -> int:
+    """기간 문자열(10s, 5m, 1h, 1d)을 초로 변환합니다. (형식 오류 시 ValueError)"""
+    match = _DURATION_RE.match(value.strip().lower())
+    if not match:
+        raise ValueError(f"Invalid duration: {value}")
+    return int(match.group(1)) * _DURATION_UNITS[match.group(2)]
+
+
+class PriceHistory:
+    def __init__(
+        self,
+        capacity: int,
+        buffer=None,
+        shm: Optional[shared_memory.SharedMemory] = None,
+        owner: bool = True,
+    ):
+        self.capacity = capacity
+        self.shm = shm
+        self.owner = owner
+        if buffer is None:
+            buffer = bytearray(self.nbytes(capacity))
+        self._header = np.ndarray((_HEADER_LEN,), dtype=np.int64, buffer=buffer)
+        self._data = np.ndarray(
+            (capacity, len(COLUMNS)),
+            dtype=np.float64,
+            buffer=buffer,
+            offset=_HEADER_BYTES,
+        )
+        self._seq = np.ndarray(
+            (capacity,),
+            dtype=np.int64,
+            buffer=buffer,
+            offset=_HEADER_BYTES + self._data.nbytes,
+        )
+        if owner and self._header[0] != _MAGIC:
+            self._data[:] = 0.0
+            self._seq[:] = 0
+            self._header[:] = (_MAGIC, _LAYOUT_VERSION, capacity)
+
+    @staticmethod
+    def nbytes(capacity: int) -> int:
+        return _HEADER_BYTES + capacity * (len(COLUMNS) + 1) * 8
+
+    @classmethod
+    def create(cls, name: str, capacity: int) -> "PriceHistory":
+        """
+        기록자(리더)용 공유 메모리 세그먼트 생성.
+        이전 리더가 남긴 호환 세그먼트가 있으면 이력을 그대로 이어받습니다.
+        """
+        size = cls.nbytes(capacity)
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            shm = shared_memory.SharedMemory(name=name)
+            header = np.ndarray((_HEADER_LEN,), dtype=np.int64, buffer=shm.buf)
+            compatible = tuple(header) == (_MAGIC, _LAYOUT_VERSION, capacity)
+            del header  # 버퍼를 참조하는 배열이 남아 있으면 close할 수 없음
+            if shm.size < size or not compatible:
+                shm.close()
+                shm.unlink()
+                shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        return cls(capacity, buffer=shm.buf, shm=shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> Optional["PriceHistory"]:
+        """읽기용 세그먼트 연결. 세그먼트가 없거나 레이아웃이 다르면 None을 반환합니다."""
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            return None
+
+        # 연결만 한 프로세스가 종료될 때 resource_tracker가 세그먼트를 삭제하지 않도록 해제
+        try:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+
+        header = np.ndarray((_HEADER_LEN,), dtype=np.int64, buffer=shm.buf)
+        magic, version, capacity = (int(value) for value in header)
+        del header
+        if magic != _MAGIC or version != _LAYOUT_VERSION:
+            logger.warning(f"Incompatible price history layout: {magic}/{version}")
+            shm.close()
+            return None
+        return cls(capacity, buffer=shm.buf, shm=shm, owner=False)
+
+    def record(
+        self,
+        second: int,
+        krw: float,
+        usd: float,
+        kimchi_premium: float,
+        volume_krw: float = 0.0,
+        volume_usd: float = 0.0,
+    ):
+        """
+        second(epoch 초) 행에 현재 가격을 기록하고 거래량을 누적합니다. (단일 기록자 전용)
+        같은 초에 여러 번 호출되면 가격은 마지막 값, 거래량은 합계가 됩니다.
+        """
+        index = second % self.capacity
+        row = self._data[index]
+        if row[TIME] == second:
+            volume_krw += row[VOLUME_KRW]
+            volume_usd += row[VOLUME_USD]
+        # 같은 초를 다시 쓰는 경우에도 기록 중에는 무효 표시 (읽는 쪽이 섞인 행을 보지 않도록)
+        self._seq[index] += 1  # 홀수: 기록 중
+        row[TIME] = 0.0
+        row[KRW] = krw
+        row[USD] = usd
+        row[KIMCHI_PREMIUM] = kimchi_premium
+        row[VOLUME_KRW] = volume_krw
+        row[VOLUME_USD] = volume_usd
+        row[TIME] = second
+        self._seq[index] += 1
+
+    def query(self, end: int, window: int, step: int) -> Dict[str, List[float]]:
+        """
+        (end - window, end] 구간을 step초 단위로 다운샘플링한 열 기반 결과.
+        구간 시작 시각(step 배수)별로 가격/김치 프리미엄은 마지막 값, 거래량은 합계이며
+        데이터가 없는 구간은 생략됩니다.
+        """
+        window = min(window, self.capacity)
+        seconds = np.arange(end - window + 1, end + 1, dtype=np.int64)
+        indexes = seconds % self.capacity
+        # 복사 도중 기록된 행은 복사 전후 시퀀스가 달라지므로 제외 (복사는 GIL 없이 진행될 수 있음)
+        before = self._seq[indexes]
+        rows = self._data[indexes]
+        after = self._seq[indexes]
+        valid = (before == after) & (before % 2 == 0) & (rows[:, TIME] == seconds)
+        rows = rows[valid]
+        if len(rows) == 0:
+            return {name: [] for name in COLUMNS}
+
+        buckets = rows[:, TIME].astype(np.int64)
+        buckets -= buckets % step
+        boundary = buckets[1:] != buckets[:-1]
+        starts = np.flatnonzero(np.concatenate(([True], boundary)))
+        lasts = np.flatnonzero(np.concatenate((boundary, [True])))
+
+        result = {"time": buckets[starts].tolist()}
+        for column in (KRW, USD, KIMCHI_PREMIUM):
+            result[COLUMNS[column]] = rows[lasts, column].tolist()
+        for column in (VOLUME_KRW, VOLUME_USD):
+            result[COLUMNS[column]] = np.add.reduceat(rows[:, column], starts).tolist()
+        return result
+
+    def close(self):
+        if self.shm is None:
+            return
+        # numpy 뷰를 먼저 해제해야 공유 메모리를 닫을 수 있음
+        self._header = None
+        self._data = None
+        self._seq = None
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+        self.shm = None
@@ -0,0 +1,62 @@
+"""
+고정 용량 링 버퍼 기반 비동기 핸드오프 큐
+
+수신 루프(생산자)는 절대 대기하지 않고, 처리 단계(소비자)가 뒤처지면
+가장 오래된 항목부터 버리면서 드롭 카운터를 증가시킵니다.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+
+class RingQueue:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: Deque[Any] = deque(maxlen=maxsize)
+        # 이벤트 루프에 바인딩되지 않도록 첫 사용 시점에 생성
+        self._event: Optional[asyncio.Event] = None
+        self.enqueued = 0
+        self.dropped = 0
+        self.processed = 0
+        self.high_watermark = 0
+
+    def _get_event(self) -> asyncio.Event:
+        if self._event is None:
+            self._event = asyncio.Event()
+        return self._event
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def put_nowait(self, item: Any):
+        """항목 추가 (가득 찬 경우 가장 오래된 항목을 버림)"""
+        if len(self._items) >= self.maxsize:
+            self.dropped += 1
+        self._items.append(item)
+        self.enqueued += 1
+        if len(self._items) > self.high_watermark:
+            self.high_watermark = len(self._items)
+        self._get_event().set()
+
+    async def get_batch(self) -> List[Any]:
+        """쌓여 있는 항목을 모두 꺼냅니다. 비어 있으면 새 항목이 들어올 때까지 대기합니다."""
+        event = self._get_event()
+        while not self._items:
+            event.clear()
+            await event.wait()
+        batch = list(self._items)
+        self._items.clear()
+        self.processed += len(batch)
+        return batch
+
+    def stats(self) -> Dict[str, int]:
+        """큐 깊이 및 처리/드롭 카운터"""
+        return {
+            "depth": len(self._items),
+            "capacity": self.maxsize,
+            "high_watermark": self.high_watermark,
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "dropped": self.dropped,
+        }
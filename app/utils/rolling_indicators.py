@@ -0,0 +1,215 @@
+"""
+증분 기술 지표
+
+캔들이 확정될 때마다 O(1)로 상태를 갱신하고, 진행 중인 캔들의 현재가로는
+상태를 바꾸지 않은 채 잠정(provisional) 값을 계산합니다.
+"""
+
+from collections import deque
+from typing import Deque, Iterable, Optional, Tuple
+
+
+class WilderRSI:
+    """
+    Wilder 평활 RSI.
+
+    ta.momentum.RSIIndicator와 같은 방식으로 초기화합니다.
+    - 첫 종가에서 평균 상승/하락폭을 0으로 시작하는 EWM(alpha=1/length, adjust=False)
+    - length개 이전까지는 값 없음(None)
+    """
+
+    def __init__(self, length: int = 14):
+        self.length = length
+        self.alpha = 1.0 / length
+        self.prev_close: Optional[float] = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.count = 0  # 반영한 종가 수
+
+    def reset(self):
+        self.prev_close = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.count = 0
+
+    def seed(self, closes: Iterable[float]):
+        """과거 종가 시계열로 상태를 다시 계산합니다. (오래된 순)"""
+        self.reset()
+        for close in closes:
+            self.update(float(close))
+
+    def _step(self, close: float):
+        """close를 반영한 (avg_gain, avg_loss)"""
+        diff = close - self.prev_close
+        gain = diff if diff > 0 else 0.0
+        loss = -diff if diff < 0 else 0.0
+        return (
+            self.avg_gain + self.alpha * (gain - self.avg_gain),
+            self.avg_loss + self.alpha * (loss - self.avg_loss),
+        )
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        if avg_loss == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    def update(self, close: float):
+        """확정된 캔들 종가 반영"""
+        if self.prev_close is not None:
+            self.avg_gain, self.avg_loss = self._step(close)
+        self.prev_close = close
+        self.count += 1
+
+    @property
+    def value(self) -> Optional[float]:
+        """마지막 확정 캔들 기준 RSI"""
+        if self.count < self.length:
+            return None
+        return self._rsi(self.avg_gain, self.avg_loss)
+
+    def provisional(self, price: float) -> Optional[float]:
+        """진행 중인 캔들의 현재가를 종가로 가정한 RSI (상태는 변경하지 않음)"""
+        if self.prev_close is None or self.count + 1 < self.length:
+            return None
+        return self._rsi(*self._step(price))
+
+
+class RollingSMA:
+    """고정 기간 단순 이동평균 (누적 합계 방식)"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.window: Deque[float] = deque()
+        self.total = 0.0
+
+    def seed(self, closes: Iterable[float]):
+        self.window.clear()
+        self.total = 0.0
+        for close in closes:
+            self.update(float(close))
+
+    def update(self, close: float):
+        """확정된 캔들 종가 반영"""
+        self.window.append(close)
+        self.total += close
+        if len(self.window) > self.period:
+            self.total -= self.window.popleft()
+
+    @property
+    def value(self) -> Optional[float]:
+        if len(self.window) < self.period:
+            return None
+        return self.total / self.period
+
+    def provisional(self, price: float) -> Optional[float]:
+        """진행 중인 캔들의 현재가를 마지막 종가로 포함한 이동평균"""
+        if len(self.window) < self.period - 1:
+            return None
+        total = self.total + price
+        if len(self.window) == self.period:
+            total -= self.window[0]
+        return total / self.period
+
+
+class RollingEMA:
+    """지수 이동평균 (처음 period개 종가의 단순 평균으로 초기화)"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.ema: Optional[float] = None
+        self._seed_total = 0.0
+        self._seed_count = 0
+
+    def seed(self, closes: Iterable[float]):
+        self.ema = None
+        self._seed_total = 0.0
+        self._seed_count = 0
+        for close in closes:
+            self.update(float(close))
+
+    def update(self, close: float):
+        """확정된 캔들 종가 반영"""
+        if self.ema is None:
+            self._seed_total += close
+            self._seed_count += 1
+            if self._seed_count == self.period:
+                self.ema = self._seed_total / self.period
+            return
+        self.ema += self.alpha * (close - self.ema)
+
+    @property
+    def value(self) -> Optional[float]:
+        return self.ema
+
+    def provisional(self, price: float) -> Optional[float]:
+        """진행 중인 캔들의 현재가를 종가로 가정한 EMA (상태는 변경하지 않음)"""
+        if self.ema is None:
+            if self._seed_count == self.period - 1:
+                return (self._seed_total + price) / self.period
+            return None
+        return self.ema + self.alpha * (price - self.ema)
+
+
+class RollingExtremes:
+    """
+    기간 내 최고가/최저가 (단조 덱 방식).
+
+    확정 캔들의 고가/저가를 (open_time, 값)으로 보관하며, 최고가 덱은 값이 감소하는 순서,
+    최저가 덱은 값이 증가하는 순서를 유지하므로 갱신은 분할 상환 O(1), 조회는 O(1)입니다.
+    window_ms가 None이면 반영된 전체 이력(사상 최고/최저)을 대상으로 합니다.
+    """
+
+    def __init__(self, window_ms: Optional[int]):
+        self.window_ms = window_ms
+        self.highs: Deque[Tuple[float, float]] = deque()
+        self.lows: Deque[Tuple[float, float]] = deque()
+
+    def seed(self, candles: Iterable[Tuple[float, float, float]]):
+        """(open_time, high, low) 시계열로 초기화 (오래된 순)"""
+        self.highs.clear()
+        self.lows.clear()
+        for open_time, high, low in candles:
+            self.update(open_time, high, low)
+
+    def extend(self, candles: Iterable[Tuple[float, float, float]]):
+        """기존 상태를 유지한 채 (open_time, high, low) 시계열 반영.
+        window_ms가 None이면 반영 순서와 관계없이 최고/최저가 바깥쪽으로만 갱신됩니다."""
+        for open_time, high, low in candles:
+            self.update(open_time, high, low)
+
+    def update(self, open_time: float, high: float, low: float):
+        """확정 캔들 반영"""
+        highs, lows = self.highs, self.lows
+        while highs and highs[-1][1] <= high:
+            highs.pop()
+        highs.append((open_time, high))
+        while lows and lows[-1][1] >= low:
+            lows.pop()
+        lows.append((open_time, low))
+        self.evict(open_time)
+
+    def evict(self, now: float):
+        """now 기준 기간을 벗어난 항목 제거"""
+        if self.window_ms is None:
+            return
+        start = now - self.window_ms
+        while self.highs and self.highs[0][0] <= start:
+            self.highs.popleft()
+        while self.lows and self.lows[0][0] <= start:
+            self.lows.popleft()
+
+    def high(self, live: Optional[Tuple[float, float]] = None):
+        """(open_time, 최고가). live=(open_time, 진행 중 캔들 고가)를 포함해 비교"""
+        best = self.highs[0] if self.highs else None
+        if live is not None and (best is None or live[1] >= best[1]):
+            return live
+        return best
+
+    def low(self, live: Optional[Tuple[float, float]] = None):
+        """(open_time, 최저가). live=(open_time, 진행 중 캔들 저가)를 포함해 비교"""
+        best = self.lows[0] if self.lows else None
+        if live is not None and (best is None or live[1] <= best[1]):
+            return live
+        return best
@@ -0,0 +1,211 @@
+"""
+주기 작업 스케줄러
+
+작업마다 고정 주기(interval)의 정각 배수 + offset 시각에 실행합니다. (예: 매시 정각 + 2분)
+실행 시간이 누적되어 밀리지 않고(drift 없음), jitter로 여러 워커/작업의 외부 API 호출이
+같은 순간에 몰리지 않게 분산합니다.
+
+- 작업별로 동시에 하나만 실행되며(single-flight), 실행이 다음 슬롯을 넘기면 놓친 슬롯은 건너뜁니다.
+- 실행 시간 히스토그램, 최근 결과, 다음 실행 시각을 status()로 제공합니다.
+- status_path가 주어지면 실행마다 상태를 JSON 파일로 기록하여 다른 워커도 조회할 수 있습니다.
+"""
+
+import asyncio
+import bisect
+import logging
+import os
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+from app.utils import serializer
+
+logger = logging.getLogger(__name__)
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def previous_slot(now: float, interval: float, offset: float = 0) -> float:
+    """now 이전(포함) 마지막 슬롯 시각 (epoch 초, jitter 제외)"""
+    offset %= interval
+    return ((now - offset) // interval) * interval + offset
+
+
+class ScheduledJob:
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        interval: float,
+        offset: float = 0,
+        jitter: float = 0,
+        timeout: Optional[float] = None,
+        buckets: Sequence[float] = (),
+    ):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.offset = offset % interval
+        self.jitter = jitter
+        self.timeout = timeout
+        self.buckets = tuple(buckets)  # 실행 시간 히스토그램 상한 (ms, 오름차순)
+        self.histogram = [0] * (len(self.buckets) + 1)  # 마지막 칸은 상한 초과
+        self.running = False
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0  # 이전 실행이 길어져 건너뛴 슬롯 수
+        self.next_run_ms: Optional[int] = None
+        self.last_started_ms: Optional[int] = None
+        self.last_duration_ms: Optional[float] = None
+        self.last_success_ms: Optional[int] = None
+        self.last_error: Optional[str] = None
+
+    def next_slot(self, now: float) -> float:
+        """now 이후 첫 슬롯 시각 (epoch 초, jitter 포함)"""
+        slot = previous_slot(now, self.interval, self.offset) + self.interval
+        return slot + random.uniform(0, self.jitter)
+
+    def observe(self, duration_ms: float):
+        self.histogram[bisect.bisect_left(self.buckets, duration_ms)] += 1
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "interval": self.interval,
+            "offset": self.offset,
+            "jitter": self.jitter,
+            "running": self.running,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "next_run_ms": self.next_run_ms,
+            "last_started_ms": self.last_started_ms,
+            "last_duration_ms": self.last_duration_ms,
+            "last_success_ms": self.last_success_ms,
+            "last_error": self.last_error,
+            "duration_histogram_ms": {
+                **{
+                    f"le_{bound:g}": count
+                    for bound, count in zip(self.buckets, self.histogram)
+                },
+                "inf": self.histogram[-1],
+            },
+        }
+
+
+class JobScheduler:
+    def __init__(
+        self,
+        buckets: Sequence[float] = (),
+        default_timeout: Optional[float] = None,
+        status_path: Optional[str] = None,
+    ):
+        self.buckets = tuple(buckets)
+        self.default_timeout = default_timeout
+        self.status_path = status_path
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self.running = False
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        interval: float,
+        offset: float = 0,
+        jitter: float = 0,
+        timeout: Optional[float] = None,
+    ) -> ScheduledJob:
+        """작업 등록. timeout 미지정 시 기본 타임아웃과 주기 중 작은 값을 사용합니다."""
+        if timeout is None:
+            timeout = min(self.default_timeout or interval, interval)
+        job = ScheduledJob(
+            name, func, interval, offset, jitter, timeout, buckets=self.buckets
+        )
+        self.jobs[name] = job
+        return job
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        for job in self.jobs.values():
+            self._tasks[job.name] = asyncio.create_task(self._loop(job))
+        self.write_status()
+
+    async def stop(self):
+        self.running = False
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks.clear()
+        for job in self.jobs.values():
+            job.next_run_ms = None
+
+    async def _loop(self, job: ScheduledJob):
+        while self.running:
+            slot = job.next_slot(time.time())
+            job.next_run_ms = int(slot * 1000)
+            await asyncio.sleep(max(0.0, slot - time.time()))
+            started = time.time()
+            await self.run(job.name)
+            # 실행이 다음 슬롯을 넘겼다면 놓친 슬롯은 다시 실행하지 않음
+            job.skipped += int((time.time() - started) // job.interval)
+
+    async def run(self, name: str) -> bool:
+        """작업 1회 실행. 이미 실행 중이면 건너뛰고 False를 반환합니다."""
+        job = self.jobs[name]
+        if job.running:
+            job.skipped += 1
+            return False
+
+        job.running = True
+        job.last_started_ms = _now_ms()
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(job.func(), timeout=job.timeout)
+            job.last_success_ms = _now_ms()
+            job.last_error = None
+        except asyncio.TimeoutError:
+            job.failures += 1
+            job.last_error = f"timeout after {job.timeout}s"
+            logger.warning(f"Scheduled job {name} timed out after {job.timeout}s")
+        except Exception as e:
+            job.failures += 1
+            job.last_error = str(e)
+            logger.error(f"Scheduled job {name} failed: {str(e)}")
+        finally:
+            job.running = False
+            job.runs += 1
+            job.last_duration_ms = round((time.perf_counter() - start) * 1000, 1)
+            job.observe(job.last_duration_ms)
+        self.write_status()
+        return True
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "updated_ms": _now_ms(),
+            "jobs": {name: job.status() for name, job in self.jobs.items()},
+        }
+
+    def write_status(self):
+        """상태를 JSON 파일로 기록 (임시 파일 작성 후 교체하여 읽는 쪽이 부분 파일을 보지 않음)"""
+        if not self.status_path:
+            return
+        try:
+            temp_path = f"{self.status_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(serializer.dumps_bytes(self.status()))
+            os.replace(temp_path, self.status_path)
+        except OSError as e:
+            logger.warning(f"Failed to write scheduler status: {str(e)}")
+
+    @staticmethod
+    def read_status(path: str) -> Optional[Dict[str, Any]]:
+        """다른 워커(리더)가 기록한 상태 파일 읽기. 파일이 없으면 None"""
+        try:
+            with open(path, "rb") as f:
+                return serializer.loads(f.read())
+        except (OSError, ValueError):
+            return None
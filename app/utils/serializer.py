@@ -0,0 +1,68 @@
+"""
+JSON 직렬화/역직렬화 계층
+
+틱 경로(업비트/바이낸스 메시지 파싱, 브로드캐스트)와 REST 응답에서 공통으로 사용합니다.
+orjson이 설치되어 있으면 사용하고, 없으면 표준 라이브러리 json으로 대체합니다.
+"""
+
+import json
+import logging
+from typing import Any, Union
+
+from fastapi.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    # MA 결과처럼 정수 키를 가진 딕셔너리도 직렬화할 수 있도록 허용
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """객체를 UTF-8 JSON 바이트로 직렬화합니다."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+    def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        """JSON 문자열/바이트를 파싱합니다."""
+        return orjson.loads(data)
+
+    BACKEND = "orjson"
+
+except ImportError:  # orjson 미설치 환경
+
+    def _default(obj: Any) -> Any:
+        """표준 json이 처리하지 못하는 타입(datetime, numpy 스칼라/배열) 변환"""
+        if hasattr(obj, "isoformat"):
+            return obj.isoformat()
+        if hasattr(obj, "tolist"):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """객체를 UTF-8 JSON 바이트로 직렬화합니다."""
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), default=_default
+        ).encode("utf-8")
+
+    def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        """JSON 문자열/바이트를 파싱합니다."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    BACKEND = "json"
+
+logger.debug(f"JSON serializer backend: {BACKEND}")
+
+
+def dumps(obj: Any) -> str:
+    """객체를 JSON 문자열로 직렬화합니다. (WebSocket 텍스트 프레임용)"""
+    return dumps_bytes(obj).decode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """serializer 백엔드를 사용하는 기본 응답 클래스"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
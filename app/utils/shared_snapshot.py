@@ -0,0 +1,193 @@
+"""
+공유 메모리 가격 스냅샷 (seqlock)
+
+수집 리더가 시장 스냅샷을 고정 레이아웃의 multiprocessing.shared_memory 세그먼트에 기록하면,
+다른 워커 프로세스는 IPC 왕복 없이 이를 직접 읽어 REST/WebSocket 초기 프레임을 제공합니다.
+
+레이아웃 (little-endian):
+    0   magic(4s) layout_version(I)
+    8   seq(Q)                      - seqlock 카운터 (홀수: 기록 중)
+    16  krw, usd, kimchi_premium, change_krw, change_usd (5d), updated_at_ms(q)
+    64  payload_len(I) + padding
+    72  payload (전체 스냅샷 JSON, 최대 capacity 바이트)
+
+기록자는 seq를 홀수로 올린 뒤 데이터를 쓰고 다시 짝수로 올립니다.
+읽는 쪽은 기록자를 절대 기다리게 하지 않으며, 읽기 전후 seq가 다르거나 홀수이면 다시 읽어
+찢어진(torn) 스냅샷을 반환하지 않습니다.
+"""
+
+import logging
+import struct
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Optional, Tuple
+
+from app.utils import serializer
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"BNSS"
+_LAYOUT_VERSION = 1
+
+_HEADER = struct.Struct("<4sI")
+_SEQ = struct.Struct("<Q")
+_FIELDS = struct.Struct("<5dq")
+_PAYLOAD_LEN = struct.Struct("<I")
+
+_SEQ_OFFSET = 8
+_FIELDS_OFFSET = 16
+_PAYLOAD_LEN_OFFSET = 64
+_PAYLOAD_OFFSET = 72
+
+# 기록 중인 스냅샷을 만났을 때 재시도 횟수 (기록은 수 마이크로초 내에 끝남)
+_MAX_READ_RETRIES = 1000
+
+FIELD_NAMES = (
+    "krw",
+    "usd",
+    "kimchi_premium",
+    "change_krw",
+    "change_usd",
+    "updated_at_ms",
+)
+
+
+class SharedSnapshot:
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self.shm = shm
+        self.owner = owner
+        self.capacity = shm.size - _PAYLOAD_OFFSET
+        self._seq = 0
+        # 읽기 측 파싱 캐시 (seq가 같으면 재파싱하지 않음)
+        self._cached_seq = -1
+        self._cached: Optional[Tuple[Dict[str, Any], bytes]] = None
+
+    @classmethod
+    def create(cls, name: str, capacity: int) -> "SharedSnapshot":
+        """
+        기록자(리더)용 세그먼트 생성.
+
+        이전 리더가 남긴 세그먼트가 있으면 그대로 이어받아, 이미 연결된 읽기 프로세스가
+        리더 교체 후에도 같은 세그먼트에서 계속 읽을 수 있도록 합니다.
+        """
+        size = _PAYLOAD_OFFSET + capacity
+        seq = 0
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            shm = shared_memory.SharedMemory(name=name)
+            magic, version = _HEADER.unpack_from(shm.buf, 0)
+            if shm.size < size or magic != _MAGIC or version != _LAYOUT_VERSION:
+                shm.close()
+                shm.unlink()
+                shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            else:
+                # 기록 도중 종료된 경우를 대비해 짝수로 맞춤
+                (seq,) = _SEQ.unpack_from(shm.buf, _SEQ_OFFSET)
+                seq += seq & 1
+
+        _HEADER.pack_into(shm.buf, 0, _MAGIC, _LAYOUT_VERSION)
+        _SEQ.pack_into(shm.buf, _SEQ_OFFSET, seq)
+        if seq == 0:
+            _PAYLOAD_LEN.pack_into(shm.buf, _PAYLOAD_LEN_OFFSET, 0)
+        snapshot = cls(shm, owner=True)
+        snapshot._seq = seq
+        return snapshot
+
+    @classmethod
+    def attach(cls, name: str) -> Optional["SharedSnapshot"]:
+        """읽기용 세그먼트 연결. 세그먼트가 없거나 레이아웃이 다르면 None을 반환합니다."""
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            return None
+
+        # 연결만 한 프로세스가 종료될 때 resource_tracker가 세그먼트를 삭제하지 않도록 해제
+        try:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+
+        magic, version = _HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC or version != _LAYOUT_VERSION:
+            logger.warning(f"Incompatible shared snapshot layout: {magic}/{version}")
+            shm.close()
+            return None
+        return cls(shm, owner=False)
+
+    def write(
+        self, fields: Tuple[float, float, float, float, float, int], payload: bytes
+    ):
+        """스냅샷 기록 (단일 기록자 전용)"""
+        buf = self.shm.buf
+        if len(payload) > self.capacity:
+            logger.warning(
+                f"Snapshot payload ({len(payload)} bytes) exceeds shared memory capacity"
+            )
+            payload = b""
+
+        self._seq += 1  # 홀수: 기록 시작
+        _SEQ.pack_into(buf, _SEQ_OFFSET, self._seq)
+        _FIELDS.pack_into(buf, _FIELDS_OFFSET, *fields)
+        _PAYLOAD_LEN.pack_into(buf, _PAYLOAD_LEN_OFFSET, len(payload))
+        buf[_PAYLOAD_OFFSET : _PAYLOAD_OFFSET + len(payload)] = payload
+        self._seq += 1  # 짝수: 기록 완료
+        _SEQ.pack_into(buf, _SEQ_OFFSET, self._seq)
+
+    def _read_consistent(self, with_payload: bool):
+        buf = self.shm.buf
+        for _ in range(_MAX_READ_RETRIES):
+            (seq1,) = _SEQ.unpack_from(buf, _SEQ_OFFSET)
+            if seq1 & 1:
+                continue
+            fields = _FIELDS.unpack_from(buf, _FIELDS_OFFSET)
+            payload = None
+            if with_payload:
+                if seq1 == self._cached_seq:
+                    payload = b""  # 캐시 사용
+                else:
+                    (length,) = _PAYLOAD_LEN.unpack_from(buf, _PAYLOAD_LEN_OFFSET)
+                    payload = bytes(buf[_PAYLOAD_OFFSET : _PAYLOAD_OFFSET + length])
+            (seq2,) = _SEQ.unpack_from(buf, _SEQ_OFFSET)
+            if seq1 == seq2:
+                return seq1, fields, payload
+        return None
+
+    def read_fields(self) -> Optional[Dict[str, float]]:
+        """고정 필드(가격, 김치 프리미엄, 변동률)만 읽습니다. JSON 파싱 없음"""
+        result = self._read_consistent(with_payload=False)
+        if result is None:
+            return None
+        seq, fields, _ = result
+        if seq == 0:
+            return None  # 아직 기록된 적 없음
+        return dict(zip(FIELD_NAMES, fields))
+
+    def read_payload(self) -> Optional[Tuple[int, bytes]]:
+        """(seq, 전체 스냅샷 JSON 바이트)를 읽습니다."""
+        result = self.read()
+        if result is None:
+            return None
+        return self._cached_seq, self._cached[1]
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        """전체 스냅샷을 읽어 딕셔너리로 반환합니다. (seq 단위로 파싱 결과 캐시)"""
+        result = self._read_consistent(with_payload=True)
+        if result is None:
+            return None
+        seq, _, payload = result
+        if seq == 0:
+            return None
+        if seq != self._cached_seq:
+            if not payload:
+                return None
+            self._cached = (serializer.loads(payload), payload)
+            self._cached_seq = seq
+        return self._cached[0]
+
+    def close(self):
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
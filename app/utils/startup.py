@@ -0,0 +1,99 @@
+"""
+서비스 시작 단계 오케스트레이터
+
+초기화 단계를 의존 관계(after)만 지키면서 동시에 실행하고, 단계별 타임아웃을 적용합니다.
+한 단계가 실패하거나 시간 초과되어도 다른 단계와 서비스 시작은 계속 진행되며,
+단계별 상태/소요 시간은 report에 남아 /stream/metrics로 확인할 수 있습니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StartupOrchestrator:
+    def __init__(self, default_timeout: float):
+        self.default_timeout = default_timeout
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self.report: Dict[str, Dict[str, Any]] = {}
+        self.started_ms = 0
+        self.duration_ms: Optional[float] = None  # 전체 소요 시간 (완료 전에는 None)
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None,
+        after: Iterable[str] = (),
+    ):
+        """단계 등록. after의 단계는 먼저 등록되어 있어야 합니다."""
+        after = tuple(after)
+        unknown = [dep for dep in after if dep not in self.steps]
+        if unknown:
+            raise ValueError(f"Unknown startup dependency for {name}: {unknown}")
+        self.steps[name] = {
+            "func": func,
+            "timeout": timeout or self.default_timeout,
+            "after": after,
+        }
+        self.report[name] = {"status": "pending", "duration_ms": None}
+
+    def skip(self, name: str, reason: str):
+        """실행하지 않는 단계를 결과에 기록 (예: 워밍 스타트로 복원한 값이 아직 최신)"""
+        self.report[name] = {"status": "skipped", "duration_ms": 0.0, "reason": reason}
+        logger.info(f"Startup step {name} skipped: {reason}")
+
+    async def _run_step(self, name: str, tasks: Dict[str, asyncio.Task]):
+        step = self.steps[name]
+        # 선행 단계는 성공 여부와 관계없이 끝나기만 기다림 (실패 시 부분 데이터로 진행)
+        for dep in step["after"]:
+            await tasks[dep]
+
+        self.report[name]["status"] = "running"
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(step["func"](), timeout=step["timeout"])
+            status, error = "ok", None
+        except asyncio.TimeoutError:
+            status, error = "timeout", f"exceeded {step['timeout']}s"
+        except Exception as e:
+            status, error = "error", str(e)
+        duration_ms = round((time.perf_counter() - start) * 1000, 1)
+
+        self.report[name] = {"status": status, "duration_ms": duration_ms}
+        if error:
+            self.report[name]["error"] = error
+            logger.warning(
+                f"Startup step {name} {status} after {duration_ms}ms: {error}"
+            )
+        else:
+            logger.info(f"Startup step {name} completed in {duration_ms}ms")
+
+    async def run(self) -> Dict[str, Dict[str, Any]]:
+        """등록된 모든 단계를 실행하고 단계별 결과를 반환합니다."""
+        self.started_ms = int(time.time() * 1000)
+        start = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+        for name in self.steps:  # 등록 순서 = 의존 관계 위상 순서
+            tasks[name] = asyncio.create_task(self._run_step(name, tasks))
+        await asyncio.gather(*tasks.values())
+        self.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+
+        failed = [
+            name for name, result in self.report.items() if result["status"] != "ok"
+        ]
+        logger.info(
+            f"Startup completed in {self.duration_ms}ms"
+            + (f" (failed: {', '.join(failed)})" if failed else "")
+        )
+        return self.report
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "started_ms": self.started_ms,
+            "duration_ms": self.duration_ms,
+            "steps": self.report,
+        }
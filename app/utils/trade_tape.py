@@ -0,0 +1,242 @@
+"""
+체결 테이프 기록기 (append-only, mmap)
+
+거래소에서 받은 체결을 고정 폭 레코드로 소스/일자(UTC)별 세그먼트 파일에 추가 기록합니다.
+벤치마크/백테스트 재생과 알림 발동 근거 확인용이며, 읽을 때는 파일을 numpy 구조화 배열로
+그대로 매핑하므로 복사가 없습니다.
+
+세그먼트 레이아웃 (little-endian):
+    0   magic(8s) layout_version(I) record_size(I) count(Q) - count는 기록이 끝난 레코드 수
+    64  레코드 배열 (RECORD_DTYPE)
+
+세그먼트는 수신 순서가 아니라 체결 자체의 시각으로 고르며, 자정 직후 늦게 도착한 전날 체결이
+다음 날 파일에 섞이지 않도록 소스별로 최근 2일의 세그먼트를 열어 둡니다.
+
+파일은 희소(sparse) 파일로 미리 늘려 두고 가득 차면 두 배로 확장합니다.
+레코드를 먼저 쓰고 count를 나중에 올리므로, 읽는 쪽은 항상 완성된 레코드만 봅니다.
+"""
+
+import logging
+import mmap
+import os
+import struct
+from datetime import date, datetime, timezone
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"BNTAPE01"
+_LAYOUT_VERSION = 1
+_HEADER = struct.Struct("<8sIIQ")
+_COUNT = struct.Struct("<Q")
+_COUNT_OFFSET = 16
+_DATA_OFFSET = 64
+
+# 체결 방향 (테이커 기준)
+SIDE_SELL = -1
+SIDE_UNKNOWN = 0
+SIDE_BUY = 1
+
+RECORD_DTYPE = np.dtype(
+    {
+        "names": ["ts", "price", "size", "trade_id", "side"],
+        "formats": ["<i8", "<f8", "<f8", "<i8", "i1"],
+        "offsets": [0, 8, 16, 24, 32],
+        "itemsize": 40,
+    }
+)
+
+_DAY_MS = 24 * 60 * 60 * 1000
+
+
+def segment_path(directory: str, source: str, day: date) -> str:
+    return os.path.join(directory, f"{source}-{day:%Y%m%d}.tape")
+
+
+def _utc_day(day_index: int) -> date:
+    """epoch 기준 UTC 일 번호(ts_ms // _DAY_MS)를 날짜로 변환"""
+    return datetime.fromtimestamp(day_index * _DAY_MS / 1000, tz=timezone.utc).date()
+
+
+class TapeSegment:
+    """단일 세그먼트 파일 기록기 (단일 기록자 전용)"""
+
+    def __init__(self, path: str, capacity: int):
+        self.path = path
+        exists = os.path.exists(path) and os.path.getsize(path) >= _DATA_OFFSET
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        if exists:
+            with open(path, "rb") as f:
+                magic, version, record_size, count = _HEADER.unpack(
+                    f.read(_HEADER.size)
+                )
+            if (
+                magic != _MAGIC
+                or version != _LAYOUT_VERSION
+                or record_size != RECORD_DTYPE.itemsize
+            ):
+                os.close(self._fd)
+                raise ValueError(f"Incompatible trade tape segment: {path}")
+            self.count = count
+            capacity = max(
+                capacity,
+                (os.path.getsize(path) - _DATA_OFFSET) // RECORD_DTYPE.itemsize,
+            )
+        else:
+            self.count = 0
+        self._map(capacity)
+        if not exists:
+            _HEADER.pack_into(
+                self._mm, 0, _MAGIC, _LAYOUT_VERSION, RECORD_DTYPE.itemsize, 0
+            )
+
+    def _map(self, capacity: int):
+        self.capacity = capacity
+        os.ftruncate(self._fd, _DATA_OFFSET + capacity * RECORD_DTYPE.itemsize)
+        self._mm = mmap.mmap(self._fd, 0)
+        self._records = np.ndarray(
+            (capacity,), dtype=RECORD_DTYPE, buffer=self._mm, offset=_DATA_OFFSET
+        )
+
+    def _grow(self):
+        self._records = None  # mmap을 닫기 전에 numpy 뷰 해제
+        self._mm.close()
+        self._map(self.capacity * 2)
+
+    def append(self, ts: int, price: float, size: float, trade_id: int, side: int):
+        if self.count >= self.capacity:
+            self._grow()
+        self._records[self.count] = (ts, price, size, trade_id, side)
+        self.count += 1
+        _COUNT.pack_into(self._mm, _COUNT_OFFSET, self.count)
+
+    def close(self):
+        if self._mm is None:
+            return
+        self._records = None
+        self._mm.flush()
+        self._mm.close()
+        self._mm = None
+        # 사용하지 않은 희소 영역 제거
+        os.ftruncate(self._fd, _DATA_OFFSET + self.count * RECORD_DTYPE.itemsize)
+        os.close(self._fd)
+
+
+class TradeTape:
+    """소스별(upbit, binance) 일자 세그먼트 기록기"""
+
+    def __init__(self, directory: str, segment_records: int):
+        self.directory = directory
+        self.segment_records = segment_records
+        # source -> {UTC 일 번호: 세그먼트}, 최근 2일(당일, 전날)만 열어 둠
+        self.segments: Dict[str, Dict[int, TapeSegment]] = {}
+        self.recorded = 0
+        self.rejected = 0  # 체결 ID가 없어 기록하지 않은 체결 수
+        os.makedirs(directory, exist_ok=True)
+
+    def record(
+        self,
+        source: str,
+        ts: int,
+        price: float,
+        size: float,
+        trade_id: Optional[int],
+        side: int = SIDE_UNKNOWN,
+    ) -> bool:
+        """
+        체결 1건 추가. 체결 시각(UTC)의 날짜에 해당하는 세그먼트에 기록합니다.
+        trade_id가 없으면 재생 시 중복/누락을 판별할 수 없으므로 기록하지 않고 False를 반환합니다.
+        """
+        if trade_id is None:
+            self.rejected += 1
+            return False
+        day = ts // _DAY_MS
+        days = self.segments.setdefault(source, {})
+        segment = days.get(day)
+        if segment is not None:
+            segment.append(ts, price, size, trade_id, side)
+        elif days and day < max(days) - 1:
+            # 열어 둔 기간보다 오래된 체결: 해당 일자 파일에 이어 쓰고 바로 닫음
+            segment = self._open(source, day)
+            segment.append(ts, price, size, trade_id, side)
+            segment.close()
+        else:
+            self._rotate(source, day).append(ts, price, size, trade_id, side)
+        self.recorded += 1
+        return True
+
+    def _open(self, source: str, day: int) -> TapeSegment:
+        segment = TapeSegment(
+            segment_path(self.directory, source, _utc_day(day)), self.segment_records
+        )
+        logger.info(f"Trade tape segment opened: {segment.path}")
+        return segment
+
+    def _rotate(self, source: str, day: int) -> TapeSegment:
+        """day 세그먼트를 열고, 전날보다 오래된 세그먼트는 닫습니다."""
+        days = self.segments[source]
+        days[day] = self._open(source, day)
+        latest = max(days)
+        for old in [d for d in days if d < latest - 1]:
+            days.pop(old).close()
+        return days[day]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "recorded": self.recorded,
+            "rejected": self.rejected,
+            # 소스별 최신 일자 세그먼트의 기록 수
+            **{
+                source: days[max(days)].count
+                for source, days in self.segments.items()
+                if days
+            },
+        }
+
+    def close(self):
+        for days in self.segments.values():
+            for segment in days.values():
+                segment.close()
+        self.segments.clear()
+
+
+def read_segment(path: str) -> np.ndarray:
+    """
+    세그먼트의 기록 완료된 레코드를 구조화 배열로 반환합니다. (읽기 전용 memmap, 복사 없음)
+    기록 중인 세그먼트도 호출 시점까지의 레코드를 안전하게 읽을 수 있습니다.
+    """
+    with open(path, "rb") as f:
+        magic, version, record_size, count = _HEADER.unpack(f.read(_HEADER.size))
+    if (
+        magic != _MAGIC
+        or version != _LAYOUT_VERSION
+        or record_size != RECORD_DTYPE.itemsize
+    ):
+        raise ValueError(f"Incompatible trade tape segment: {path}")
+    if count == 0:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.memmap(
+        path, dtype=RECORD_DTYPE, mode="r", offset=_DATA_OFFSET, shape=(count,)
+    )
+
+
+def iter_tape(
+    directory: str,
+    source: str,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> Iterator[np.ndarray]:
+    """source의 세그먼트를 날짜 순으로 순회하며 구조화 배열을 반환합니다. (start/end 포함)"""
+    prefix = f"{source}-"
+    for name in sorted(os.listdir(directory)):
+        if not (name.startswith(prefix) and name.endswith(".tape")):
+            continue
+        try:
+            day = datetime.strptime(name[len(prefix) : -len(".tape")], "%Y%m%d").date()
+        except ValueError:
+            continue
+        if (start is not None and day < start) or (end is not None and day > end):
+            continue
+        yield read_segment(os.path.join(directory, name))
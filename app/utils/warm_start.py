@@ -0,0 +1,74 @@
+"""
+워밍 스타트 저장소
+
+수집 리더가 주기적으로 마지막 스냅샷(JSON)과 캔들 버퍼를 로컬 .npz 파일 하나에 저장하고,
+재시작 시 이를 읽어 외부 API 호출 없이 바로 서비스할 수 있게 합니다.
+파일은 임시 파일에 쓴 뒤 교체하므로, 저장 도중 종료되어도 이전 파일이 그대로 남습니다.
+"""
+
+import logging
+import os
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+import numpy as np
+
+from app.utils import serializer
+
+logger = logging.getLogger(__name__)
+
+_LAYOUT_VERSION = 1
+_CANDLE_PREFIX = "candles:"
+
+
+class WarmStart(NamedTuple):
+    saved_ms: int
+    snapshot: Dict[str, Any]  # MarketSnapshot.to_dict() 형식
+    candles: Dict[str, Dict[str, np.ndarray]]  # CandleStore.dump() 형식
+
+
+def save(path: str, payload: bytes, candles: Dict[str, Dict[str, np.ndarray]]):
+    """스냅샷 payload와 캔들 배열 저장 (블로킹 파일 I/O, 스레드에서 호출)"""
+    arrays = {
+        "layout_version": np.array(_LAYOUT_VERSION),
+        "saved_ms": np.array(int(time.time() * 1000)),
+        "snapshot": np.frombuffer(payload, dtype=np.uint8),
+    }
+    for symbol, by_interval in candles.items():
+        for interval, rows in by_interval.items():
+            arrays[f"{_CANDLE_PREFIX}{symbol}:{interval}"] = rows
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(temp_path, path)
+
+
+def load(path: str, max_age: float) -> Optional[WarmStart]:
+    """저장 파일 읽기. 없거나, 손상되었거나, max_age초보다 오래되었으면 None"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as data:
+            if int(data["layout_version"]) != _LAYOUT_VERSION:
+                logger.warning(f"Ignoring warm start file with old layout: {path}")
+                return None
+            saved_ms = int(data["saved_ms"])
+            snapshot = serializer.loads(data["snapshot"].tobytes())
+            candles: Dict[str, Dict[str, np.ndarray]] = {}
+            for key in data.files:
+                if key.startswith(_CANDLE_PREFIX):
+                    symbol, interval = key[len(_CANDLE_PREFIX) :].rsplit(":", 1)
+                    candles.setdefault(symbol, {})[interval] = data[key]
+    except Exception as e:
+        logger.warning(f"Failed to read warm start file {path}: {str(e)}")
+        return None
+
+    age = time.time() - saved_ms / 1000
+    if age > max_age:
+        logger.info(f"Ignoring warm start file saved {age:.0f}s ago: {path}")
+        return None
+    return WarmStart(saved_ms, snapshot, candles)
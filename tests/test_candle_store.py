@@ -0,0 +1,115 @@
+import numpy as np
+
+from app.utils.candle_store import CLOSE, OPEN_TIME, CandleSeries, CandleStore
+
+MINUTE = 60_000
+
+
+def candle(open_time: int, close: float, volume: float = 1.0):
+    return (open_time, close, close, close, close, volume)
+
+
+def test_restore_keeps_only_candles_closed_at_save_time():
+    store = CandleStore(["BTCUSDT"], {"1m": 10})
+    saved_ms = 10 * MINUTE + 30_000  # 10분봉 진행 중에 저장
+    rows = [candle(minute * MINUTE, 100.0 + minute) for minute in range(5, 11)]
+    store.restore({"BTCUSDT": {"1m": np.array(rows, dtype=np.float64)}}, saved_ms)
+
+    series = store.get("BTCUSDT", "1m")
+    assert series.current is None
+    assert series.closed()[:, OPEN_TIME].tolist() == [
+        minute * MINUTE for minute in range(5, 10)
+    ]
+
+
+def test_first_trade_after_restore_does_not_close_a_stale_candle():
+    series = CandleSeries("1m", 10)
+    series.restore_closed([candle(0, 100.0), candle(MINUTE, 101.0)], 2 * MINUTE + 1)
+
+    # 재시작 후 몇 분 뒤의 첫 체결: 확정 캔들도, 공백 채움도 없어야 함
+    assert series.update(7 * MINUTE + 5, 105.0, 1.0) is None
+    assert len(series.closed()) == 2
+    assert series.current[OPEN_TIME] == 7 * MINUTE
+    assert series.current[CLOSE] == 105.0
+
+
+def test_high_low_covers_window_including_current_candle():
+    hour = 60 * MINUTE
+    series = CandleSeries("1h", 48)
+    series.load(
+        [
+            (index * hour, 150.0, 200.0 - index, 100.0 - index, 150.0, 1.0)
+            for index in range(30)
+        ]
+    )
+
+    # 진행 중인 봉(29)과 그 이전 24시간의 확정 봉(5~28)만 포함
+    assert series.high_low(24 * hour) == (195.0, 71.0)
+    assert series.high_low(2 * hour) == (173.0, 71.0)
+    assert CandleSeries("1h", 48).high_low(24 * hour) is None
+
+
+def test_update_closes_candle_on_next_bucket():
+    series = CandleSeries("1m", 10)
+
+    assert series.update(0, 100.0, 1.0) is None
+    assert series.update(10_000, 105.0, 2.0) is None
+    assert series.update(20_000, 95.0, 1.0) is None
+    closed = series.update(MINUTE + 1000, 101.0, 1.0)
+
+    assert closed == [0.0, 100.0, 105.0, 95.0, 95.0, 4.0]
+    assert series.current == [float(MINUTE), 101.0, 101.0, 101.0, 101.0, 1.0]
+    # 현재 캔들보다 이전 버킷의 지연 체결은 무시
+    assert series.update(30_000, 90.0, 1.0) is None
+    assert series.closed().tolist() == [closed]
+
+
+def test_update_fills_gap_with_flat_candles():
+    series = CandleSeries("1m", 10)
+    series.update(0, 100.0, 1.0)
+    series.update(3 * MINUTE, 110.0, 1.0)
+
+    closed = series.closed()
+    assert closed[:, OPEN_TIME].tolist() == [0, MINUTE, 2 * MINUTE]
+    assert closed[1:].tolist() == [
+        [MINUTE, 100.0, 100.0, 100.0, 100.0, 0.0],
+        [2 * MINUTE, 100.0, 100.0, 100.0, 100.0, 0.0],
+    ]
+
+
+def test_gap_longer_than_capacity_keeps_latest_candles():
+    series = CandleSeries("1m", 3)
+    series.update(0, 100.0, 1.0)
+    series.update(100 * MINUTE, 110.0, 1.0)
+
+    assert series.closed()[:, OPEN_TIME].tolist() == [
+        97 * MINUTE,
+        98 * MINUTE,
+        99 * MINUTE,
+    ]
+
+
+def test_load_merges_live_candle_with_last_rest_candle():
+    series = CandleSeries("1m", 10)
+    series.update(2 * MINUTE + 1000, 120.0, 0.5)  # 백필 중 체결로 생긴 진행 캔들
+
+    series.load(
+        [
+            (2 * MINUTE, 110.0, 115.0, 108.0, 112.0, 3.0),
+            (0, 100.0, 101.0, 99.0, 100.0, 1.0),
+            (MINUTE, 100.0, 111.0, 100.0, 110.0, 2.0),
+        ]
+    )
+
+    assert series.closed()[:, OPEN_TIME].tolist() == [0, MINUTE]
+    assert series.current == [2.0 * MINUTE, 110.0, 120.0, 108.0, 120.0, 3.0]
+
+
+def test_load_keeps_newer_live_candle():
+    series = CandleSeries("1m", 10)
+    series.update(3 * MINUTE, 120.0, 0.5)
+
+    series.load([candle(0, 100.0), candle(MINUTE, 101.0)])
+
+    assert series.closed()[:, CLOSE].tolist() == [100.0, 101.0]
+    assert series.current[OPEN_TIME] == 3 * MINUTE
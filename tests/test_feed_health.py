@@ -0,0 +1,43 @@
+from app.utils.feed_health import TradeDeduplicator
+
+
+def test_duplicates_from_other_connection_are_dropped():
+    dedup = TradeDeduplicator(window=10)
+
+    assert [dedup.accept(trade_id) for trade_id in (1, 2, 2, 3, 1)] == [
+        True,
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert dedup.stats()["duplicates"] == 2
+    assert dedup.stats()["accepted"] == 3
+
+
+def test_late_trade_inside_window_is_accepted_once():
+    dedup = TradeDeduplicator(window=10)
+    for trade_id in (1, 2, 4, 5):
+        assert dedup.accept(trade_id)
+    assert dedup.stats()["pending"] == 1
+
+    # 느린 연결에서 늦게 도착한 3번은 한 번만 통과
+    assert dedup.accept(3)
+    assert not dedup.accept(3)
+    assert dedup.stats()["pending"] == 0
+    assert dedup.stats()["missing"] == 0
+
+
+def test_ids_leaving_window_unseen_are_counted_missing():
+    dedup = TradeDeduplicator(window=3)
+    for trade_id in (1, 2, 5, 6):
+        dedup.accept(trade_id)
+    dedup.accept(10)
+
+    stats = dedup.stats()
+    assert stats["missing"] == 3  # 3, 4, 7
+    assert stats["pending"] == 2  # 8, 9 (누락 판정 전)
+    assert stats["gaps"] == 2
+    # 범위를 벗어난 뒤 도착한 체결은 버리고 late로 집계
+    assert not dedup.accept(3)
+    assert dedup.stats()["late"] == 1
@@ -0,0 +1,16 @@
+from app.utils.http_cache import snapshot_etag
+from app.utils.market_snapshot import MarketSnapshot
+
+
+def test_new_leader_epoch_invalidates_inherited_etags():
+    leader = MarketSnapshot()
+    leader.update(krw=100.0)
+    old_etag = snapshot_etag(leader.to_dict(), "krw")
+
+    # 팔로워가 리더의 마지막 스냅샷을 받아 리더를 승계
+    successor = MarketSnapshot.from_payload(leader.payload())
+    successor.start_epoch()
+
+    assert successor.version == leader.version
+    assert successor.to_dict()["epoch"] > leader.epoch
+    assert snapshot_etag(successor.to_dict(), "krw") != old_etag
@@ -0,0 +1,56 @@
+import sys
+import threading
+
+from app.utils.price_history import PriceHistory
+
+
+def test_same_second_keeps_last_price_and_sums_volume():
+    history = PriceHistory(60)
+    history.record(1000, 100.0, 1.0, 0.5, volume_krw=2.0, volume_usd=3.0)
+    history.record(1000, 101.0, 1.1, 0.6, volume_krw=1.0, volume_usd=1.0)
+    history.record(1001, 102.0, 1.2, 0.7)
+
+    result = history.query(end=1001, window=10, step=1)
+
+    assert result["time"] == [1000, 1001]
+    assert result["krw"] == [101.0, 102.0]
+    assert result["volume_krw"] == [3.0, 0.0]
+    assert result["volume_usd"] == [4.0, 0.0]
+
+
+def test_row_overwritten_by_later_second_is_not_returned():
+    history = PriceHistory(10)
+    history.record(1000, 100.0, 1.0, 0.5)
+    history.record(1010, 200.0, 2.0, 1.0)  # 같은 행 위치
+
+    assert history.query(end=1000, window=10, step=1)["time"] == []
+    assert history.query(end=1010, window=10, step=1)["krw"] == [200.0]
+
+
+def test_reader_never_sees_partially_written_row():
+    history = PriceHistory(4)
+    stop = threading.Event()
+
+    def writer():
+        value = 0.0
+        while not stop.is_set():
+            value += 1.0
+            # 같은 초를 계속 다시 써서 기록 중인 행을 읽을 기회를 만듦
+            history.record(1000, value, value, value)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        seen = 0
+        for _ in range(20000):
+            result = history.query(end=1000, window=4, step=1)
+            if result["time"]:
+                seen += 1
+                assert result["krw"] == result["usd"] == result["kimchi_premium"]
+    finally:
+        stop.set()
+        thread.join()
+        sys.setswitchinterval(interval)
+    assert seen > 0
@@ -0,0 +1,74 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+from ta.momentum import RSIIndicator
+
+from app.utils.rolling_indicators import RollingExtremes, WilderRSI
+
+DAY = 24 * 60 * 60 * 1000
+
+
+def closes(count: int, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    return (100.0 + np.cumsum(rng.normal(0, 1, count))).tolist()
+
+
+@pytest.mark.parametrize("length", [6, 14])
+def test_wilder_rsi_matches_ta(length):
+    series = closes(200)
+    expected = RSIIndicator(close=pd.Series(series), window=length).rsi().tolist()
+
+    rsi = WilderRSI(length)
+    for close, value in zip(series, expected):
+        rsi.update(close)
+        if math.isnan(value):
+            assert rsi.value is None
+        else:
+            assert rsi.value == pytest.approx(value, abs=1e-9)
+
+
+def test_provisional_rsi_matches_ta_without_changing_state():
+    series = closes(100)
+    rsi = WilderRSI(14)
+    rsi.seed(series[:-1])
+    state = (rsi.prev_close, rsi.avg_gain, rsi.avg_loss, rsi.count)
+
+    expected = RSIIndicator(close=pd.Series(series), window=14).rsi().iloc[-1]
+    assert rsi.provisional(series[-1]) == pytest.approx(expected, abs=1e-9)
+    assert (rsi.prev_close, rsi.avg_gain, rsi.avg_loss, rsi.count) == state
+
+
+def test_rolling_extremes_evict_candles_leaving_window():
+    # 3일 기간 (당일 진행 캔들 포함): 확정 캔들은 최근 2일만 유지
+    extremes = RollingExtremes(2 * DAY)
+    extremes.update(0, 200.0, 50.0)
+    extremes.update(DAY, 150.0, 90.0)
+    assert extremes.high() == (0, 200.0)
+    assert extremes.low() == (0, 50.0)
+
+    extremes.update(2 * DAY, 120.0, 100.0)
+    assert extremes.high() == (DAY, 150.0)
+    assert extremes.low() == (DAY, 90.0)
+
+    extremes.update(3 * DAY, 110.0, 95.0)
+    assert extremes.high() == (2 * DAY, 120.0)
+    assert extremes.low() == (3 * DAY, 95.0)
+    # 단조 덱: 더 최근의 더 높은/낮은 값에 가려진 항목은 남지 않음
+    assert len(extremes.highs) == 2
+    assert len(extremes.lows) == 1
+
+
+def test_rolling_extremes_live_candle_and_all_time_history():
+    extremes = RollingExtremes(2 * DAY)
+    extremes.seed([(0, 200.0, 50.0), (DAY, 150.0, 90.0)])
+    assert extremes.high((2 * DAY, 210.0)) == (2 * DAY, 210.0)
+    assert extremes.low((2 * DAY, 60.0)) == (0, 50.0)
+
+    all_time = RollingExtremes(None)
+    all_time.extend([(10 * DAY, 300.0, 100.0)])
+    # 과거 이력을 나중에 반영해도 제거되지 않고 바깥쪽으로만 갱신
+    all_time.extend([(0, 200.0, 50.0), (DAY, 350.0, 80.0)])
+    assert all_time.high() == (DAY, 350.0)
+    assert all_time.low() == (0, 50.0)
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from app.constants import CANDLE_SYMBOL_KRW, CANDLE_SYMBOL_USD, UPBIT_CANDLE_PAGE_SIZE
+from app.services import stream_service as stream_service_module
+from app.services.exchange_service import exchange_service
+from app.services.stream_service import PriceStreamService
+from app.utils.candle_store import CLOSE, HIGH, LOW, VOLUME
+
+
+def binance_trade(trade_id: int, ts_ms: int, price: float, qty: float = 1.0):
+    return {"e": "trade", "t": trade_id, "T": ts_ms, "p": str(price), "q": str(qty)}
+
+
+def test_late_binance_trade_does_not_move_price_back():
+    service = PriceStreamService()
+    base = 1_700_000_000_000 - 1_700_000_000_000 % 60_000
+
+    service.apply_binance_event(binance_trade(1, base + 1000, 100.0))
+    service.apply_binance_event(binance_trade(3, base + 3000, 102.0))
+    # 느린 연결에서 늦게 도착한 더 이른 체결
+    service.apply_binance_event(binance_trade(2, base + 2000, 90.0, qty=2.0))
+
+    assert service.snapshot.usd == 102.0
+    assert service.snapshot.timestamp_ms == base + 3000
+    current = service.candles.get(CANDLE_SYMBOL_USD, "1m").current
+    assert current[CLOSE] == 102.0
+    assert current[LOW] == 90.0  # 고가/저가와 거래량에는 반영
+    assert current[HIGH] == 102.0
+    assert current[VOLUME] == 4.0
+    assert service.history_volume["usd"] == 4.0
+
+
+def test_trade_with_same_time_updates_price():
+    service = PriceStreamService()
+    base = 1_700_000_000_000
+
+    service.apply_binance_event(binance_trade(1, base, 100.0))
+    service.apply_binance_event(binance_trade(2, base, 101.0))
+
+    assert service.snapshot.usd == 101.0
+
+
+def upbit_day(index: int):
+    return {
+        "timestamp": f"2024-01-{index:02d}T00:00:00",
+        "open": 100.0,
+        "high": 100.0 + index,
+        "low": 100.0 - index,
+        "close": 100.0,
+        "volume": 1.0,
+    }
+
+
+def test_all_time_extremes_retry_failed_page(monkeypatch):
+    service = PriceStreamService()
+    calls = []
+
+    async def get_upbit_candles(market, interval, limit, to=None, strict=False):
+        calls.append(to)
+        if len(calls) == 1:
+            raise RuntimeError("429 Too Many Requests")
+        return [upbit_day(index) for index in (3, 2, 1)]
+
+    monkeypatch.setattr(exchange_service, "get_upbit_candles", get_upbit_candles)
+    monkeypatch.setattr(stream_service_module, "backoff_delay", lambda *args: 0)
+
+    asyncio.run(service.backfill_all_time_extremes(CANDLE_SYMBOL_KRW))
+
+    assert len(calls) == 2
+    ath = service.extremes[CANDLE_SYMBOL_KRW]["ath"]
+    assert ath.high()[1] == 103.0
+    assert ath.low()[1] == 97.0
+
+
+def test_all_time_extremes_fail_instead_of_seeding_partial_history(monkeypatch):
+    service = PriceStreamService()
+
+    async def get_upbit_candles(market, interval, limit, to=None, strict=False):
+        if to is None:
+            # 첫 페이지는 가득 찬 페이지 (다음 페이지 조회 필요)
+            return [upbit_day(1)] * UPBIT_CANDLE_PAGE_SIZE
+        raise RuntimeError("503 Service Unavailable")
+
+    monkeypatch.setattr(exchange_service, "get_upbit_candles", get_upbit_candles)
+    monkeypatch.setattr(stream_service_module, "backoff_delay", lambda *args: 0)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(service.backfill_all_time_extremes(CANDLE_SYMBOL_KRW))
+    assert service.extremes[CANDLE_SYMBOL_KRW]["ath"].high() is None
+
+
+def test_krw_ticker_high_low_come_from_hourly_candles():
+    service = PriceStreamService()
+    hour = 60 * 60_000
+    base = 1_700_000_000_000 - 1_700_000_000_000 % hour
+    service.candles.get(CANDLE_SYMBOL_KRW, "1h").load(
+        [
+            (base - 30 * hour, 100.0, 200.0, 50.0, 100.0, 1.0),  # 24시간 이전
+            (base - hour, 100.0, 120.0, 90.0, 110.0, 1.0),
+            (base, 110.0, 115.0, 105.0, 112.0, 1.0),
+        ]
+    )
+
+    fields = service.upbit_fields
+    service.apply_upbit_event(
+        {
+            fields["type"]: "ticker",
+            fields["signed_change_rate"]: 0.01,
+            fields["acc_trade_volume_24h"]: 1234.5,
+        }
+    )
+
+    assert service.snapshot.ticker_24h["krw"] == {
+        "high": 120.0,
+        "low": 90.0,
+        "volume": 1234.5,
+    }
@@ -0,0 +1,41 @@
+from datetime import date
+
+from app.utils.trade_tape import TradeTape, iter_tape, read_segment, segment_path
+
+DAY_MS = 24 * 60 * 60 * 1000
+MIDNIGHT = 1_700_006_400_000  # 2023-11-15 00:00:00 UTC
+
+
+def test_late_trade_before_midnight_goes_to_its_own_day(tmp_path):
+    tape = TradeTape(str(tmp_path), segment_records=4)
+    tape.record("upbit", MIDNIGHT - 1000, 100.0, 1.0, 1)
+    tape.record("upbit", MIDNIGHT + 1000, 101.0, 1.0, 2)
+    tape.record("upbit", MIDNIGHT - 500, 100.5, 1.0, 3)  # 자정 이후 도착한 전날 체결
+    tape.close()
+
+    before = read_segment(segment_path(str(tmp_path), "upbit", date(2023, 11, 14)))
+    after = read_segment(segment_path(str(tmp_path), "upbit", date(2023, 11, 15)))
+    assert before["trade_id"].tolist() == [1, 3]
+    assert after["trade_id"].tolist() == [2]
+
+
+def test_only_two_days_stay_open_and_older_trades_reopen_their_file(tmp_path):
+    tape = TradeTape(str(tmp_path), segment_records=4)
+    tape.record("binance", MIDNIGHT - 1000, 100.0, 1.0, 1)
+    tape.record("binance", MIDNIGHT + 1000, 101.0, 1.0, 2)
+    tape.record("binance", MIDNIGHT + DAY_MS + 1000, 102.0, 1.0, 3)
+    assert sorted(tape.segments["binance"]) == [
+        MIDNIGHT // DAY_MS,
+        MIDNIGHT // DAY_MS + 1,
+    ]
+
+    tape.record("binance", MIDNIGHT - 2000, 99.0, 1.0, 4)
+    assert tape.stats()["binance"] == 1
+    tape.close()
+
+    segments = list(iter_tape(str(tmp_path), "binance"))
+    assert [records["trade_id"].tolist() for records in segments] == [
+        [1, 4],
+        [2],
+        [3],
+    ]